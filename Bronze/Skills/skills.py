@@ -7,6 +7,7 @@ Workflow: /Inbox → /Needs_Action → /Done
 """
 
 import os
+import sys
 import shutil
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +19,19 @@ NEEDS_ACTION = VAULT_ROOT / "Needs_Action"
 DONE         = VAULT_ROOT / "Done"
 DASHBOARD    = VAULT_ROOT / "Dashboard.md"
 
+# keyword_matcher — one copy for every tier, in Platinum/Shared
+sys.path.append(str(Path(__file__).resolve().parents[2] / "Platinum" / "Shared"))
+from keyword_matcher import KeywordMatcher
+
+# --- Classification keywords (first matching category wins) ---
+TASK_TYPES = KeywordMatcher({
+    "bug_fix":  ["bug", "error", "crash", "urgent", "critical"],
+    "setup":    ["setup", "install", "configure", "deploy"],
+    "report":   ["report", "summary", "review", "audit"],
+    "research": ["research", "explore", "investigate"],
+})
+HIGH_PRIORITY = KeywordMatcher({"High": ["urgent", "critical", "asap", "immediately"]})
+
 
 # ---------------------------------------------------------------------------
 # Helper
@@ -37,22 +51,12 @@ def _write(path: Path, content: str) -> None:
 
 def _classify(content: str) -> str:
     """Simple keyword-based task classifier."""
-    content_lower = content.lower()
-    if any(kw in content_lower for kw in ["bug", "error", "crash", "urgent", "critical"]):
-        return "bug_fix"
-    if any(kw in content_lower for kw in ["setup", "install", "configure", "deploy"]):
-        return "setup"
-    if any(kw in content_lower for kw in ["report", "summary", "review", "audit"]):
-        return "report"
-    if any(kw in content_lower for kw in ["research", "explore", "investigate"]):
-        return "research"
-    return "general"
+    return TASK_TYPES.first(content, "general")
 
 
 def _priority(content: str, task_type: str) -> str:
     """Assign priority based on content signals and task type."""
-    content_lower = content.lower()
-    if any(kw in content_lower for kw in ["urgent", "critical", "asap", "immediately"]):
+    if HIGH_PRIORITY.first(content):
         return "High"
     if task_type in ("bug_fix", "setup"):
         return "Medium"
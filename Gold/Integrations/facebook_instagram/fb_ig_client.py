@@ -13,18 +13,20 @@ Setup:
   5. Fill in Gold/Integrations/facebook_instagram/fb_ig_config.json
 """
 
-import json
 import os
-import requests
+import sys
 from datetime import datetime
 
+# Shared pooled HTTP layer (Gold/Integrations/http_pool.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_pool import get, post, load_json_config
+
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "fb_ig_config.json")
 AUDIT_DIR   = os.path.join(os.path.dirname(__file__), "..", "..", "Audit_Logs")
 
 
 def load_config() -> dict:
-    with open(CONFIG_PATH) as f:
-        return json.load(f)
+    return load_json_config(CONFIG_PATH)
 
 
 def audit(action: str, result: str, duration_ms: int = 0) -> None:
@@ -45,7 +47,7 @@ def post_to_facebook(message: str) -> dict:
     cfg   = load_config()
     start = datetime.now()
     url   = f"https://graph.facebook.com/{cfg['api_version']}/{cfg['page_id']}/feed"
-    resp  = requests.post(url, data={
+    resp  = post(url, data={
         "message": message,
         "access_token": cfg["page_access_token"]
     })
@@ -65,7 +67,7 @@ def get_facebook_summary(days: int = 7) -> dict:
         f"?metric=page_impressions,page_engaged_users,page_fans"
         f"&period=day&access_token={cfg['page_access_token']}"
     )
-    resp = requests.get(url)
+    resp = get(url)
     resp.raise_for_status()
     ms = int((datetime.now() - start).total_seconds() * 1000)
     audit("get_facebook_summary", "success", ms)
@@ -83,7 +85,7 @@ def post_to_instagram(image_url: str, caption: str) -> dict:
     ver   = cfg["api_version"]
 
     # Step 1: Create media container
-    media_resp = requests.post(
+    media_resp = post(
         f"https://graph.facebook.com/{ver}/{ig_id}/media",
         data={"image_url": image_url, "caption": caption, "access_token": token}
     )
@@ -91,7 +93,7 @@ def post_to_instagram(image_url: str, caption: str) -> dict:
     container_id = media_resp.json()["id"]
 
     # Step 2: Publish container
-    pub_resp = requests.post(
+    pub_resp = post(
         f"https://graph.facebook.com/{ver}/{ig_id}/media_publish",
         data={"creation_id": container_id, "access_token": token}
     )
@@ -113,7 +115,7 @@ def get_instagram_summary() -> dict:
         f"https://graph.facebook.com/{ver}/{ig_id}/insights"
         f"?metric=impressions,reach,profile_views&period=day&access_token={token}"
     )
-    resp = requests.get(url)
+    resp = get(url)
     resp.raise_for_status()
     ms = int((datetime.now() - start).total_seconds() * 1000)
     audit("get_instagram_summary", "success", ms)
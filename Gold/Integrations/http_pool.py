@@ -0,0 +1,132 @@
+"""
+http_pool.py — Shared HTTP Layer for Gold Integrations
+-------------------------------------------------------
+One place for the plumbing every integration client needs:
+
+  - request() / get() / post() : pooled requests.Session per host
+                                 (TCP/TLS keep-alive) + default timeout
+  - load_json_config()         : JSON config cached in memory, re-read
+                                 only when the file's mtime changes
+  - ttl_cache()                : memoize identity lookups (user URN,
+                                 twitter user id) for a fixed time
+
+Usage (from an integration subfolder):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from http_pool import get, post, load_json_config, ttl_cache
+
+pip install: requests
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+DEFAULT_TIMEOUT = (5, 30)   # (connect, read) seconds — never hang forever
+POOL_SIZE       = 10        # keep-alive connections per host
+
+_sessions: dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+_configs: dict[str, tuple[float, dict]] = {}
+_configs_lock = threading.Lock()
+
+
+# ── Sessions ──────────────────────────────────────────────────────────────────
+
+def get_session(url: str) -> requests.Session:
+    """Return the shared Session for url's host (created on first use)."""
+    host = urlsplit(url).netloc
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[host] = session
+        return session
+
+
+def request(method: str, url: str, **kwargs) -> requests.Response:
+    """requests.request() on a pooled per-host Session with a default timeout."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session(url).request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def close_all() -> None:
+    """Close every pooled connection (tests / shutdown)."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+# ── Config cache ──────────────────────────────────────────────────────────────
+
+def load_json_config(path: str) -> dict:
+    """
+    Load a JSON config file, re-reading it only when its mtime changes.
+    The returned dict is shared — treat it as read-only.
+    """
+    path  = os.path.abspath(path)
+    mtime = os.path.getmtime(path)
+    with _configs_lock:
+        cached = _configs.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    with open(path) as f:
+        cfg = json.load(f)
+
+    with _configs_lock:
+        _configs[path] = (mtime, cfg)
+    return cfg
+
+
+# ── TTL memoize ───────────────────────────────────────────────────────────────
+
+def ttl_cache(seconds: float):
+    """
+    Memoize a function's result per argument tuple for `seconds`.
+    Decorated function gets .cache_clear() (e.g. after a token change).
+    """
+    def decorator(func):
+        store: dict = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                hit = store.get(key)
+                if hit and hit[0] > now:
+                    return hit[1]
+            value = func(*args, **kwargs)
+            with lock:
+                store[key] = (now + seconds, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                store.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
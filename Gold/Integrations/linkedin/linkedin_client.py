@@ -17,21 +17,25 @@ LinkedIn API Documentation:
 - https://learn.microsoft.com/en-us/linkedin/consumer/integrations/self-serve/share-on-linkedin
 """
 
-import json
 import os
+import sys
 import requests
 from datetime import datetime, timedelta
 
+# Shared pooled HTTP layer (Gold/Integrations/http_pool.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_pool import get, post, load_json_config, ttl_cache
+
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "linkedin_config.json")
 AUDIT_DIR   = os.path.join(os.path.dirname(__file__), "..", "..", "Audit_Logs")
 
 LINKEDIN_API = "https://api.linkedin.com/v2"
+IDENTITY_TTL = 3600   # seconds to reuse the author URN between posts
 
 
 def load_config() -> dict:
-    """Load LinkedIn configuration from linkedin_config.json."""
-    with open(CONFIG_PATH) as f:
-        return json.load(f)
+    """Load LinkedIn configuration (cached; re-read when the file changes)."""
+    return load_json_config(CONFIG_PATH)
 
 
 def audit(action: str, result: str, duration_ms: int = 0) -> None:
@@ -61,7 +65,7 @@ def _get_headers() -> dict:
 def get_user_profile() -> dict:
     """Get authenticated user's profile information."""
     start = datetime.now()
-    resp = requests.get(
+    resp = get(
         f"{LINKEDIN_API}/userinfo",
         headers=_get_headers()
     )
@@ -73,6 +77,12 @@ def get_user_profile() -> dict:
     return profile
 
 
+@ttl_cache(IDENTITY_TTL)
+def get_author_urn() -> str:
+    """Author URN for posts — memoized so a posting burst skips /userinfo."""
+    return f"urn:li:person:{get_user_profile()['sub']}"
+
+
 # ── Post ──────────────────────────────────────────────────────────────────────
 
 def post_update(text: str, visibility: str = "PUBLIC") -> dict:
@@ -89,12 +99,10 @@ def post_update(text: str, visibility: str = "PUBLIC") -> dict:
     if len(text) > 3000:
         raise ValueError(f"Post too long: {len(text)} chars (max 3000)")
 
-    cfg = load_config()
     start = datetime.now()
 
-    # Get user URN
-    profile = get_user_profile()
-    author = f"urn:li:person:{profile['sub']}"
+    # Get user URN (cached)
+    author = get_author_urn()
 
     payload = {
         "author": author,
@@ -112,7 +120,7 @@ def post_update(text: str, visibility: str = "PUBLIC") -> dict:
         }
     }
 
-    resp = requests.post(
+    resp = post(
         f"{LINKEDIN_API}/ugcPosts",
         headers=_get_headers(),
         json=payload
@@ -139,12 +147,10 @@ def post_article_share(article_url: str, comment: str = "") -> dict:
     if len(comment) > 1300:
         raise ValueError(f"Comment too long: {len(comment)} chars (max 1300)")
 
-    cfg = load_config()
     start = datetime.now()
 
-    # Get user URN
-    profile = get_user_profile()
-    author = f"urn:li:person:{profile['sub']}"
+    # Get user URN (cached)
+    author = get_author_urn()
 
     payload = {
         "author": author,
@@ -168,7 +174,7 @@ def post_article_share(article_url: str, comment: str = "") -> dict:
         }
     }
 
-    resp = requests.post(
+    resp = post(
         f"{LINKEDIN_API}/ugcPosts",
         headers=_get_headers(),
         json=payload
@@ -196,7 +202,7 @@ def get_post_statistics(post_urn: str) -> dict:
     start = datetime.now()
 
     # LinkedIn API requires the share URN to fetch stats
-    resp = requests.get(
+    resp = get(
         f"{LINKEDIN_API}/socialActions/{post_urn}",
         headers=_get_headers()
     )
@@ -223,19 +229,18 @@ def get_engagement_summary(days: int = 7) -> dict:
     """
     start = datetime.now()
 
-    # Get user profile
-    profile = get_user_profile()
-    author_id = profile['sub']
+    # Get user URN (cached)
+    author = get_author_urn()
 
     # Fetch recent posts (LinkedIn limits this to certain access levels)
     # Note: This may require additional API permissions
     try:
-        resp = requests.get(
+        resp = get(
             f"{LINKEDIN_API}/ugcPosts",
             headers=_get_headers(),
             params={
                 "q": "authors",
-                "authors": f"List(urn:li:person:{author_id})",
+                "authors": f"List({author})",
                 "count": 50
             }
         )
@@ -31,6 +31,9 @@ from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(__file__))
+sys.path.append(str(Path(__file__).resolve().parents[3] / "Platinum" / "Shared"))  # task_file (one copy)
+
+from task_file import TaskFile, load, parse
 
 try:
     from linkedin_client import post_update, post_article_share, validate_access_token, audit
@@ -51,32 +54,16 @@ POLL_SECONDS = 10  # How often to check for approved LinkedIn posts
 
 # ── Metadata Parsing ─────────────────────────────────────────────────────────
 
-def parse_metadata(content: str) -> dict:
-    """Extract metadata from task file."""
-    metadata = {}
-
-    # Parse HTML comment metadata
-    metadata_match = re.search(r'<!-- AGENT METADATA\s+(.*?)\s+-->', content, re.DOTALL)
-    if metadata_match:
-        metadata_text = metadata_match.group(1)
-        for line in metadata_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
+def parse_metadata(content: "str | TaskFile") -> dict:
+    """Extract metadata from task file (AGENT METADATA comment + YAML frontmatter)."""
+    return parse(content).metadata
 
-    # Parse YAML frontmatter if present
-    yaml_match = re.search(r'^---\s+(.*?)\s+---', content, re.DOTALL | re.MULTILINE)
-    if yaml_match:
-        yaml_text = yaml_match.group(1)
-        for line in yaml_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
 
-    return metadata
+_WORD = re.compile(r'\w+')
+_URL  = re.compile(r'https?://\S+')
 
 
-def parse_linkedin_request(content: str) -> dict:
+def parse_linkedin_request(content: "str | TaskFile") -> dict:
     """
     Extract LinkedIn posting details from task content.
 
@@ -86,20 +73,17 @@ def parse_linkedin_request(content: str) -> dict:
     - article_url: https://example.com/article (for article shares)
     - visibility: PUBLIC | CONNECTIONS
     """
+    task = parse(content)
     linkedin_data = {}
 
     # Look for LinkedIn-specific fields in the content
-    patterns = {
-        'post_type': r'post_type\s*:\s*(\w+)',
-        'post_content': r'post_content\s*:\s*["\']?(.*?)["\']?(?:\n|$)',
-        'article_url': r'article_url\s*:\s*(https?://\S+)',
-        'visibility': r'visibility\s*:\s*(\w+)',
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, content, re.IGNORECASE)
+    for key, pattern in (('post_type', _WORD), ('article_url', _URL), ('visibility', _WORD)):
+        match = pattern.match(task.value(key))
         if match:
-            linkedin_data[key] = match.group(1).strip()
+            linkedin_data[key] = match.group(0)
+
+    if 'post_content' in task.values:
+        linkedin_data['post_content'] = re.sub(r'^["\']|["\']$', '', task.value('post_content')).strip()
 
     # Default values
     linkedin_data.setdefault('post_type', 'text')
@@ -118,17 +102,14 @@ def is_linkedin_post_task(content: str) -> bool:
     ])
 
 
-def is_approved(metadata: dict, content: str) -> bool:
+def is_approved(metadata: dict, content: "str | TaskFile") -> bool:
     """Check if task has been approved by human."""
     # Check metadata approval field
     if metadata.get('approval') == 'approved' or metadata.get('approved') == 'true':
         return True
 
     # Check for approved:true in content
-    if re.search(r'approved\s*:\s*true', content, re.IGNORECASE):
-        return True
-
-    return False
+    return parse(content).value('approved').lower().startswith('true')
 
 
 # ── Post Execution ───────────────────────────────────────────────────────────
@@ -218,9 +199,10 @@ def process_task(task_file: Path) -> None:
     print(f"\n[{datetime.now():%H:%M:%S}] Processing: {task_file.name}")
 
     try:
-        # Read task file
-        with open(task_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Read task file (parsed once per version — unapproved tasks are
+        # re-checked every poll)
+        task = load(task_file)
+        content = task.text
 
         # Check if it's a LinkedIn post
         if not is_linkedin_post_task(content):
@@ -228,17 +210,17 @@ def process_task(task_file: Path) -> None:
             return
 
         # Parse metadata
-        metadata = parse_metadata(content)
+        metadata = parse_metadata(task)
 
         # Check approval
-        if not is_approved(metadata, content):
+        if not is_approved(metadata, task):
             print(f"  → Awaiting approval (approval:required in metadata)")
             return
 
         print(f"  [APPROVED] Task approved by human")
 
         # Parse LinkedIn request
-        linkedin_data = parse_linkedin_request(content)
+        linkedin_data = parse_linkedin_request(task)
         print(f"  → Post type: {linkedin_data.get('post_type')}")
         print(f"  → Visibility: {linkedin_data.get('visibility')}")
 
@@ -13,21 +13,24 @@ Setup:
   5. Fill in Gold/Integrations/twitter/twitter_config.json
 """
 
-import json
 import os
-import requests
+import sys
 from requests_oauthlib import OAuth1
 from datetime import datetime, timedelta
 
+# Shared pooled HTTP layer (Gold/Integrations/http_pool.py)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_pool import get, post, load_json_config, ttl_cache
+
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "twitter_config.json")
 AUDIT_DIR   = os.path.join(os.path.dirname(__file__), "..", "..", "Audit_Logs")
 
 TWITTER_API  = "https://api.twitter.com/2"
+IDENTITY_TTL = 3600   # seconds to reuse the authenticated user id
 
 
 def load_config() -> dict:
-    with open(CONFIG_PATH) as f:
-        return json.load(f)
+    return load_json_config(CONFIG_PATH)
 
 
 def audit(action: str, result: str, duration_ms: int = 0) -> None:
@@ -61,7 +64,7 @@ def post_tweet(text: str) -> dict:
     if len(text) > 280:
         raise ValueError(f"Tweet too long: {len(text)} chars (max 280)")
     start = datetime.now()
-    resp  = requests.post(
+    resp  = post(
         f"{TWITTER_API}/tweets",
         auth=_get_auth(),
         json={"text": text}
@@ -76,9 +79,10 @@ def post_tweet(text: str) -> dict:
 
 # ── Summary ───────────────────────────────────────────────────────────────────
 
+@ttl_cache(IDENTITY_TTL)
 def get_user_id() -> str:
-    """Get authenticated user's ID."""
-    resp = requests.get(f"{TWITTER_API}/users/me", headers=_bearer_headers())
+    """Get authenticated user's ID (memoized)."""
+    resp = get(f"{TWITTER_API}/users/me", headers=_bearer_headers())
     resp.raise_for_status()
     return resp.json()["data"]["id"]
 
@@ -89,7 +93,7 @@ def get_tweet_summary(days: int = 7) -> dict:
     user_id = get_user_id()
     since   = (datetime.utcnow() - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    resp = requests.get(
+    resp = get(
         f"{TWITTER_API}/users/{user_id}/tweets",
         headers=_bearer_headers(),
         params={
@@ -6,7 +6,9 @@ Exposes accounting and business operations as MCP tools.
 
 Supported Actions:
   - get_partner       : Fetch customer/vendor by name or ID
+  - get_partners      : Resolve many partner names in one call (cached)
   - create_invoice    : Create a customer invoice
+  - create_invoices   : Create many draft invoices in one call
   - get_invoices      : List invoices with filters
   - journal_entry     : Create a manual journal entry
   - balance_report    : Get account balance summary
@@ -17,10 +19,25 @@ Setup:
   2. Enable API Key: Settings > Technical > API Keys > New
   3. Fill in Gold/MCP_Servers/odoo/odoo_config.json
 
+Connection reuse:
+  All actions share one process-wide OdooClient (get_client()). It keeps
+  its uid and ServerProxy objects (HTTP/1.1 keep-alive), and only calls
+  common.authenticate again when a call fails with an access error.
+
+Batching + cache:
+  create_invoices() sends every invoice in one account.move create, and
+  get_partners()/get_products() resolve many names with one "in" domain.
+  res.partner and product.product lookups go through a read-through
+  cache: entries younger than CACHE_TTL are served from memory, older
+  ones are revalidated with one light search_read and only records whose
+  write_date moved are re-read.
+
 pip install: no extra packages needed (uses stdlib xmlrpc)
 """
 
 import json
+import threading
+import time
 import xmlrpc.client
 import os
 from datetime import datetime
@@ -28,6 +45,7 @@ from datetime import datetime
 # ── Config ────────────────────────────────────────────────────────────────────
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "odoo_config.json")
 AUDIT_DIR   = os.path.join(os.path.dirname(__file__), "..", "..", "Audit_Logs")
+CACHE_TTL   = int(os.environ.get("ODOO_CACHE_TTL", "300"))   # seconds before revalidating
 
 
 def load_config() -> dict:
@@ -48,6 +66,15 @@ def audit(action: str, result: str, duration_ms: int = 0) -> None:
 
 
 # ── Odoo Connection ───────────────────────────────────────────────────────────
+AUTH_FAULT_MARKERS = ("AccessDenied", "Access Denied", "Session expired", "session_expired")
+
+
+def _is_auth_fault(exc: Exception) -> bool:
+    return isinstance(exc, xmlrpc.client.Fault) and any(
+        m in str(exc.faultString) for m in AUTH_FAULT_MARKERS
+    )
+
+
 class OdooClient:
     def __init__(self):
         cfg = load_config()
@@ -56,38 +83,171 @@ class OdooClient:
         self.user    = cfg["username"]
         self.api_key = cfg["api_key"]
         self.uid     = None
+        # ServerProxy keeps its HTTP connection open between calls; not thread-safe
+        self._lock   = threading.RLock()
+        self.common  = xmlrpc.client.ServerProxy(f"{self.host}/xmlrpc/2/common", allow_none=True)
+        self.models  = xmlrpc.client.ServerProxy(f"{self.host}/xmlrpc/2/object", allow_none=True)
         self._connect()
 
     def _connect(self):
-        common = xmlrpc.client.ServerProxy(f"{self.host}/xmlrpc/2/common")
-        self.uid = common.authenticate(self.db, self.user, self.api_key, {})
+        self.uid = self.common.authenticate(self.db, self.user, self.api_key, {})
         if not self.uid:
             raise ConnectionError("Odoo authentication failed — check odoo_config.json")
-        self.models = xmlrpc.client.ServerProxy(f"{self.host}/xmlrpc/2/object")
 
     def execute(self, model: str, method: str, args: list, kwargs: dict = None):
-        return self.models.execute_kw(
-            self.db, self.uid, self.api_key,
-            model, method, args, kwargs or {}
-        )
+        with self._lock:
+            try:
+                return self.models.execute_kw(
+                    self.db, self.uid, self.api_key,
+                    model, method, args, kwargs or {}
+                )
+            except xmlrpc.client.Fault as exc:
+                if not _is_auth_fault(exc):
+                    raise
+                # Key rotated / session dropped — authenticate once and retry
+                self._connect()
+                audit("reauthenticate", f"uid={self.uid}")
+                return self.models.execute_kw(
+                    self.db, self.uid, self.api_key,
+                    model, method, args, kwargs or {}
+                )
+
+
+_client: OdooClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> OdooClient:
+    """Process-wide OdooClient — config read and authenticate happen once."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OdooClient()
+        return _client
+
+
+def reset_client() -> None:
+    """Drop the shared client (e.g. after editing odoo_config.json)."""
+    global _client
+    with _client_lock:
+        _client = None
+
+
+# ── Read-through Cache ────────────────────────────────────────────────────────
+class RecordCache:
+    """
+    TTL read-through cache for one Odoo model, keyed by (field, value).
+
+    Stale keys are revalidated in a single search_read that fetches only
+    id + write_date; records whose write_date changed (or are new) are
+    re-read in one `read` call, the rest are kept as-is.
+    """
+
+    def __init__(self, model: str, fields: list[str], ttl: int = CACHE_TTL):
+        self.model   = model
+        self.fields  = list(dict.fromkeys(["id", "write_date", *fields]))
+        self.ttl     = ttl
+        self._records: dict[int, dict] = {}                          # id -> record
+        self._keys: dict[tuple, tuple[list[int], float]] = {}        # (field, value) -> (ids, checked_at)
+        self._lock   = threading.Lock()
+
+    def lookup(self, client: OdooClient, field: str, values: list) -> dict:
+        """Return {value: [records]} for exact matches of field in values."""
+        values = list(dict.fromkeys(values))
+        now    = time.monotonic()
+        with self._lock:
+            due = [v for v in values
+                   if (hit := self._keys.get((field, v))) is None or now - hit[1] >= self.ttl]
+
+        if due:
+            self._refresh(client, field, due, now)
+
+        with self._lock:
+            return {
+                v: [self._records[i] for i in self._keys.get((field, v), ([], 0))[0]
+                    if i in self._records]
+                for v in values
+            }
+
+    def _refresh(self, client: OdooClient, field: str, values: list, now: float) -> None:
+        light = client.execute(self.model, "search_read", [[[field, "in", values]]],
+                               {"fields": ["id", field, "write_date"]})
+        with self._lock:
+            changed = [r["id"] for r in light
+                       if self._records.get(r["id"], {}).get("write_date") != r["write_date"]]
+
+        fresh = client.execute(self.model, "read", [changed], {"fields": self.fields}) if changed else []
+
+        with self._lock:
+            for rec in fresh:
+                self._records[rec["id"]] = rec
+            matches: dict = {v: [] for v in values}
+            for r in light:
+                key = r[field][0] if isinstance(r[field], list) else r[field]
+                matches.setdefault(key, []).append(r["id"])
+            for v in values:
+                self._keys[(field, v)] = (matches.get(v, []), now)
+
+    def store(self, records: list[dict]) -> None:
+        """Seed the cache with records fetched elsewhere (must include write_date)."""
+        with self._lock:
+            for rec in records:
+                if "write_date" in rec:
+                    self._records[rec["id"]] = rec
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._keys.clear()
+
+
+partner_cache = RecordCache("res.partner", ["name", "email", "phone"])
+product_cache = RecordCache("product.product", ["name", "default_code", "list_price"])
 
 
 # ── Actions ───────────────────────────────────────────────────────────────────
 
 def get_partner(name: str = None, partner_id: int = None) -> dict:
     start = datetime.now()
-    client = OdooClient()
-    domain = [["name", "ilike", name]] if name else [["id", "=", partner_id]]
-    result = client.execute("res.partner", "search_read", [domain],
-                            {"fields": ["id", "name", "email", "phone"], "limit": 10})
+    client = get_client()
+    if name:
+        result = client.execute("res.partner", "search_read", [[["name", "ilike", name]]],
+                                {"fields": partner_cache.fields, "limit": 10})
+        partner_cache.store(result)
+    else:
+        result = partner_cache.lookup(client, "id", [partner_id])[partner_id]
     ms = int((datetime.now() - start).total_seconds() * 1000)
     audit("get_partner", f"found {len(result)} records", ms)
     return result
 
 
+def get_partners(names: list[str]) -> dict:
+    """Resolve exact partner names in one call. Returns {name: [records]}."""
+    start = datetime.now()
+    result = partner_cache.lookup(get_client(), "name", names)
+    ms = int((datetime.now() - start).total_seconds() * 1000)
+    audit("get_partners", f"resolved {sum(1 for r in result.values() if r)}/{len(result)} names", ms)
+    return result
+
+
+def get_products(names: list[str] = None, limit: int = 50) -> list:
+    """List products, or look up exact product names (cached)."""
+    start = datetime.now()
+    client = get_client()
+    if names:
+        result = [rec for recs in product_cache.lookup(client, "name", names).values() for rec in recs]
+    else:
+        result = client.execute("product.product", "search_read", [[["sale_ok", "=", True]]],
+                                {"fields": product_cache.fields, "limit": limit})
+        product_cache.store(result)
+    ms = int((datetime.now() - start).total_seconds() * 1000)
+    audit("get_products", f"fetched {len(result)} products", ms)
+    return result
+
+
 def get_invoices(state: str = "posted", limit: int = 20) -> list:
     start = datetime.now()
-    client = OdooClient()
+    client = get_client()
     domain = [["move_type", "=", "out_invoice"], ["state", "=", state]]
     result = client.execute("account.move", "search_read", [domain], {
         "fields": ["name", "partner_id", "amount_total", "invoice_date", "state"],
@@ -99,12 +259,8 @@ def get_invoices(state: str = "posted", limit: int = 20) -> list:
     return result
 
 
-def create_invoice(partner_id: int, amount: float, description: str,
-                   currency: str = "PKR") -> dict:
-    """Create a draft customer invoice. Requires human approval before posting."""
-    start = datetime.now()
-    client = OdooClient()
-    vals = {
+def _invoice_vals(partner_id: int, amount: float, description: str) -> dict:
+    return {
         "move_type": "out_invoice",
         "partner_id": partner_id,
         "invoice_line_ids": [(0, 0, {
@@ -113,16 +269,58 @@ def create_invoice(partner_id: int, amount: float, description: str,
             "price_unit": amount,
         })],
     }
-    invoice_id = client.execute("account.move", "create", [[vals]])
+
+
+def create_invoice(partner_id: int, amount: float, description: str,
+                   currency: str = "PKR") -> dict:
+    """Create a draft customer invoice. Requires human approval before posting."""
+    start = datetime.now()
+    client = get_client()
+    invoice_id = client.execute("account.move", "create", [[_invoice_vals(partner_id, amount, description)]])
     ms = int((datetime.now() - start).total_seconds() * 1000)
     audit("create_invoice", f"created draft invoice id={invoice_id}", ms)
     return {"invoice_id": invoice_id, "status": "draft", "note": "Requires approval to post"}
 
 
+def create_invoices(invoices: list[dict]) -> dict:
+    """
+    Create many draft invoices with a single account.move create.
+
+    Each item: {"partner_id": int | "partner_name": str, "amount": float,
+    "description": str}. Partner names are resolved in one batched lookup;
+    items whose name matches no partner (or several) are returned in
+    "skipped" instead of failing the whole batch.
+    """
+    start = datetime.now()
+    client = get_client()
+
+    names = [inv["partner_name"] for inv in invoices if not inv.get("partner_id")]
+    partners = partner_cache.lookup(client, "name", names) if names else {}
+
+    vals_list, skipped = [], []
+    for inv in invoices:
+        partner_id = inv.get("partner_id")
+        if not partner_id:
+            matches = partners.get(inv["partner_name"], [])
+            if len(matches) != 1:
+                skipped.append({**inv, "reason": f"{len(matches)} partners match name"})
+                continue
+            partner_id = matches[0]["id"]
+        vals_list.append(_invoice_vals(partner_id, inv["amount"], inv["description"]))
+
+    invoice_ids = client.execute("account.move", "create", [vals_list]) if vals_list else []
+    if isinstance(invoice_ids, int):
+        invoice_ids = [invoice_ids]
+    ms = int((datetime.now() - start).total_seconds() * 1000)
+    audit("create_invoices", f"created {len(invoice_ids)} draft invoices, skipped {len(skipped)}", ms)
+    return {"invoice_ids": invoice_ids, "status": "draft", "skipped": skipped,
+            "note": "Requires approval to post"}
+
+
 def balance_report() -> dict:
     """Get a summary of account balances."""
     start = datetime.now()
-    client = OdooClient()
+    client = get_client()
     accounts = client.execute("account.account", "search_read",
                               [[["account_type", "in", ["asset_cash", "liability_payable",
                                                          "income", "expense"]]]],
@@ -26,24 +26,22 @@ APPROVAL_DIR     = os.path.join(GOLD_DIR, "Awaiting_Approval")
 RALPH_LOOP_PATH  = os.path.join(GOLD_DIR, "ralph_loop.py")
 
 sys.path.insert(0, GOLD_DIR)
+sys.path.append(os.path.join(os.path.dirname(GOLD_DIR), "Platinum", "Shared"))   # keyword_matcher (one copy)
 from audit_logger import AuditLogger
+from keyword_matcher import KeywordMatcher
 
 POLL_SECONDS = 5
 SKILL        = "FileWatcher_Gold"
 
 HIGH_RISK_KEYWORDS   = ["delete", "deploy", "production", "billing", "payment", "cloud"]
 MEDIUM_RISK_KEYWORDS = ["update", "modify", "push", "send", "email"]
+RISK_MATCHER         = KeywordMatcher({"high": HIGH_RISK_KEYWORDS, "medium": MEDIUM_RISK_KEYWORDS})
 
 
 # ── Classification ────────────────────────────────────────────────────────────
 
 def classify_risk(content: str) -> str:
-    lower = content.lower()
-    if any(kw in lower for kw in HIGH_RISK_KEYWORDS):
-        return "high"
-    if any(kw in lower for kw in MEDIUM_RISK_KEYWORDS):
-        return "medium"
-    return "low"
+    return RISK_MATCHER.first(content, "low")
 
 
 def needs_approval(content: str, risk: str) -> bool:
@@ -4,6 +4,16 @@ audit_logger.py — Gold Tier Core Engine
 Har action ko append-only audit log mein likhta hai.
 Format: [timestamp] | [skill] | [action] | [result] | [duration_ms] | [task_id]
 
+Lines are buffered: a background writer thread keeps the day's file open
+and writes in batches (AUDIT_FLUSH_LINES lines or AUDIT_FLUSH_SECONDS,
+whichever first), rolls over at midnight and flushes at exit.
+AUDIT_BUFFERED=0 goes back to one open/append/close per line.
+
+today_summary() is incremental (sidecar counters + byte offset) and
+query() searches every day's log through a SQLite index — see audit_index.
+The writer and index are Platinum/Shared/log_writer.py and audit_index.py
+(one copy for both tiers).
+
 Usage:
     from audit_logger import AuditLogger
     log = AuditLogger()
@@ -11,8 +21,17 @@ Usage:
 """
 
 import os
+import sys
 from datetime import datetime
 
+# One copy of the log writer / index, shared with Platinum (appended, so
+# Gold's own modules still win on name clashes such as audit_logger)
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "Platinum", "Shared"))
+
+from audit_index import LogSummary
+from log_writer import BUFFERED, get_index, get_writer, log_path
+
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -24,13 +43,13 @@ AUDIT_LOG_DIR = os.path.join(BASE_DIR, "Audit_Logs")
 
 class AuditLogger:
 
-    def __init__(self):
+    def __init__(self, buffered: bool = BUFFERED):
+        self.buffered = buffered
         os.makedirs(AUDIT_LOG_DIR, exist_ok=True)
 
     def _log_file(self) -> str:
         """Return today's log file path."""
-        date_str = datetime.now().strftime("%Y-%m-%d")
-        return os.path.join(AUDIT_LOG_DIR, f"{date_str}_audit.log")
+        return log_path(AUDIT_LOG_DIR, datetime.now().strftime("%Y-%m-%d"))
 
     def log(
         self,
@@ -42,16 +61,25 @@ class AuditLogger:
         detail:      str  = ""
     ) -> None:
         """Append one line to today's audit log."""
-        ts      = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now     = datetime.now()
+        ts      = now.strftime("%Y-%m-%d %H:%M:%S")
         detail_part = f" | {detail}" if detail else ""
         line    = (
             f"[{ts}] | {skill:<22} | {action:<28} | {result:<10} "
             f"| {duration_ms:>6}ms | {task_id}{detail_part}\n"
         )
-        with open(self._log_file(), "a", encoding="utf-8") as f:
-            f.write(line)
+        if self.buffered:
+            get_writer(AUDIT_LOG_DIR).write(now.strftime("%Y-%m-%d"), line)
+        else:
+            with open(self._log_file(), "a", encoding="utf-8") as f:
+                f.write(line)
         print(f"[AUDIT] {line.strip()}")
 
+    def flush(self) -> None:
+        """Block until lines logged so far are on disk."""
+        if self.buffered:
+            get_writer(AUDIT_LOG_DIR).flush()
+
     def log_start(self, skill: str, action: str, task_id: str = "-") -> datetime:
         """Log action start and return start time for duration calc."""
         self.log(skill, action, "STARTED", task_id=task_id)
@@ -80,22 +108,23 @@ class AuditLogger:
         """Log an error."""
         self.log(skill, action, "ERROR", task_id=task_id, detail=str(error)[:120])
 
+    @staticmethod
+    def _count_line(summary: dict, line: str) -> None:
+        summary["total"] += 1
+        if "| ERROR" in line:
+            summary["errors"] += 1
+        if "retry" in line.lower():
+            summary["retries"] += 1
+        if "needs_human" in line.lower():
+            summary["needs_human"] += 1
+
     def today_summary(self) -> dict:
-        """Return count of actions, errors, retries from today's log."""
-        log_file = self._log_file()
-        summary  = {"total": 0, "errors": 0, "retries": 0, "needs_human": 0}
-
-        if not os.path.exists(log_file):
-            return summary
-
-        with open(log_file, "r", encoding="utf-8") as f:
-            for line in f:
-                summary["total"] += 1
-                if "| ERROR" in line:
-                    summary["errors"] += 1
-                if "retry" in line.lower():
-                    summary["retries"] += 1
-                if "needs_human" in line.lower():
-                    summary["needs_human"] += 1
-
-        return summary
+        """Return count of actions, errors, retries from today's log (incremental)."""
+        self.flush()
+        empty = {"total": 0, "errors": 0, "retries": 0, "needs_human": 0}
+        return LogSummary(self._log_file(), self._count_line, empty).read()
+
+    def query(self, **filters) -> list[dict]:
+        """Search all audit logs: skill, action, result, task_id, since, until, limit."""
+        self.flush()
+        return get_index(AUDIT_LOG_DIR).query(**filters)
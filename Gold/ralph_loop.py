@@ -26,7 +26,10 @@ from datetime import datetime
 
 # Audit logger import (same folder)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# keyword_matcher — one copy for every tier, in Platinum/Shared
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Platinum", "Shared"))
 from audit_logger import AuditLogger
+from keyword_matcher import KeywordMatcher
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -39,6 +42,12 @@ MEMORY_DIR       = os.path.join(BASE_DIR, "Memory")
 MAX_ITERATIONS   = 10
 SKILL_NAME       = "RalphWiggumLoop"
 
+# Step -> integration routing, first matching category wins
+STEP_ROUTES = KeywordMatcher({
+    "odoo":   ["odoo", "invoice", "accounting"],
+    "social": ["post", "tweet", "instagram", "facebook"],
+})
+
 
 # ── Step Parser ───────────────────────────────────────────────────────────────
 
@@ -175,13 +184,13 @@ class RalphWiggumLoop:
         """
         time.sleep(0.3)  # simulate work
 
-        # Keyword-based routing (expandable)
-        step_lower = step.lower()
+        # Keyword-based routing (expandable via STEP_ROUTES)
+        route = STEP_ROUTES.first(step)
 
-        if any(kw in step_lower for kw in ["odoo", "invoice", "accounting"]):
+        if route == "odoo":
             return {"status": "pending_integration", "output": "Odoo MCP not connected yet"}
 
-        if any(kw in step_lower for kw in ["post", "tweet", "instagram", "facebook"]):
+        if route == "social":
             return {"status": "pending_approval", "output": "Social media requires approval"}
 
         # Default: mark step as simulated-success
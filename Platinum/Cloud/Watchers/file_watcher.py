@@ -4,12 +4,23 @@ file_watcher.py — File Watcher (Platinum Cloud)
 Monitors Needs_Action/cloud/ for new .md task files.
 Implements claim-by-move rule:
   Needs_Action/cloud/TASK.md  ->  In_Progress/cloud/TASK.md
-Then auto-triggers email_drafter for email tasks.
+Then routes the task to its drafter through the ROUTES table (filename
+prefix, frontmatter `type:`, or section marker), each handler with its own
+concurrency limit and timeout.
+
+Dispatch (FILE_WATCHER_DISPATCH):
+  inprocess  — drafter modules are imported once and their run() is called
+               on a per-handler thread pool (default; no interpreter spawn)
+  subprocess — one `python <drafter>.py <task>` per task (full isolation,
+               the drafter is killed at its timeout)
 
 Extends BaseWatcher from Shared/.
 
 Run:
   python Cloud/Watchers/file_watcher.py
+
+Wakes on inotify/watchdog events for Needs_Action/cloud/ (WATCHER_EVENT_MODE),
+falls back to polling every POLL_SECONDS.
 """
 
 import os
@@ -17,7 +28,11 @@ import sys
 import re
 import shutil
 import subprocess
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from datetime import datetime
+from typing import Callable
 
 CLOUD_DIR    = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 PLATINUM_DIR = os.path.dirname(CLOUD_DIR)
@@ -25,29 +40,225 @@ PLATINUM_DIR = os.path.dirname(CLOUD_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.base_watcher import BaseWatcher
+from Shared.keyword_matcher import KeywordMatcher
+from Shared.metrics import timed
+from Shared.signal_bus import SignalBus
+from Shared.sync_trigger import notify
 
 NEEDS_ACTION_DIR  = os.path.join(PLATINUM_DIR, "Needs_Action", "cloud")
 IN_PROGRESS_DIR   = os.path.join(PLATINUM_DIR, "In_Progress", "cloud")
 EMAIL_DRAFTER     = os.path.join(CLOUD_DIR, "email_drafter.py")
+SOCIAL_DRAFTER    = os.path.join(CLOUD_DIR, "social_drafter.py")
 SIGNALS_DIR       = os.path.join(PLATINUM_DIR, "Signals")
 
-POLL_SECONDS = 5
-SKILL        = "FileWatcher_Platinum"
+POLL_SECONDS    = 5
+WORKERS         = 4      # parallel claims/drafts — one slow draft no longer blocks the rest
+ITEM_TIMEOUT    = 150    # seconds per task (watcher pool deadline, above every handler timeout)
+HANDLER_TIMEOUT = 120    # seconds — default per-handler deadline, counted from dispatch
+DISPATCH_MODE   = os.environ.get("FILE_WATCHER_DISPATCH", "inprocess")
+DISPATCH_MODES  = ("inprocess", "subprocess")
+SKILL           = "FileWatcher_Platinum"
+
+# Task handlers: name, module with run(task_path) -> bool, script for subprocess mode,
+# then routing keys and limits. A new task type is one more entry here.
+ROUTES = [
+    ("email_drafter",  "Cloud.email_drafter",  EMAIL_DRAFTER,
+     dict(prefixes=("EMAIL_",),  types=("email",),  markers=("## Email Body",),
+          concurrency=4, timeout=120)),
+    ("social_drafter", "Cloud.social_drafter", SOCIAL_DRAFTER,
+     dict(prefixes=("SOCIAL_",), types=("social",), markers=("**Platform:**",),
+          concurrency=2, timeout=60)),
+]
 
 
 # ── Risk classification (same as Gold) ────────────────────────────────────────
 
 HIGH_RISK_KEYWORDS   = ["delete", "deploy", "production", "billing", "payment", "cloud"]
 MEDIUM_RISK_KEYWORDS = ["update", "modify", "push", "send", "email"]
+RISK_MATCHER         = KeywordMatcher({"high": HIGH_RISK_KEYWORDS, "medium": MEDIUM_RISK_KEYWORDS})
 
 
 def classify_risk(content: str) -> str:
-    lower = content.lower()
-    if any(kw in lower for kw in HIGH_RISK_KEYWORDS):
-        return "high"
-    if any(kw in lower for kw in MEDIUM_RISK_KEYWORDS):
-        return "medium"
-    return "low"
+    return RISK_MATCHER.first(content, "low")
+
+
+# ── Dispatch routing ──────────────────────────────────────────────────────────
+# A task is routed by, in order of precedence:
+#   1. filename prefix        EMAIL_..., SOCIAL_...
+#   2. frontmatter `type:`    ---\ntype: social\n---
+#   3. section marker         "## Email Body" — the first one in the file
+# Prefixes and markers are each compiled into one alternation regex, types
+# into a dict, so routing cost doesn't grow with the number of handlers.
+
+_FRONTMATTER = re.compile(r"\A---[ \t]*\r?\n(.*?)\r?\n---", re.DOTALL)
+_FM_TYPE     = re.compile(r"^type:[ \t]*[\"']?([\w-]+)", re.MULTILINE | re.IGNORECASE)
+
+
+def frontmatter_type(content: str) -> str | None:
+    """Lower-cased `type:` value from a leading --- frontmatter block, if any."""
+    m = _FRONTMATTER.match(content)
+    if not m:
+        return None
+    t = _FM_TYPE.search(m.group(1))
+    return t.group(1).lower() if t else None
+
+
+class _Route:
+    __slots__ = ("name", "module", "script", "concurrency", "timeout", "slots", "executor")
+
+    def __init__(self, name: str, module: str, script: str, concurrency: int, timeout: float):
+        self.name        = name
+        self.module      = module
+        self.script      = script
+        self.concurrency = concurrency
+        self.timeout     = timeout
+        self.slots       = threading.BoundedSemaphore(concurrency)
+        self.executor: ThreadPoolExecutor | None = None
+
+
+class Dispatcher:
+    """
+    Routing table of task handlers. In "inprocess" mode each handler's
+    module is imported once and its run(task_path) called on that
+    handler's own thread pool (size = its concurrency); "subprocess" mode
+    runs the handler script in a fresh interpreter instead. Either way a
+    handler never has more than `concurrency` tasks running, and a task
+    that exceeds the handler's `timeout`, raises, or whose run() returns
+    False (non-zero exit in subprocess mode) is reported as failed.
+    """
+
+    def __init__(self, skill: str, log, mode: str = DISPATCH_MODE):
+        if mode not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode '{mode}' — use one of {DISPATCH_MODES}")
+        self.skill   = skill
+        self.log     = log
+        self.mode    = mode
+        self._routes: dict[str, _Route] = {}
+        self._types: dict[str, str] = {}
+        self._prefixes: list[tuple[str, str]] = []
+        self._markers: list[tuple[str, str]] = []
+        self._prefix_re: re.Pattern | None = None
+        self._marker_re: re.Pattern | None = None
+        self._funcs: dict[str, Callable[[str], bool]] = {}
+        self._lock   = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        module: str,
+        script: str,
+        prefixes: tuple[str, ...] = (),
+        types: tuple[str, ...] = (),
+        markers: tuple[str, ...] = (),
+        concurrency: int = WORKERS,
+        timeout: float = HANDLER_TIMEOUT,
+    ) -> None:
+        """Add a handler; `module` must expose run(task_path) -> bool. Earlier types win duplicates."""
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self._routes[name] = _Route(name, module, script, concurrency, timeout)
+        self._prefixes += [(p, name) for p in prefixes]
+        self._markers  += [(m, name) for m in markers]
+        for t in types:
+            self._types.setdefault(t.lower(), name)
+        self._prefix_re = self._compile(self._prefixes, anchor=True)
+        self._marker_re = self._compile(self._markers, anchor=False)
+
+    @staticmethod
+    def _compile(pairs: list[tuple[str, str]], anchor: bool) -> re.Pattern | None:
+        # One named group per pattern; m.lastgroup maps back to the handler.
+        # Longer prefixes first so EMAIL_REPLY_ beats EMAIL_.
+        if not pairs:
+            return None
+        order = sorted(range(len(pairs)), key=lambda i: -len(pairs[i][0])) if anchor else range(len(pairs))
+        alts  = "|".join(f"(?P<r{i}>{re.escape(pairs[i][0])})" for i in order)
+        return re.compile(f"^(?:{alts})" if anchor else alts)
+
+    def match(self, filename: str, content: str) -> str | None:
+        if self._prefix_re is not None:
+            m = self._prefix_re.match(filename)
+            if m:
+                return self._prefixes[int(m.lastgroup[1:])][1]
+        if self._types:
+            name = self._types.get(frontmatter_type(content) or "")
+            if name is not None:
+                return name
+        if self._marker_re is not None:
+            m = self._marker_re.search(content)
+            if m:
+                return self._markers[int(m.lastgroup[1:])][1]
+        return None
+
+    def preload(self) -> None:
+        """Import every handler now, so the first task doesn't pay for it."""
+        if self.mode != "inprocess":
+            return
+        for name in self._routes:
+            try:
+                self._load(name)
+            except Exception as exc:
+                self.log.log_error(self.skill, f"load_{name}", str(exc))
+                print(f"[{self.skill}] WARN: cannot import {name}: {exc}")
+
+    def _load(self, name: str) -> Callable[[str], bool]:
+        func = self._funcs.get(name)
+        if func is not None:
+            return func
+        with self._lock:
+            route = self._routes[name]
+            if name not in self._funcs:
+                self._funcs[name] = importlib.import_module(route.module).run
+            if route.executor is None:
+                route.executor = ThreadPoolExecutor(route.concurrency, thread_name_prefix=name)
+            return self._funcs[name]
+
+    # ── Running ───────────────────────────────────────────────────────────────
+
+    def dispatch(self, name: str, task_path: str, task_id: str) -> bool:
+        """Run handler `name` on task_path; logs the outcome, never raises."""
+        route = self._routes[name]
+        print(f"[{datetime.now():%H:%M:%S}] TRIGGER  {name} for {task_id}  [{self.mode}]")
+        self.log.log(self.skill, f"trigger_{name}", "started", task_id=task_id, detail=self.mode)
+        try:
+            if self.mode == "inprocess":
+                self._run_inprocess(route, task_path)
+            else:
+                self._run_subprocess(route, task_path)
+        except (subprocess.TimeoutExpired, FutureTimeout):
+            self.log.log_error(self.skill, f"{name}_done", f"timeout after {route.timeout}s",
+                               task_id=task_id)
+            return False
+        except Exception as exc:
+            self.log.log_error(self.skill, f"{name}_done", str(exc)[:100], task_id=task_id)
+            return False
+        self.log.log(self.skill, f"{name}_done", "success", task_id=task_id)
+        return True
+
+    def _run_inprocess(self, route: _Route, task_path: str) -> None:
+        # The handler's pool bounds its concurrency; a timed-out call keeps
+        # its slot until it really returns (threads can't be killed).
+        func = self._load(route.name)
+        if not route.executor.submit(func, task_path).result(timeout=route.timeout):
+            # Same as a non-zero exit in subprocess mode
+            raise RuntimeError(f"{route.name} reported failure")
+
+    def _run_subprocess(self, route: _Route, task_path: str) -> None:
+        env = os.environ.copy()
+        env["PYTHONIOENCODING"] = "utf-8"
+        with route.slots:
+            result = subprocess.run(
+                [sys.executable, route.script, task_path],
+                capture_output=True, text=True,
+                encoding="utf-8", errors="replace",
+                timeout=route.timeout, env=env,
+            )
+        if result.returncode != 0:
+            raise RuntimeError((result.stderr or f"exit {result.returncode}").strip())
+
+    def shutdown(self) -> None:
+        for route in self._routes.values():
+            if route.executor is not None:
+                route.executor.shutdown(wait=False, cancel_futures=True)
 
 
 # ── FileWatcher ────────────────────────────────────────────────────────────────
@@ -55,14 +266,30 @@ def classify_risk(content: str) -> str:
 class FileWatcher(BaseWatcher):
 
     def __init__(self):
-        super().__init__(SKILL, poll_seconds=POLL_SECONDS)
+        super().__init__(SKILL, poll_seconds=POLL_SECONDS, watch_dirs=[NEEDS_ACTION_DIR],
+                         workers=WORKERS, item_timeout=ITEM_TIMEOUT)
         self._seen: set[str] = set()
+        self.signals    = SignalBus(self.skill)
+        self.dispatcher = Dispatcher(self.skill, self.log)
+        for name, module, script, route in ROUTES:
+            self.dispatcher.register(name, module, script, **route)
+
+    def run(self) -> None:
+        try:
+            super().run()
+        finally:
+            self.dispatcher.shutdown()
+
+    def item_key(self, item: dict) -> str:
+        return item["filename"]
 
     def on_start(self) -> None:
         for d in [NEEDS_ACTION_DIR, IN_PROGRESS_DIR, SIGNALS_DIR]:
             os.makedirs(d, exist_ok=True)
         print(f"[{self.skill}] Watching: {NEEDS_ACTION_DIR}")
         print(f"[{self.skill}] Claim-by-move -> {IN_PROGRESS_DIR}")
+        print(f"[{self.skill}] Dispatch mode: {self.dispatcher.mode}")
+        self.dispatcher.preload()
 
     def poll(self) -> list[dict]:
         """Detect new .md files in Needs_Action/cloud/."""
@@ -86,7 +313,7 @@ class FileWatcher(BaseWatcher):
             return
 
         # -- Claim-by-move (atomic on most OS) --
-        start = datetime.now()
+        timer = timed(self.skill, "claim_task")
         try:
             shutil.move(src, dst)
         except FileNotFoundError:
@@ -100,7 +327,7 @@ class FileWatcher(BaseWatcher):
 
         risk = classify_risk(content)
 
-        duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+        duration_ms = timer.stop()
         print(f"[{datetime.now():%H:%M:%S}] CLAIMED  {filename}  [risk={risk}]")
         self.log.log(self.skill, "claim_task", "In_Progress/cloud",
                      duration_ms=duration_ms,
@@ -111,51 +338,19 @@ class FileWatcher(BaseWatcher):
         self._write_signal(filename, "claimed", risk)
 
         # -- Dispatch --
-        if self._is_email_task(filename, content):
-            self._trigger_email_drafter(dst, filename)
+        handler = self.dispatcher.match(filename, content)
+        if handler is not None:
+            self.dispatcher.dispatch(handler, dst, filename)
         else:
             print(f"[{self.skill}] NOTE: No auto-handler for {filename} — manual action needed")
             self.log.log(self.skill, "dispatch", "manual_needed", task_id=filename)
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
-    def _is_email_task(self, filename: str, content: str) -> bool:
-        return filename.startswith("EMAIL_") or "## Email Body" in content
-
-    def _trigger_email_drafter(self, task_path: str, filename: str) -> None:
-        print(f"[{datetime.now():%H:%M:%S}] TRIGGER  email_drafter for {filename}")
-        self.log.log(self.skill, "trigger_email_drafter", "started", task_id=filename)
-        try:
-            env = os.environ.copy()
-            env["PYTHONIOENCODING"] = "utf-8"
-            result = subprocess.run(
-                [sys.executable, EMAIL_DRAFTER, task_path],
-                capture_output=True, text=True,
-                encoding="utf-8", errors="replace",
-                timeout=120, env=env,
-            )
-            if result.returncode == 0:
-                self.log.log(self.skill, "email_drafter_done", "success", task_id=filename)
-            else:
-                self.log.log_error(self.skill, "email_drafter_done",
-                                   (result.stderr or "")[:100], task_id=filename)
-        except subprocess.TimeoutExpired:
-            self.log.log_error(self.skill, "email_drafter_done", "timeout", task_id=filename)
-        except Exception as exc:
-            self.log.log_error(self.skill, "email_drafter_done", str(exc), task_id=filename)
-
     def _write_signal(self, task_id: str, event: str, detail: str = "") -> None:
-        """Write a signal file so Local can update Dashboard.md."""
-        ts       = datetime.now().strftime("%Y%m%d_%H%M%S")
-        sig_file = os.path.join(SIGNALS_DIR, f"SIGNAL_{ts}_{event}.md")
-        content  = (
-            f"signal: {event}\n"
-            f"task_id: {task_id}\n"
-            f"detail: {detail}\n"
-            f"timestamp: {datetime.now().isoformat()}\n"
-        )
-        with open(sig_file, "w", encoding="utf-8") as f:
-            f.write(content)
+        """Append a signal so Local can update Dashboard.md."""
+        self.signals.emit(event, task_id=task_id, detail=detail)
+        notify(self.skill)
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
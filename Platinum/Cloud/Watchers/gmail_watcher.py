@@ -5,6 +5,19 @@ Polls Gmail inbox every 60s for unread emails.
 Converts each email -> task file in Platinum/Needs_Action/cloud/
 Marks email as read after processing.
 
+Sync modes (GMAIL_SYNC_MODE):
+  history (default) — users.history.list from the last saved historyId,
+                      so only messages added since the previous cycle are
+                      fetched. Expired historyId (404) -> full resync.
+                      The checkpoint only advances once the listing ran
+                      to the last page and every listed email converted.
+  full              — re-list every unread INBOX message each cycle.
+
+HTTP calls per cycle (independent of inbox burst size):
+  1. history.list (every page) / messages.list (up to MAX_PAGES x MAX_RESULTS ids)
+  2. batch messages.get     (one multipart request per BATCH_SIZE ids)
+  3. messages.batchModify   (remove UNREAD from every converted email)
+
 Extends BaseWatcher from Shared/.
 
 Setup:
@@ -33,17 +46,26 @@ SHARED_DIR   = os.path.join(PLATINUM_DIR, "Shared")
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.base_watcher import BaseWatcher
+from Shared.metrics import timed
 from Shared.retry_handler import with_retry
 
 INBOX_DIR       = os.path.join(PLATINUM_DIR, "Needs_Action", "cloud")
 CREDENTIALS_FILE = os.path.join(CLOUD_DIR, "credentials.json")   # NEVER commit
 TOKEN_FILE       = os.path.join(CLOUD_DIR, "token.json")         # NEVER commit
+HISTORY_FILE     = os.path.join(CLOUD_DIR, ".gmail_history_id")  # sync checkpoint
 
 SCOPES = ["https://www.googleapis.com/auth/gmail.modify"]
 
 POLL_SECONDS = 60
 SKILL        = "GmailWatcher_Platinum"
 
+MAX_RESULTS  = int(os.environ.get("GMAIL_MAX_RESULTS", "25"))   # ids per list page
+MAX_PAGES    = int(os.environ.get("GMAIL_MAX_PAGES", "1"))      # messages.list pages per cycle
+BATCH_SIZE   = 50     # Gmail recommends <= 50 sub-requests per batch
+
+SYNC_MODE         = os.environ.get("GMAIL_SYNC_MODE", "history")   # history | full
+FULL_RESYNC_EVERY = 60   # cycles — catch anything incremental sync missed
+
 
 # ── Auth ──────────────────────────────────────────────────────────────────────
 
@@ -77,6 +99,22 @@ def get_gmail_service():
     return build("gmail", "v1", credentials=creds)
 
 
+# ── History checkpoint ────────────────────────────────────────────────────────
+
+def load_history_id() -> str | None:
+    if not os.path.exists(HISTORY_FILE):
+        return None
+    with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+        return f.read().strip() or None
+
+
+def save_history_id(history_id: str) -> None:
+    tmp = HISTORY_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(str(history_id))
+    os.replace(tmp, HISTORY_FILE)
+
+
 # ── GmailWatcher ──────────────────────────────────────────────────────────────
 
 class GmailWatcher(BaseWatcher):
@@ -84,6 +122,11 @@ class GmailWatcher(BaseWatcher):
     def __init__(self):
         super().__init__(SKILL, poll_seconds=POLL_SECONDS)
         self.service = None
+        self._to_mark_read: list[str] = []
+        self._history_id: str | None         = load_history_id()
+        self._pending_history_id: str | None = None
+        self._cycle_failed                    = False   # hold the checkpoint back
+        self._cycles_since_resync             = 0
 
     def on_start(self) -> None:
         os.makedirs(INBOX_DIR, exist_ok=True)
@@ -91,31 +134,117 @@ class GmailWatcher(BaseWatcher):
         self.service = get_gmail_service()
         print(f"[{self.skill}] Gmail connected. Dropping tasks to: {INBOX_DIR}")
 
-    @with_retry(max_attempts=3, delay=5.0, exceptions=(Exception,))
     def poll(self) -> list[dict]:
-        """Fetch unread emails from INBOX."""
-        result = self.service.users().messages().list(
-            userId="me",
-            labelIds=["INBOX", "UNREAD"],
-            maxResults=10,
-        ).execute()
-
-        messages = result.get("messages", [])
-        items    = []
-
-        for msg_ref in messages:
-            msg = self.service.users().messages().get(
-                userId="me",
-                id=msg_ref["id"],
-                format="full",
-            ).execute()
-            items.append(msg)
-
-        return items
+        """Fetch unread emails from INBOX (one list + batched gets)."""
+        # Counted once per cycle, not per retry attempt below
+        self._cycles_since_resync += 1
+        return self._fetch_new()
+
+    @with_retry(max_attempts=3, delay=5.0, exceptions=(Exception,))
+    def _fetch_new(self) -> list[dict]:
+        pending = set(self._to_mark_read)   # converted, mark-read still owed
+        ids     = [m for m in self._list_new_ids() if m not in pending]
+        if not ids:
+            return []
+        # A held-back checkpoint re-lists emails already converted and read
+        return [m for m in self._batch_get(ids) if "UNREAD" in m.get("labelIds", [])]
+
+    def _list_new_ids(self) -> list[str]:
+        """Ids to fetch this cycle — incremental via history when possible."""
+        self._pending_history_id = None
+        self._cycle_failed       = False
+        if SYNC_MODE != "history":
+            return self._list_unread_ids()[0]
+
+        if self._history_id is None or self._cycles_since_resync >= FULL_RESYNC_EVERY:
+            return self._full_resync("checkpoint missing" if self._history_id is None else "periodic")
+
+        try:
+            ids, latest = self._list_history_ids(self._history_id)
+        except Exception as exc:
+            if getattr(getattr(exc, "resp", None), "status", None) == 404:
+                return self._full_resync("historyId expired")
+            raise
+        self._pending_history_id = latest
+        return ids
+
+    def _full_resync(self, reason: str) -> list[str]:
+        # Take the checkpoint before listing so nothing arriving in between is skipped
+        profile = self.service.users().getProfile(userId="me").execute()
+        self._cycles_since_resync = 0
+        self.log.log(self.skill, "full_resync", "success", detail=reason)
+        ids, complete = self._list_unread_ids()
+        if complete:
+            # Truncated listing: keep the old checkpoint, the rest comes next cycle
+            self._pending_history_id = str(profile["historyId"])
+        return ids
+
+    def _list_history_ids(self, start_id: str) -> tuple[list[str], str]:
+        """Page to the end — stopping early would move the checkpoint past unlisted mail."""
+        ids, page_token, latest = [], None, start_id
+        while True:
+            kwargs = {
+                "userId":         "me",
+                "startHistoryId": start_id,
+                "historyTypes":   ["messageAdded"],
+                "labelId":        "INBOX",
+                "maxResults":     MAX_RESULTS,
+            }
+            if page_token:
+                kwargs["pageToken"] = page_token
+            result = self.service.users().history().list(**kwargs).execute()
+            for record in result.get("history", []):
+                for added in record.get("messagesAdded", []):
+                    msg = added.get("message", {})
+                    if "UNREAD" in msg.get("labelIds", []) and msg["id"] not in ids:
+                        ids.append(msg["id"])
+            latest     = str(result.get("historyId", latest))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+        return ids, latest
+
+    def _list_unread_ids(self) -> tuple[list[str], bool]:
+        """Up to MAX_PAGES pages of unread ids, and whether that was every page."""
+        ids, page_token = [], None
+        for _ in range(MAX_PAGES):
+            kwargs = {"userId": "me", "labelIds": ["INBOX", "UNREAD"], "maxResults": MAX_RESULTS}
+            if page_token:
+                kwargs["pageToken"] = page_token
+            result = self.service.users().messages().list(**kwargs).execute()
+            ids.extend(m["id"] for m in result.get("messages", []))
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                break
+        return ids, not page_token
+
+    def _batch_get(self, ids: list[str]) -> list[dict]:
+        """messages.get for many ids in one multipart HTTP request per chunk."""
+        fetched: dict[str, dict] = {}
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                # Left unread; the checkpoint holds so the next cycle lists it again
+                self._cycle_failed = True
+                self.log.log_error(self.skill, "batch_get", str(exception), task_id=request_id)
+                return
+            fetched[request_id] = response
+
+        for i in range(0, len(ids), BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for msg_id in ids[i:i + BATCH_SIZE]:
+                batch.add(
+                    self.service.users().messages().get(userId="me", id=msg_id, format="full"),
+                    request_id=msg_id,
+                )
+            batch.execute()
+
+        # Keep list order (newest first)
+        return [fetched[m] for m in ids if m in fetched]
 
     def process(self, item: dict) -> None:
         """Convert email to task file in Needs_Action/cloud/."""
-        start = datetime.now()
+        timer = timed(self.skill, "email_to_task")
         msg_id = item["id"]
 
         # Extract headers
@@ -170,20 +299,48 @@ Original sender: {sender}
         with open(filepath, "w", encoding="utf-8") as f:
             f.write(content)
 
-        # Mark email as read
-        self.service.users().messages().modify(
-            userId="me",
-            id=msg_id,
-            body={"removeLabelIds": ["UNREAD"]},
-        ).execute()
-
-        duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+        duration_ms = timer.stop()
         print(f"[{datetime.now():%H:%M:%S}] EMAIL->TASK  {filename}")
         self.log.log(self.skill, "email_to_task", "success",
                      duration_ms=duration_ms,
                      task_id=filename,
                      detail=f"from={sender[:50]}")
 
+    def on_error(self, exc: Exception) -> None:
+        self._cycle_failed = True
+        super().on_error(exc)
+
+    def on_complete(self, item: dict) -> None:
+        self._to_mark_read.append(item["id"])
+
+    def on_cycle_end(self) -> None:
+        """Mark converted emails read, then advance the history checkpoint."""
+        self._flush_mark_read()
+        if self._cycle_failed:
+            # Re-list the same window next cycle; converted emails are read by then
+            self._pending_history_id = None
+        if self._pending_history_id and self._pending_history_id != self._history_id:
+            save_history_id(self._pending_history_id)
+            self._history_id = self._pending_history_id
+        self._pending_history_id = None
+
+    def _flush_mark_read(self) -> None:
+        """Mark every email converted this cycle as read in one batchModify call."""
+        if not self._to_mark_read:
+            return
+        ids, self._to_mark_read = self._to_mark_read, []
+        try:
+            for i in range(0, len(ids), 1000):   # batchModify accepts up to 1000 ids
+                self.service.users().messages().batchModify(
+                    userId="me",
+                    body={"ids": ids[i:i + 1000], "removeLabelIds": ["UNREAD"]},
+                ).execute()
+            self.log.log(self.skill, "mark_read", "success", detail=f"{len(ids)} emails")
+        except Exception as exc:
+            # Retry with the next cycle's batch rather than re-creating tasks
+            self._to_mark_read = ids + self._to_mark_read
+            self.log.log_error(self.skill, "mark_read", str(exc))
+
     # ── Body extraction ───────────────────────────────────────────────────────
 
     def _extract_body(self, msg: dict) -> str:
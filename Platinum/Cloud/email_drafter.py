@@ -24,39 +24,42 @@ PLATINUM_DIR = os.path.dirname(CLOUD_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.keyword_matcher import KeywordMatcher
+from Shared.metrics import timed
+from Shared.signal_bus import SignalBus
+from Shared.sync_trigger import notify
+from Shared.task_file import TaskFile, load, parse
 
 PENDING_DIR  = os.path.join(PLATINUM_DIR, "Pending_Approval", "cloud")
 DONE_DIR     = os.path.join(PLATINUM_DIR, "Done")
 FAILED_DIR   = os.path.join(PLATINUM_DIR, "Failed")
-SIGNALS_DIR  = os.path.join(PLATINUM_DIR, "Signals")
 
-SKILL = "EmailDrafter_Platinum"
+SKILL   = "EmailDrafter_Platinum"
+SIGNALS = SignalBus(SKILL)
+
+# Reply intent — first matching category wins
+INTENTS = KeywordMatcher({
+    "billing_inquiry": ["invoice", "bill", "payment", "amount due"],
+    "meeting_request": ["meeting", "call", "schedule", "appointment"],
+    "urgent":          ["urgent", "asap", "immediately", "emergency"],
+})
 
 
 # ── Draft creation ────────────────────────────────────────────────────────────
 
-def extract_email_info(content: str) -> dict:
+def extract_email_info(content: str | TaskFile) -> dict:
     """Parse task file for email metadata."""
-    info = {}
-
-    for key, pattern in [
-        ("subject", r"\*\*.*?Subject.*?\*\*:?\s*(.+)"),
-        ("from",    r"\*\*From:\*\*\s*(.+)"),
-        ("date",    r"\*\*Date:\*\*\s*(.+)"),
-        ("gmail_id", r"\*\*Gmail-ID:\*\*\s*(.+)"),
-    ]:
-        m = re.search(pattern, content, re.IGNORECASE)
-        info[key] = m.group(1).strip() if m else ""
-
-    # Extract email body
-    body_match = re.search(r"## Email Body\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
-    info["body"] = body_match.group(1).strip() if body_match else ""
+    task  = parse(content)
+    title = task.title
 
-    # Extract task title
-    title_match = re.search(r"^#\s+Task:\s*(.+)", content, re.MULTILINE)
-    info["title"] = title_match.group(1).strip() if title_match else "Email"
-
-    return info
+    return {
+        "subject":  next((v for k, v in task.fields.items() if "subject" in k), ""),
+        "from":     task.field("from"),
+        "date":     task.field("date"),
+        "gmail_id": task.field("gmail-id"),
+        "body":     task.section("email body"),
+        "title":    title[len("Task:"):].strip() if title.startswith("Task:") else "Email",
+    }
 
 
 def generate_draft_reply(info: dict) -> str:
@@ -70,9 +73,9 @@ def generate_draft_reply(info: dict) -> str:
     first_name = name_match.group(1) if name_match else "Sir/Madam"
 
     # Simple intent detection
-    body_lower = body.lower()
+    intent = INTENTS.first(body)
 
-    if any(kw in body_lower for kw in ["invoice", "bill", "payment", "amount due"]):
+    if intent == "billing_inquiry":
         reply_body = (
             f"Dear {first_name},\n\n"
             f"Thank you for your message regarding the invoice/payment.\n\n"
@@ -82,7 +85,7 @@ def generate_draft_reply(info: dict) -> str:
         )
         category = "billing_inquiry"
 
-    elif any(kw in body_lower for kw in ["meeting", "call", "schedule", "appointment"]):
+    elif intent == "meeting_request":
         reply_body = (
             f"Dear {first_name},\n\n"
             f"Thank you for reaching out.\n\n"
@@ -92,7 +95,7 @@ def generate_draft_reply(info: dict) -> str:
         )
         category = "meeting_request"
 
-    elif any(kw in body_lower for kw in ["urgent", "asap", "immediately", "emergency"]):
+    elif intent == "urgent":
         reply_body = (
             f"Dear {first_name},\n\n"
             f"Thank you for your urgent message. I have noted the priority.\n\n"
@@ -180,25 +183,17 @@ def create_approval_file(task_filepath: str, info: dict, draft: str, category: s
 
 
 def write_signal(task_id: str, approval_file: str) -> None:
-    """Signal Local that a new approval is waiting."""
-    os.makedirs(SIGNALS_DIR, exist_ok=True)
-    ts       = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sig_file = os.path.join(SIGNALS_DIR, f"SIGNAL_{ts}_approval_needed.md")
-    content  = (
-        f"signal: approval_needed\n"
-        f"task_id: {task_id}\n"
-        f"approval_file: {approval_file}\n"
-        f"timestamp: {datetime.now().isoformat()}\n"
-    )
-    with open(sig_file, "w", encoding="utf-8") as f:
-        f.write(content)
+    """Signal Local that a new approval is waiting (and ask for a sync now)."""
+    SIGNALS.emit("approval_needed", task_id=task_id, approval_file=approval_file)
+    notify(SKILL)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
-def run(task_filepath: str) -> None:
+def run(task_filepath: str) -> bool:
+    """Draft a reply for one task; False when the task could not be drafted."""
     log   = AuditLogger()
-    start = datetime.now()
+    timer = timed(SKILL, "draft_created")
     task  = os.path.basename(task_filepath)
 
     log.log(SKILL, "draft_start", "STARTED", task_id=task)
@@ -207,28 +202,26 @@ def run(task_filepath: str) -> None:
     if not os.path.exists(task_filepath):
         log.log_error(SKILL, "draft_start", f"File not found: {task_filepath}", task_id=task)
         print(f"[{SKILL}] ERROR: File not found: {task_filepath}")
-        return
-
-    with open(task_filepath, "r", encoding="utf-8") as f:
-        content = f.read()
+        return False
 
-    info            = extract_email_info(content)
+    info            = extract_email_info(load(task_filepath))
     draft, category = generate_draft_reply(info)
 
     approval_path = create_approval_file(task_filepath, info, draft, category, log)
 
     write_signal(task, approval_path)
 
-    duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+    duration_ms = timer.stop()
     print(f"[{SKILL}] DRAFT CREATED -> {os.path.basename(approval_path)}")
     log.log(SKILL, "draft_created", "pending_approval",
             duration_ms=duration_ms,
             task_id=task,
             detail=f"category={category} approval={os.path.basename(approval_path)}")
+    return True
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(f"Usage: python {sys.argv[0]} <task_filepath>")
         sys.exit(1)
-    run(sys.argv[1])
+    sys.exit(0 if run(sys.argv[1]) else 1)
@@ -3,6 +3,7 @@ health_monitor.py — Health Monitor (Platinum Cloud)
 ----------------------------------------------------
 Runs every 5 minutes on Oracle VM. Checks:
   1. Required processes (gmail_watcher, file_watcher, sync_agent) running?
+     (asks the orchestrator's /healthz; falls back to `ps aux`)
   2. Disk space > 20% free?
   3. Audit log written in last 10 minutes?
   4. Pending_Approval tasks older than 24h? (alert)
@@ -22,6 +23,9 @@ import json
 import time
 import shutil
 import subprocess
+import threading
+import urllib.error
+import urllib.request
 from datetime import datetime, timedelta
 
 CLOUD_DIR    = os.path.dirname(os.path.abspath(__file__))
@@ -30,8 +34,9 @@ PLATINUM_DIR = os.path.dirname(CLOUD_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.signal_bus import SignalBus
+from Shared.sync_trigger import notify
 
-SIGNALS_DIR     = os.path.join(PLATINUM_DIR, "Signals")
 LOGS_DIR        = os.path.join(PLATINUM_DIR, "Logs")
 PENDING_DIR     = os.path.join(PLATINUM_DIR, "Pending_Approval", "cloud")
 FAILED_DIR      = os.path.join(PLATINUM_DIR, "Failed")
@@ -41,7 +46,14 @@ MIN_DISK_PCT    = 20
 LOG_STALE_MINS  = 10
 PENDING_WARN_H  = 24    # warn if approval pending > 24 hours
 
-SKILL = "HealthMonitor_Platinum"
+SKILL   = "HealthMonitor_Platinum"
+SIGNALS = SignalBus(SKILL)
+
+# Orchestrator status endpoint — asked first, `ps` is only the fallback
+ORCHESTRATOR_URL = os.environ.get(
+    "ORCHESTRATOR_URL",
+    f"http://127.0.0.1:{os.environ.get('ORCHESTRATOR_HTTP_PORT', '8765')}",
+)
 
 # Optional WhatsApp alert (Green API) — set in .env
 WA_INSTANCE = os.environ.get("WA_INSTANCE_ID", "")
@@ -113,8 +125,33 @@ def check_failed_tasks() -> dict:
     }
 
 
+def check_processes_http(required: list[str]) -> dict | None:
+    """Ask the orchestrator's /healthz. None if it is not reachable."""
+    try:
+        with urllib.request.urlopen(f"{ORCHESTRATOR_URL}/healthz", timeout=2) as resp:
+            payload = json.load(resp)
+    except urllib.error.HTTPError as exc:
+        if exc.code != 503:
+            return None
+        payload = json.load(exc)   # degraded: body still lists services
+    except (OSError, ValueError):
+        return None
+
+    up      = payload.get("services", {})
+    missing = [p for p in required if not up.get(p)]
+    return {
+        "name":   "processes",
+        "ok":     len(missing) == 0,
+        "detail": f"missing: {missing}" if missing else "all running"
+    }
+
+
 def check_processes(required: list[str]) -> dict:
     """Check if required process names appear in running process list."""
+    result = check_processes_http(required)
+    if result is not None:
+        return result
+
     try:
         result = subprocess.run(
             ["ps", "aux"], capture_output=True, text=True, timeout=10
@@ -138,20 +175,12 @@ def check_processes(required: list[str]) -> dict:
 # ── Signal + Alert ────────────────────────────────────────────────────────────
 
 def write_health_signal(checks: list[dict], overall: str) -> None:
-    os.makedirs(SIGNALS_DIR, exist_ok=True)
-    ts       = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sig_file = os.path.join(SIGNALS_DIR, f"SIGNAL_{ts}_health.md")
-
-    lines = [
-        f"signal: health_check\n",
-        f"timestamp: {datetime.now().isoformat()}\n",
-        f"overall: {overall}\n",
-    ]
-    for c in checks:
-        lines.append(f"check.{c['name']}: {'OK' if c['ok'] else 'FAIL'} — {c['detail']}\n")
-
-    with open(sig_file, "w", encoding="utf-8") as f:
-        f.writelines(lines)
+    SIGNALS.emit(
+        "health_check",
+        overall=overall,
+        checks={c["name"]: f"{'OK' if c['ok'] else 'FAIL'} — {c['detail']}" for c in checks},
+    )
+    notify(SKILL)
 
 
 def send_wa_alert(message: str) -> None:
@@ -210,16 +239,20 @@ def run_checks() -> None:
 
 # ── Entry point ───────────────────────────────────────────────────────────────
 
+def run_loop(stop: threading.Event | None = None) -> None:
+    """Check every CHECK_INTERVAL seconds until stop is set (orchestrator thread mode)."""
+    stop = stop or threading.Event()
+    print(f"[{SKILL}] Starting loop — check every {CHECK_INTERVAL}s")
+    while not stop.is_set():
+        try:
+            run_checks()
+        except Exception as exc:
+            print(f"[{SKILL}] ERROR: {exc}")
+        stop.wait(CHECK_INTERVAL)
+
+
 if __name__ == "__main__":
-    loop = "--loop" in sys.argv
-
-    if loop:
-        print(f"[{SKILL}] Starting loop — check every {CHECK_INTERVAL}s")
-        while True:
-            try:
-                run_checks()
-            except Exception as exc:
-                print(f"[{SKILL}] ERROR: {exc}")
-            time.sleep(CHECK_INTERVAL)
+    if "--loop" in sys.argv:
+        run_loop()
     else:
         run_checks()
@@ -7,21 +7,47 @@ Starts and monitors all Cloud processes on Oracle VM:
   3. sync_agent.py --loop
   4. health_monitor.py --loop
 
-Auto-restarts any crashed process after RESTART_DELAY seconds.
+Auto-restarts crashed processes without blocking the others (Shared/supervisor.py):
+exponential backoff from RESTART_DELAY with jitter, and a service that
+exhausts its restart budget goes FATAL (signal written, no more restarts
+until POST /services/<name>/restart).
 All output logged to Platinum/Logs/orchestrator.log
 
+Status endpoint (http://127.0.0.1:8765 by default, ORCHESTRATOR_HTTP_PORT=0 disables):
+  GET  /healthz                  — 200 if every service is up, else 503
+  GET  /metrics                  — Prometheus text: per-service pid, uptime,
+                                   restarts, RSS/CPU (/proc), queue depths,
+                                   plus the Logs/metrics/*.prom latency histograms
+  GET  /services                 — JSON status of each service
+  POST /services/<name>/restart  — restart one service
+
+Modes (ORCHESTRATOR_MODE or --in-process):
+  process  — one Python interpreter per service (default, full isolation)
+  thread   — every service on its own thread inside this process: watchers
+             via BaseWatcher.run(), loops via run_loop(stop). An exception
+             (even SystemExit) only ends that service's thread, and the
+             supervisor restarts it with a fresh instance. Saves the
+             per-interpreter memory on small VMs; output goes to this
+             process's log instead of Logs/<service>.log.
+
 Run:
   python Cloud/orchestrator.py
+  python Cloud/orchestrator.py --in-process
 
 Stop:
-  Ctrl+C (sends SIGTERM to all children)
+  Ctrl+C (sends SIGTERM to all children / stops all service threads)
 """
 
 import os
 import sys
+import glob
+import importlib
+import json
 import subprocess
 import signal
+import threading
 import time
+import traceback
 from datetime import datetime
 
 CLOUD_DIR    = os.path.dirname(os.path.abspath(__file__))
@@ -31,11 +57,28 @@ LOGS_DIR     = os.path.join(PLATINUM_DIR, "Logs")
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.metrics import METRICS_DIR
+from Shared.supervisor import Supervisor, FATAL
+from Shared.status_server import StatusServer, count_files, merge_prom_files, read_proc_stats
 
 SKILL          = "Orchestrator_Platinum"
 RESTART_DELAY  = 10   # seconds before restarting a crashed process
 POLL_INTERVAL  = 5    # seconds between liveness checks
 
+MODE           = os.environ.get("ORCHESTRATOR_MODE", "process")         # process | thread
+STOP_TIMEOUT   = 10   # seconds to wait for a service thread to finish
+
+HTTP_HOST      = os.environ.get("ORCHESTRATOR_HTTP_HOST", "127.0.0.1")
+HTTP_PORT      = int(os.environ.get("ORCHESTRATOR_HTTP_PORT", "8765"))   # 0 = disabled
+HTTP_TOKEN     = os.environ.get("ORCHESTRATOR_HTTP_TOKEN", "")           # required for POST if set
+
+# Task folders reported as queue depths on /metrics
+QUEUE_DIRS = {
+    "needs_action":     os.path.join(PLATINUM_DIR, "Needs_Action"),
+    "in_progress":      os.path.join(PLATINUM_DIR, "In_Progress"),
+    "pending_approval": os.path.join(PLATINUM_DIR, "Pending_Approval"),
+}
+
 # Processes to manage: (name, script_path, extra_args)
 SERVICES = [
     ("gmail_watcher",  os.path.join(CLOUD_DIR, "Watchers", "gmail_watcher.py"),  []),
@@ -44,6 +87,16 @@ SERVICES = [
     ("health_monitor", os.path.join(CLOUD_DIR, "health_monitor.py"),              ["--loop"]),
 ]
 
+# Thread mode entry points: name -> (module, attribute, kind)
+#   watcher: attribute is a BaseWatcher subclass — run() / stop()
+#   loop:    attribute is run_loop(stop_event)
+IN_PROCESS = {
+    "gmail_watcher":  ("Cloud.Watchers.gmail_watcher", "GmailWatcher", "watcher"),
+    "file_watcher":   ("Cloud.Watchers.file_watcher",  "FileWatcher",  "watcher"),
+    "sync_agent":     ("Cloud.sync_agent",             "run_loop",     "loop"),
+    "health_monitor": ("Cloud.health_monitor",         "run_loop",     "loop"),
+}
+
 
 class ManagedProcess:
     def __init__(self, name: str, script: str, args: list[str]):
@@ -51,22 +104,27 @@ class ManagedProcess:
         self.script = script
         self.args   = args
         self.proc: subprocess.Popen | None = None
-        self.restarts = 0
+        self.restarts   = 0
+        self.started_at = 0.0
+        self._log_file  = None
 
     def start(self) -> None:
         env = os.environ.copy()
         env["PYTHONIOENCODING"] = "utf-8"
 
-        log_file = open(
+        if self._log_file is not None:
+            self._log_file.close()
+        self._log_file = open(
             os.path.join(LOGS_DIR, f"{self.name}.log"), "a", encoding="utf-8"
         )
 
         self.proc = subprocess.Popen(
             [sys.executable, self.script] + self.args,
-            stdout=log_file,
-            stderr=log_file,
+            stdout=self._log_file,
+            stderr=self._log_file,
             env=env,
         )
+        self.started_at = time.time()
         ts = datetime.now().strftime("%H:%M:%S")
         print(f"[{ts}] STARTED  {self.name}  (PID {self.proc.pid})")
 
@@ -75,7 +133,7 @@ class ManagedProcess:
             return False
         return self.proc.poll() is None
 
-    def stop(self) -> None:
+    def stop(self) -> bool:
         if self.proc and self.is_alive():
             self.proc.terminate()
             try:
@@ -84,20 +142,213 @@ class ManagedProcess:
                 self.proc.kill()
         ts = datetime.now().strftime("%H:%M:%S")
         print(f"[{ts}] STOPPED  {self.name}")
+        return True
+
+    def status(self) -> dict:
+        alive = self.is_alive()
+        info  = {
+            "name":           self.name,
+            "up":             alive,
+            "pid":            self.proc.pid if alive else None,
+            "uptime_seconds": round(time.time() - self.started_at, 1) if alive else 0,
+            "restarts":       self.restarts,
+        }
+        if alive:
+            info.update(read_proc_stats(self.proc.pid) or {})
+        return info
+
+
+class InProcessService:
+    """A service running on a daemon thread of the orchestrator (thread mode)."""
+
+    def __init__(self, name: str, script: str, module: str, attr: str, kind: str):
+        self.name       = name
+        self.script     = script
+        self.module     = module
+        self.attr       = attr
+        self.kind       = kind
+        self.thread: threading.Thread | None = None
+        self.restarts   = 0
+        self.started_at = 0.0
+        self.exit_code  = None    # repr of the exception that ended the last run
+        self._stop      = None
+
+    def _main(self, stop_event: threading.Event) -> None:
+        try:
+            target = getattr(importlib.import_module(self.module), self.attr)
+            if self.kind == "watcher":
+                watcher    = target()
+                self._stop = watcher.stop
+                watcher.run()
+            else:
+                self._stop = stop_event.set
+                target(stop_event)
+        except BaseException as exc:   # SystemExit/KeyboardInterrupt must not escape the thread
+            self.exit_code = repr(exc)[:120]
+            ts = datetime.now().strftime("%H:%M:%S")
+            print(f"[{ts}] ERROR    {self.name}: {self.exit_code}")
+            traceback.print_exc()
+
+    def start(self) -> None:
+        self.exit_code = None
+        self._stop     = None
+        self.thread    = threading.Thread(target=self._main, args=(threading.Event(),),
+                                          name=f"svc-{self.name}", daemon=True)
+        self.thread.start()
+        self.started_at = time.time()
+        ts = datetime.now().strftime("%H:%M:%S")
+        print(f"[{ts}] STARTED  {self.name}  (thread {self.thread.name})")
+
+    def is_alive(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def stop(self) -> bool:
+        """False when the thread is still running after STOP_TIMEOUT."""
+        if self.is_alive():
+            if self._stop is not None:
+                self._stop()
+            self.thread.join(timeout=STOP_TIMEOUT)
+        ts = datetime.now().strftime("%H:%M:%S")
+        if self.is_alive():
+            print(f"[{ts}] STUCK    {self.name}  (still running after {STOP_TIMEOUT}s)")
+            return False
+        print(f"[{ts}] STOPPED  {self.name}")
+        return True
+
+    def status(self) -> dict:
+        alive = self.is_alive()
+        return {
+            "name":           self.name,
+            "up":             alive,
+            "pid":            os.getpid() if alive else None,
+            "uptime_seconds": round(time.time() - self.started_at, 1) if alive else 0,
+            "restarts":       self.restarts,
+            "mode":           "thread",
+        }
+
+
+Service = ManagedProcess | InProcessService
+
+
+def build_services(mode: str) -> list[Service]:
+    if mode == "thread":
+        return [InProcessService(n, s, *IN_PROCESS[n]) for n, s, _ in SERVICES]
+    return [ManagedProcess(n, s, a) for n, s, a in SERVICES]
+
+
+# ── Status endpoint ───────────────────────────────────────────────────────────
+
+def render_metrics(services: list[Service], supervisor: Supervisor, started_at: float) -> str:
+    """Prometheus text for /metrics."""
+    lines = [
+        "# HELP platinum_orchestrator_uptime_seconds Seconds since the orchestrator started.",
+        "# TYPE platinum_orchestrator_uptime_seconds gauge",
+        f"platinum_orchestrator_uptime_seconds {time.time() - started_at:.1f}",
+    ]
+    own = read_proc_stats(os.getpid())
+    if own:
+        lines += [
+            "# HELP platinum_orchestrator_rss_bytes Resident memory of the orchestrator process.",
+            "# TYPE platinum_orchestrator_rss_bytes gauge",
+            f"platinum_orchestrator_rss_bytes {own['rss_bytes']}",
+        ]
+    stats   = [service_status(svc, supervisor) for svc in services]
+    gauges  = [
+        ("up",                  "gauge",   "1 if the service process is running.",    "up"),
+        ("pid",                 "gauge",   "PID of the service process.",             "pid"),
+        ("uptime_seconds",      "gauge",   "Seconds since the service last started.", "uptime_seconds"),
+        ("restarts_total",      "counter", "Restarts since the orchestrator started.", "restarts"),
+        ("rss_bytes",           "gauge",   "Resident memory of the service process.", "rss_bytes"),
+        ("cpu_seconds_total",   "counter", "User+system CPU time of the process.",    "cpu_seconds"),
+        ("fatal",               "gauge",   "1 if the restart budget is exhausted.",   "fatal"),
+    ]
+    for metric, kind, help_text, key in gauges:
+        name = f"platinum_service_{metric}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        for st in stats:
+            value = st.get(key)
+            if value is None:
+                continue
+            lines.append(f'{name}{{service="{st["name"]}"}} {int(value) if isinstance(value, bool) else value}')
+
+    lines += [
+        "# HELP platinum_queue_depth Task files waiting in each folder.",
+        "# TYPE platinum_queue_depth gauge",
+    ]
+    for queue, path in QUEUE_DIRS.items():
+        lines.append(f'platinum_queue_depth{{queue="{queue}"}} {count_files(path)}')
+
+    histograms = merge_prom_files(sorted(glob.glob(os.path.join(METRICS_DIR, "*.prom"))))
+    return "\n".join(lines) + "\n" + histograms
+
+
+def service_status(svc: Service, supervisor: Supervisor) -> dict:
+    info = svc.status()
+    info.update(supervisor.describe(svc.name))
+    info["fatal"] = info["state"] == FATAL
+    return info
+
+
+def build_status_server(services: list[Service], supervisor: Supervisor,
+                        lock: threading.Lock, log: AuditLogger, started_at: float) -> StatusServer:
+    server  = StatusServer(HTTP_HOST, HTTP_PORT, token=HTTP_TOKEN)
+    by_name = {svc.name: svc for svc in services}
+
+    def healthz(match, body):
+        up     = {svc.name: svc.is_alive() for svc in services if os.path.exists(svc.script)}
+        status = "ok" if all(up.values()) else "degraded"
+        payload = {"status": status, "uptime_seconds": round(time.time() - started_at, 1),
+                   "services": up,
+                   "states": {svc.name: supervisor.describe(svc.name)["state"] for svc in services}}
+        return (200 if status == "ok" else 503), "application/json", json.dumps(payload)
+
+    def metrics(match, body):
+        return 200, "text/plain; version=0.0.4", render_metrics(services, supervisor, started_at)
+
+    def list_services(match, body):
+        return 200, "application/json", json.dumps([service_status(svc, supervisor) for svc in services])
+
+    def restart(match, body):
+        svc = by_name.get(match.group(1))
+        if svc is None:
+            return 404, "application/json", json.dumps({"error": "unknown service"})
+        with lock:
+            if not svc.stop():
+                # Starting another copy would run two beside each other
+                log.log_error(SKILL, f"restart_{svc.name}", f"still running after {STOP_TIMEOUT}s")
+                return 409, "application/json", json.dumps({"error": "service did not stop"})
+            svc.restarts += 1
+            svc.start()
+            supervisor.reset(svc.name)   # manual restart also clears FATAL
+        log.log(SKILL, f"restart_{svc.name}", "success", detail="requested via HTTP")
+        return 202, "application/json", json.dumps(service_status(svc, supervisor))
+
+    server.route("GET",  r"/healthz", healthz)
+    server.route("GET",  r"/metrics", metrics)
+    server.route("GET",  r"/services", list_services)
+    server.route("POST", r"/services/([\w-]+)/restart", restart)
+    return server
 
 
 # ── Orchestrator ──────────────────────────────────────────────────────────────
 
-def run() -> None:
+def run(mode: str = MODE) -> None:
     os.makedirs(LOGS_DIR, exist_ok=True)
-    log      = AuditLogger()
-    services = [ManagedProcess(n, s, a) for n, s, a in SERVICES]
+    log        = AuditLogger()
+    services   = build_services(mode)
+    supervisor = Supervisor(SKILL, log, base_delay=RESTART_DELAY)
+    lock       = threading.Lock()   # main loop vs. HTTP restart requests
+    started_at = time.time()
+    server     = None
 
     # Handle Ctrl+C / SIGTERM gracefully
     def shutdown(sig, frame):
         print("\n[Orchestrator] Shutting down...")
-        for svc in services:
-            svc.stop()
+        if server is not None:
+            server.stop()
+        with lock:
+            for svc in services:
+                svc.stop()
         log.log(SKILL, "orchestrator_stop", "success")
         sys.exit(0)
 
@@ -105,10 +356,11 @@ def run() -> None:
     signal.signal(signal.SIGTERM, shutdown)
 
     # Initial start
-    print(f"[Orchestrator] Platinum Cloud starting {len(services)} services...")
-    log.log(SKILL, "orchestrator_start", "success", detail=f"{len(services)} services")
+    print(f"[Orchestrator] Platinum Cloud starting {len(services)} services ({mode} mode)...")
+    log.log(SKILL, "orchestrator_start", "success", detail=f"{len(services)} services mode={mode}")
 
     for svc in services:
+        supervisor.add(svc)
         if os.path.exists(svc.script):
             svc.start()
             log.log(SKILL, f"start_{svc.name}", "success")
@@ -116,27 +368,22 @@ def run() -> None:
             print(f"[Orchestrator] WARNING: {svc.script} not found — skipping {svc.name}")
             log.log(SKILL, f"start_{svc.name}", "skipped", detail="script not found")
 
-    # Monitor loop
-    while True:
-        time.sleep(POLL_INTERVAL)
-
-        for svc in services:
-            if not os.path.exists(svc.script):
-                continue
-
-            if not svc.is_alive():
-                svc.restarts += 1
-                ts = datetime.now().strftime("%H:%M:%S")
-                print(f"[{ts}] CRASHED  {svc.name}  (restart #{svc.restarts} in {RESTART_DELAY}s)")
-                log.log(SKILL, f"crash_{svc.name}", "restarting",
-                        detail=f"restart #{svc.restarts}")
-
-                time.sleep(RESTART_DELAY)
+    if HTTP_PORT:
+        server = build_status_server(services, supervisor, lock, log, started_at)
+        if server.start():
+            print(f"[Orchestrator] Status endpoint on http://{HTTP_HOST}:{server.port}")
+            log.log(SKILL, "status_server", "success", detail=f"{HTTP_HOST}:{server.port}")
+        else:
+            print(f"[Orchestrator] WARNING: status endpoint disabled — {server.error}")
+            log.log_error(SKILL, "status_server", str(server.error))
+            server = None
 
-                svc.start()
-                log.log(SKILL, f"restart_{svc.name}", "success",
-                        detail=f"restart #{svc.restarts}")
+    # Monitor loop — one crashing service never delays checks on the others
+    while True:
+        with lock:
+            supervisor.tick()
+        time.sleep(supervisor.sleep_for(POLL_INTERVAL))
 
 
 if __name__ == "__main__":
-    run()
+    run("thread" if "--in-process" in sys.argv else MODE)
@@ -14,7 +14,6 @@ Usage:
 
 import os
 import sys
-import re
 from datetime import datetime
 
 CLOUD_DIR    = os.path.dirname(os.path.abspath(__file__))
@@ -23,11 +22,15 @@ PLATINUM_DIR = os.path.dirname(CLOUD_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.metrics import timed
+from Shared.signal_bus import SignalBus
+from Shared.sync_trigger import notify
+from Shared.task_file import TaskFile, load, parse
 
 PENDING_DIR = os.path.join(PLATINUM_DIR, "Pending_Approval", "cloud")
-SIGNALS_DIR = os.path.join(PLATINUM_DIR, "Signals")
 
-SKILL = "SocialDrafter_Platinum"
+SKILL   = "SocialDrafter_Platinum"
+SIGNALS = SignalBus(SKILL)
 
 # Platform character limits
 CHAR_LIMITS = {
@@ -40,28 +43,17 @@ CHAR_LIMITS = {
 
 # ── Draft generation ──────────────────────────────────────────────────────────
 
-def extract_social_info(content: str) -> dict:
+def extract_social_info(content: str | TaskFile) -> dict:
     """Parse task file for social post metadata."""
-    info = {}
-
-    for key, pattern in [
-        ("platform",  r"\*\*Platform:\*\*\s*(.+)"),
-        ("tone",      r"\*\*Tone:\*\*\s*(.+)"),
-        ("topic",     r"\*\*Topic:\*\*\s*(.+)"),
-        ("hashtags",  r"\*\*Hashtags:\*\*\s*(.+)"),
-    ]:
-        m = re.search(pattern, content, re.IGNORECASE)
-        info[key] = m.group(1).strip() if m else ""
+    task = parse(content)
+    info = {key: task.field(key) for key in ("platform", "tone", "topic", "hashtags")}
 
     # Extract request/brief
-    brief_match = re.search(r"## Brief\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
-    if not brief_match:
-        brief_match = re.search(r"## Message\s*\n(.*?)(?=\n##|\Z)", content, re.DOTALL)
-    info["brief"] = brief_match.group(1).strip() if brief_match else ""
+    info["brief"] = task.section("brief", "message")
 
     # Detect platform from content if not explicit
     if not info["platform"]:
-        lower = content.lower()
+        lower = task.text.lower()
         for p in ["twitter", "instagram", "facebook", "linkedin"]:
             if p in lower:
                 info["platform"] = p
@@ -189,24 +181,16 @@ def create_approval_file(task_filepath: str, info: dict, drafts: dict, log: Audi
 
 
 def write_signal(task_id: str, approval_file: str) -> None:
-    os.makedirs(SIGNALS_DIR, exist_ok=True)
-    ts       = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sig_file = os.path.join(SIGNALS_DIR, f"SIGNAL_{ts}_social_approval.md")
-    content  = (
-        f"signal: approval_needed\n"
-        f"task_id: {task_id}\n"
-        f"approval_file: {approval_file}\n"
-        f"timestamp: {datetime.now().isoformat()}\n"
-    )
-    with open(sig_file, "w", encoding="utf-8") as f:
-        f.write(content)
+    SIGNALS.emit("approval_needed", task_id=task_id, approval_file=approval_file)
+    notify(SKILL)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
 
-def run(task_filepath: str) -> None:
+def run(task_filepath: str) -> bool:
+    """Draft posts for one task; False when the task could not be drafted."""
     log   = AuditLogger()
-    start = datetime.now()
+    timer = timed(SKILL, "draft_created")
     task  = os.path.basename(task_filepath)
 
     log.log(SKILL, "draft_start", "STARTED", task_id=task)
@@ -214,27 +198,25 @@ def run(task_filepath: str) -> None:
 
     if not os.path.exists(task_filepath):
         log.log_error(SKILL, "draft_start", f"File not found: {task_filepath}", task_id=task)
-        return
-
-    with open(task_filepath, "r", encoding="utf-8") as f:
-        content = f.read()
+        return False
 
-    info   = extract_social_info(content)
+    info   = extract_social_info(load(task_filepath))
     drafts = generate_draft_post(info)
 
     approval_path = create_approval_file(task_filepath, info, drafts, log)
     write_signal(task, approval_path)
 
-    duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+    duration_ms = timer.stop()
     platforms   = list(drafts.keys())
     print(f"[{SKILL}] DRAFT CREATED -> {os.path.basename(approval_path)}  [{', '.join(platforms)}]")
     log.log(SKILL, "draft_created", "pending_approval",
             duration_ms=duration_ms, task_id=task,
             detail=f"platforms={platforms}")
+    return True
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print(f"Usage: python {sys.argv[0]} <task_filepath>")
         sys.exit(1)
-    run(sys.argv[1])
+    sys.exit(0 if run(sys.argv[1]) else 1)
@@ -10,15 +10,39 @@ Phase 1 bridge between Cloud and Local:
 Skips push if nothing changed.
 Logs every action via AuditLogger.
 
+Modes (SYNC_MODE):
+  incremental — default. `git ls-remote` first and pull only when the
+                remote branch moved; `git status` limited to Platinum/
+                (untracked cache, optional fsmonitor); stage exactly the
+                changed paths; refs resolved by one long-lived
+                `git cat-file --batch-check`. Cheap enough for
+                SYNC_INTERVAL=30.
+  full        — pull, status, add Platinum/, commit, push every cycle.
+
+Triggers (SYNC_TRIGGER=1, default): drafters and watchers call
+Shared.sync_trigger.notify() after writing for Local; the loop syncs
+SYNC_DEBOUNCE seconds after the first request instead of waiting out
+SYNC_INTERVAL, which stays as the safety net.
+
+Transport (SYNC_TRANSPORT): with `rsync` or `socket`, hot paths
+(Signals/, Pending_Approval/cloud/) go straight to Local on every
+cycle via Shared.sync_transport — only files whose sha256 changed since
+the last delivery — and are kept out of git. The git cycle then runs
+every SYNC_SNAPSHOT_INTERVAL as the audit snapshot of everything else.
+`git` (default) keeps every file on git.
+
 Run:
   python Cloud/sync_agent.py          # single sync
-  python Cloud/sync_agent.py --loop   # continuous (every 5 min)
+  python Cloud/sync_agent.py --loop   # continuous (every SYNC_INTERVAL s)
+  python Cloud/sync_agent.py --full   # force the full cycle
 """
 
 import os
 import sys
-import subprocess
+import json
 import time
+import subprocess
+import threading
 from datetime import datetime
 
 CLOUD_DIR    = os.path.dirname(os.path.abspath(__file__))
@@ -28,10 +52,37 @@ VAULT_ROOT   = os.path.dirname(PLATINUM_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.metrics import timed
 from Shared.retry_handler import with_retry
+from Shared.sync_transport import (
+    HOT_PATHS, RsyncTransport, SocketTransport, Transport, TransportError,
+    build_manifest, ensure_git_excluded, tracked_hot_paths, untrack_hot_paths,
+)
+from Shared.sync_trigger import SyncTrigger
 
 SKILL          = "SyncAgent_Platinum"
-SYNC_INTERVAL  = 300   # 5 minutes
+SYNC_INTERVAL  = int(os.environ.get("SYNC_INTERVAL", "300"))   # seconds
+SYNC_MODE      = os.environ.get("SYNC_MODE", "incremental")    # incremental | full
+SYNC_TRIGGER   = os.environ.get("SYNC_TRIGGER", "1") == "1"    # sync on notify()
+SYNC_PATHS     = ["Platinum/"]                                 # what Cloud commits
+REMOTE         = "origin"
+BRANCH         = "main"
+
+# Faster `git status`: cache untracked-dir scans; fsmonitor (git >= 2.37
+# on Linux) also skips stat()ing unchanged files — opt in, it runs a daemon
+STATUS_CONFIG = ["-c", "core.untrackedCache=true"]
+if os.environ.get("SYNC_FSMONITOR", "0") == "1":
+    STATUS_CONFIG += ["-c", "core.fsmonitor=true"]
+
+# Direct transport for hot paths (git | rsync | socket)
+TRANSPORTS        = ("git", "rsync", "socket")
+SYNC_TRANSPORT    = os.environ.get("SYNC_TRANSPORT", "git")
+SNAPSHOT_INTERVAL = int(os.environ.get("SYNC_SNAPSHOT_INTERVAL", "900"))   # git cadence beside a transport
+RSYNC_TARGET      = os.environ.get("SYNC_RSYNC_TARGET", "")                # user@host:/path/to/vault/
+RSYNC_SSH         = os.environ.get("SYNC_RSYNC_SSH", "ssh -o BatchMode=yes")
+SOCKET_ADDR       = os.environ.get("SYNC_SOCKET_ADDR", "127.0.0.1:8790")   # host:port or unix:/path
+SYNC_TOKEN        = os.environ.get("SYNC_TOKEN", "")
+STATE_DIR         = os.path.join(PLATINUM_DIR, "Logs", "sync_state")
 
 # Commit author shown in git log
 GIT_AUTHOR_NAME  = os.environ.get("GIT_AUTHOR_NAME",  "Platinum Cloud Agent")
@@ -40,7 +91,9 @@ GIT_AUTHOR_EMAIL = os.environ.get("GIT_AUTHOR_EMAIL", "cloud@ai-employee.local")
 
 # ── Git helpers ───────────────────────────────────────────────────────────────
 
-def _run_git(args: list[str], cwd: str) -> tuple[int, str, str]:
+def _run_git(
+    args: list[str], cwd: str, input: str | None = None, strip: bool = True,
+) -> tuple[int, str, str]:
     """Run a git command, return (returncode, stdout, stderr)."""
     env = os.environ.copy()
     env["GIT_AUTHOR_NAME"]     = GIT_AUTHOR_NAME
@@ -52,13 +105,15 @@ def _run_git(args: list[str], cwd: str) -> tuple[int, str, str]:
         ["git"] + args,
         cwd=cwd,
         capture_output=True,
+        input=input,
         text=True,
         encoding="utf-8",
         errors="replace",
         timeout=60,
         env=env,
     )
-    return result.returncode, result.stdout.strip(), result.stderr.strip()
+    out = result.stdout.strip() if strip else result.stdout
+    return result.returncode, out, result.stderr.strip()
 
 
 @with_retry(max_attempts=3, delay=10.0, exceptions=(subprocess.SubprocessError, OSError))
@@ -95,11 +150,131 @@ def git_push(cwd: str) -> str:
     return out or "pushed"
 
 
+# ── Incremental helpers ───────────────────────────────────────────────────────
+
+class GitCatFile:
+    """
+    One long-lived `git cat-file --batch-check` process: resolve(rev)
+    answers over a pipe instead of spawning `git rev-parse` each time.
+    Restarted transparently if it dies.
+    """
+
+    def __init__(self, cwd: str):
+        self.cwd   = cwd
+        self._proc: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch-check"],
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+        return self._proc
+
+    def resolve(self, rev: str) -> str | None:
+        """Object id for rev, or None if it doesn't exist."""
+        with self._lock:
+            for _ in range(2):
+                proc = self._proc
+                if proc is None or proc.poll() is not None:
+                    proc = self._start()
+                try:
+                    proc.stdin.write(f"{rev}\n")
+                    proc.stdin.flush()
+                    line = proc.stdout.readline()
+                except (BrokenPipeError, OSError):
+                    line = ""
+                if line:
+                    parts = line.split()
+                    # "<oid> <type> <size>"  or  "<rev> missing"
+                    return parts[0] if len(parts) == 3 else None
+                self._close()
+            return None
+
+    def _close(self) -> None:
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+
+def git_remote_head(cwd: str) -> str | None:
+    """Remote branch tip via `git ls-remote` (no fetch, no object transfer)."""
+    code, out, err = _run_git(["ls-remote", REMOTE, f"refs/heads/{BRANCH}"], cwd)
+    if code != 0:
+        raise subprocess.SubprocessError(f"git ls-remote failed: {err}")
+    return out.split()[0] if out else None
+
+
+def git_dirty_paths(cwd: str, pathspec: list[str] = SYNC_PATHS) -> list[str]:
+    """Changed / new / deleted paths under pathspec, ready for `git add -A`."""
+    code, out, err = _run_git(
+        STATUS_CONFIG + ["status", "--porcelain=v1", "-z", "--untracked-files=all", "--", *pathspec],
+        cwd, strip=False,
+    )
+    if code != 0:
+        raise subprocess.SubprocessError(f"git status failed: {err}")
+    # Entries are "XY path\0", followed by "orig\0" for renames / copies.
+    # A rename is already staged, so its source is gone from the index too —
+    # skip it (`git add` rejects a pathspec that matches nothing)
+    entries = out.split("\0")
+    paths, i = [], 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if len(entry) < 4:
+            continue
+        paths.append(entry[3:])
+        if entry[0] in "RC":
+            i += 1
+    return paths
+
+
+def git_commit_paths(cwd: str, paths: list[str]) -> str:
+    """Stage exactly `paths` and commit them; returns the commit summary."""
+    code, _, err = _run_git(
+        ["add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        cwd, input="\0".join(paths),
+    )
+    if code != 0:
+        raise subprocess.SubprocessError(f"git add failed: {err}")
+
+    ts      = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    message = f"[cloud-sync] auto-sync {ts}"
+    code, out, err = _run_git(["commit", "-m", message], cwd)
+    if code != 0:
+        if "nothing to commit" in out or "nothing to commit" in err:
+            return "nothing to commit"
+        raise subprocess.SubprocessError(f"git commit failed: {err}")
+    return out.splitlines()[0] if out else "committed"
+
+
+@with_retry(max_attempts=3, delay=10.0, exceptions=(subprocess.SubprocessError, OSError))
+def git_push_branch(cwd: str) -> str:
+    code, out, err = _run_git(["push", REMOTE, BRANCH], cwd)
+    if code != 0:
+        raise subprocess.SubprocessError(f"git push failed: {err}")
+    lines = (out or err).splitlines()
+    return lines[-1] if lines else "pushed"
+
+
 # ── Sync cycle ────────────────────────────────────────────────────────────────
 
 def sync_once(log: AuditLogger) -> None:
     ts    = datetime.now().strftime("%H:%M:%S")
-    start = datetime.now()
+    timer = timed(SKILL, "git_push")
 
     print(f"[{ts}] SYNC START")
 
@@ -122,7 +297,7 @@ def sync_once(log: AuditLogger) -> None:
     # 3. Push new Cloud output
     try:
         push_result = git_push(VAULT_ROOT)
-        duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+        duration_ms = timer.stop()
         print(f"[{ts}] PUSH: {push_result}")
         log.log(SKILL, "git_push", "success", duration_ms=duration_ms, detail=push_result[:60])
     except Exception as exc:
@@ -130,21 +305,261 @@ def sync_once(log: AuditLogger) -> None:
         log.log_error(SKILL, "git_push", str(exc))
 
 
-# ── Entry point ───────────────────────────────────────────────────────────────
+class IncrementalSync:
+    """
+    Change-aware sync cycle. Keeps the remote tip it last pulled and a
+    cat-file helper between cycles, so a cycle with nothing to do costs
+    one `ls-remote` and one path-limited `status`.
+    """
+
+    def __init__(self, cwd: str = VAULT_ROOT):
+        self.cwd     = cwd
+        self.refs    = GitCatFile(cwd)
+        self._pulled: str | None = None     # remote tip as of our last good pull / push
+
+    def sync(self, log: AuditLogger) -> None:
+        ts    = datetime.now().strftime("%H:%M:%S")
+        timer = timed(SKILL, "sync")
+
+        # 1. Pull only if the remote branch moved since our last pull
+        try:
+            remote = git_remote_head(self.cwd)
+            if remote is None or remote != self._pulled:
+                pull_result = git_pull(self.cwd)
+                self._pulled = remote
+                print(f"[{ts}] PULL: {pull_result}")
+                log.log(SKILL, "git_pull", "success", detail=pull_result[:60])
+        except Exception as exc:
+            print(f"[{ts}] PULL ERROR: {exc}")
+            log.log_error(SKILL, "git_pull", str(exc))
+            return   # don't push if pull failed (risk of conflict)
+
+        # 2. What changed under Platinum/, and is a previous commit unpushed?
+        try:
+            paths = git_dirty_paths(self.cwd)
+        except Exception as exc:
+            print(f"[{ts}] STATUS ERROR: {exc}")
+            log.log_error(SKILL, "git_status", str(exc))
+            return
+        ahead = self.refs.resolve("HEAD") != self.refs.resolve(f"refs/remotes/{REMOTE}/{BRANCH}")
+        if not paths and not ahead:
+            print(f"[{ts}] SYNC: nothing to push")
+            return
+
+        # 3. Commit exactly those paths, then push (a failed push is retried
+        #    next cycle via `ahead`)
+        try:
+            if paths:
+                commit = git_commit_paths(self.cwd, paths)
+                print(f"[{ts}] COMMIT: {len(paths)} path(s) — {commit}")
+            push_result = git_push_branch(self.cwd)
+            # The remote tip is now our HEAD — don't pull our own push back next cycle
+            self._pulled = self.refs.resolve("HEAD")
+            duration_ms = timer.stop()
+            print(f"[{ts}] PUSH: {push_result}")
+            log.log(SKILL, "git_push", "success", duration_ms=duration_ms,
+                    detail=f"paths={len(paths)} {push_result[:40]}")
+        except Exception as exc:
+            print(f"[{ts}] PUSH ERROR: {exc}")
+            log.log_error(SKILL, "git_push", str(exc))
+
+    def close(self) -> None:
+        self.refs.close()
+
+
+# ── Direct transport ──────────────────────────────────────────────────────────
+
+def make_transport(name: str = SYNC_TRANSPORT) -> Transport | None:
+    """Transport for hot paths, or None when git carries everything."""
+    if name == "git":
+        return None
+    if name == "rsync":
+        if not RSYNC_TARGET:
+            raise ValueError("SYNC_TRANSPORT=rsync needs SYNC_RSYNC_TARGET")
+        return RsyncTransport(RSYNC_TARGET, ssh=RSYNC_SSH)
+    if name == "socket":
+        return SocketTransport(SOCKET_ADDR, token=SYNC_TOKEN)
+    raise ValueError(f"Unknown SYNC_TRANSPORT '{name}' — use one of {TRANSPORTS}")
+
+
+class HotPathSync:
+    """
+    Delivers hot-path files through a Transport, diffing sha256 manifests
+    against what was last delivered (kept in Logs/sync_state/, so a
+    restart doesn't resend everything).
+
+    When the transport can list the receiver's files, a delivered file
+    that is gone there and unchanged here was consumed by Local (merged
+    signal, handled approval) and is removed here as well — what the git
+    round-trip used to do. A receiver with a new id (fresh clone) gets
+    everything resent instead.
+    """
+
+    def __init__(self, transport: Transport, root: str = VAULT_ROOT,
+                 paths: list[str] = HOT_PATHS, state_dir: str = STATE_DIR):
+        self.transport  = transport
+        self.root       = root
+        self.paths      = paths
+        self.state_file = os.path.join(state_dir, f"manifest_{transport.name}.json")
+        self.receiver, self.sent = self._load()
+
+    def _load(self) -> tuple[str | None, dict[str, str]]:
+        try:
+            with open(self.state_file, encoding="utf-8") as f:
+                state = json.load(f)
+            return state.get("receiver"), dict(state.get("files", {}))
+        except (OSError, ValueError):
+            return None, {}
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+        tmp = self.state_file + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"receiver": self.receiver, "files": self.sent}, f)
+        os.replace(tmp, self.state_file)
+
+    def sync(self, log: AuditLogger) -> None:
+        ts      = datetime.now().strftime("%H:%M:%S")
+        timer   = timed(SKILL, "transport_push")
+        name    = self.transport.name
+        current = build_manifest(self.root, self.paths)
+
+        try:
+            remote = self.transport.remote_manifest()
+        except TransportError as exc:
+            print(f"[{ts}] {name.upper()} ERROR: {exc}")
+            log.log_error(SKILL, "transport_push", str(exc))
+            return
+
+        consumed = []
+        if remote is not None:
+            receiver = getattr(self.transport, "remote_id", None)
+            if receiver != self.receiver:
+                self.receiver, self.sent = receiver, {}
+            for rel, sha in list(self.sent.items()):
+                if rel not in remote and current.get(rel) == sha:
+                    try:
+                        os.remove(os.path.join(self.root, *rel.split("/")))
+                    except FileNotFoundError:
+                        pass
+                    consumed.append(rel)
+                    del self.sent[rel]
+                    del current[rel]
+
+        changed = [rel for rel, sha in current.items()
+                   if self.sent.get(rel) != sha and (remote is None or remote.get(rel) != sha)]
+        deleted = [rel for rel in self.sent if rel not in current]
+
+        if changed or deleted:
+            try:
+                self.transport.push(self.root, changed, deleted)
+            except TransportError as exc:
+                print(f"[{ts}] {name.upper()} ERROR: {exc}")
+                log.log_error(SKILL, "transport_push", str(exc))
+                if consumed:
+                    self._save()
+                return
+        elif not consumed:
+            return
+
+        self.sent = current
+        self._save()
+        duration_ms = timer.stop()
+        detail      = f"{name} sent={len(changed)} deleted={len(deleted)} consumed={len(consumed)}"
+        print(f"[{ts}] {name.upper()}: {detail}")
+        log.log(SKILL, "transport_push", "success", duration_ms=duration_ms, detail=detail)
+
+    def close(self) -> None:
+        self.transport.close()
 
-if __name__ == "__main__":
-    loop = "--loop" in sys.argv
-    log  = AuditLogger()
 
-    if loop:
-        print(f"[{SKILL}] Starting loop — sync every {SYNC_INTERVAL}s")
-        log.log(SKILL, "sync_start", "success", detail=f"interval={SYNC_INTERVAL}s")
-        while True:
+# ── Entry point ───────────────────────────────────────────────────────────────
+
+def hot_paths_ready(log: AuditLogger) -> bool:
+    """
+    Exclude the hot paths from git; refuse a direct transport while git
+    still tracks files there — Local's receiver would overwrite tracked
+    files and its next `git pull` would conflict.
+    """
+    ensure_git_excluded(VAULT_ROOT, HOT_PATHS)
+    tracked = tracked_hot_paths(VAULT_ROOT, HOT_PATHS)
+    if not tracked:
+        return True
+    log.log_error(SKILL, "sync_start", f"{len(tracked)} hot-path files tracked by git")
+    print(f"[{SKILL}] ERROR: {len(tracked)} file(s) under {', '.join(HOT_PATHS)} are tracked by git.")
+    print(f"  Stop sync on both sides, then run once on each:")
+    print(f"    Cloud: python Cloud/sync_agent.py --untrack-hot-paths && git push")
+    print(f"    Local: python Local/sync_receiver.py --untrack-hot-paths && git pull")
+    return False
+
+
+def run_loop(stop: threading.Event | None = None, mode: str = SYNC_MODE) -> None:
+    """
+    Sync on every trigger request (debounced) and at least every
+    SYNC_INTERVAL seconds, until stop is set (orchestrator thread mode).
+    With a direct transport, hot paths go every cycle and git every
+    SNAPSHOT_INTERVAL.
+    """
+    stop      = stop or threading.Event()
+    log       = AuditLogger()
+    transport = make_transport()
+    if transport is not None and not hot_paths_ready(log):
+        transport.close()
+        return
+    inc       = IncrementalSync() if mode == "incremental" else None
+    hot       = HotPathSync(transport) if transport else None
+    trigger   = SyncTrigger() if SYNC_TRIGGER else None
+    wakeup    = f"trigger={trigger.backend}" if trigger else "trigger=off"
+    print(f"[{SKILL}] Starting loop — {mode} sync every {SYNC_INTERVAL}s, "
+          f"transport={SYNC_TRANSPORT}, {wakeup}")
+    log.log(SKILL, "sync_start", "success",
+            detail=f"mode={mode} interval={SYNC_INTERVAL}s transport={SYNC_TRANSPORT} {wakeup}")
+    next_snapshot = 0.0
+    try:
+        while not stop.is_set():
             try:
-                sync_once(log)
+                if hot is not None:
+                    hot.sync(log)
+                if hot is None or time.monotonic() >= next_snapshot:
+                    next_snapshot = time.monotonic() + SNAPSHOT_INTERVAL
+                    if inc is not None:
+                        inc.sync(log)
+                    else:
+                        sync_once(log)
             except Exception as exc:
                 log.log_error(SKILL, "sync_loop", str(exc))
                 print(f"[{SKILL}] ERROR: {exc}")
-            time.sleep(SYNC_INTERVAL)
+            if trigger is None:
+                stop.wait(SYNC_INTERVAL)
+            elif trigger.wait(SYNC_INTERVAL, stop):
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] TRIGGER: sync requested")
+    finally:
+        if inc is not None:
+            inc.close()
+        if hot is not None:
+            hot.close()
+        if trigger is not None:
+            trigger.close()
+
+
+if __name__ == "__main__":
+    mode = "full" if "--full" in sys.argv else SYNC_MODE
+    if "--untrack-hot-paths" in sys.argv:
+        ensure_git_excluded(VAULT_ROOT, HOT_PATHS)
+        untracked = untrack_hot_paths(VAULT_ROOT, HOT_PATHS)
+        print(f"[{SKILL}] Untracked {len(untracked)} hot-path file(s) — push this commit")
+    elif "--loop" in sys.argv:
+        run_loop(mode=mode)
     else:
-        sync_once(log)
+        transport = make_transport()
+        if transport is not None:
+            if not hot_paths_ready(AuditLogger()):
+                transport.close()
+                sys.exit(1)
+            HotPathSync(transport).sync(AuditLogger())
+        if mode == "incremental":
+            inc = IncrementalSync()
+            inc.sync(AuditLogger())
+            inc.close()
+        else:
+            sync_once(AuditLogger())
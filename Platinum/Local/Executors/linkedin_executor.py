@@ -45,6 +45,8 @@ except ImportError:
     class AuditLogger:
         def log(self, *args, **kwargs): pass
 
+from task_file import TaskFile, load, parse
+
 
 # Configuration
 PENDING_APPROVAL = PLATINUM_ROOT / "Pending_Approval" / "linkedin"
@@ -57,21 +59,26 @@ POLL_INTERVAL = 30  # seconds
 
 # ── File Parsing ─────────────────────────────────────────────────────────────
 
-def parse_linkedin_post(content: str) -> dict:
+_WORD = re.compile(r'\w+')
+_URL  = re.compile(r'https?://\S+')
+_POST_CONTENT = re.compile(
+    r'post_content\s*:\s*["\']?(.*?)["\']?(?=\n\s*(?:visibility|approved|---|$))',
+    re.DOTALL | re.IGNORECASE
+)
+
+
+def parse_linkedin_post(content: "str | TaskFile") -> dict:
     """Extract LinkedIn post details from file content."""
+    task = parse(content)
     linkedin_data = {}
 
     # Extract post_type
-    type_match = re.search(r'post_type\s*:\s*(\w+)', content, re.IGNORECASE)
+    type_match = _WORD.match(task.value('post_type'))
     if type_match:
-        linkedin_data['post_type'] = type_match.group(1).strip()
+        linkedin_data['post_type'] = type_match.group(0)
 
-    # Extract post_content
-    content_match = re.search(
-        r'post_content\s*:\s*["\']?(.*?)["\']?(?=\n\s*(?:visibility|approved|---|$))',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    # Extract post_content (may span lines, so it keeps its own pattern)
+    content_match = _POST_CONTENT.search(task.text) if 'post_content' in task.values else None
     if content_match:
         post_content = content_match.group(1).strip()
         # Remove quotes if present
@@ -79,28 +86,28 @@ def parse_linkedin_post(content: str) -> dict:
         linkedin_data['post_content'] = post_content
 
     # Extract article_url
-    url_match = re.search(r'article_url\s*:\s*(https?://\S+)', content, re.IGNORECASE)
+    url_match = _URL.match(task.value('article_url'))
     if url_match:
-        linkedin_data['article_url'] = url_match.group(1).strip()
+        linkedin_data['article_url'] = url_match.group(0)
 
     # Extract visibility
-    vis_match = re.search(r'visibility\s*:\s*(\w+)', content, re.IGNORECASE)
+    vis_match = _WORD.match(task.value('visibility'))
     if vis_match:
-        linkedin_data['visibility'] = vis_match.group(1).strip().upper()
+        linkedin_data['visibility'] = vis_match.group(0).upper()
     else:
         linkedin_data['visibility'] = 'PUBLIC'
 
     return linkedin_data
 
 
-def is_approved(content: str) -> bool:
+def is_approved(content: "str | TaskFile") -> bool:
     """Check if post is approved."""
     # Check for approved:true or autonomous_approval:true
-    if re.search(r'approved\s*:\s*true', content, re.IGNORECASE):
-        return True
-    if re.search(r'autonomous_approval\s*:\s*true', content, re.IGNORECASE):
-        return True
-    return False
+    task = parse(content)
+    return any(
+        task.value(key).lower().startswith('true')
+        for key in ('approved', 'autonomous_approval')
+    )
 
 
 # ── LinkedIn Posting ─────────────────────────────────────────────────────────
@@ -189,17 +196,18 @@ def process_approved_post(post_file: Path, audit_logger: AuditLogger) -> bool:
 
     try:
         # Read post file
-        content = post_file.read_text(encoding='utf-8')
+        task = load(post_file)
+        content = task.text
 
         # Check if approved
-        if not is_approved(content):
+        if not is_approved(task):
             print(f"  ⚠ Not approved, skipping")
             return False
 
         print(f"  ✓ Post is approved")
 
         # Parse LinkedIn post data
-        linkedin_data = parse_linkedin_post(content)
+        linkedin_data = parse_linkedin_post(task)
 
         if not linkedin_data.get('post_content'):
             print(f"  ✗ No post content found")
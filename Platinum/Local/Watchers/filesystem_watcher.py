@@ -24,6 +24,7 @@ PLATINUM_DIR = os.path.dirname(LOCAL_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.base_watcher import BaseWatcher
+from Shared.metrics import timed
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 
@@ -52,7 +53,7 @@ ALLOWED_EXTENSIONS = {
 class FilesystemWatcher(BaseWatcher):
 
     def __init__(self):
-        super().__init__(SKILL, poll_seconds=POLL_SECONDS)
+        super().__init__(SKILL, poll_seconds=POLL_SECONDS, watch_dirs=[DROP_FOLDER])
         self._seen: set[str] = set()
 
     def on_start(self) -> None:
@@ -87,7 +88,7 @@ class FilesystemWatcher(BaseWatcher):
         if not os.path.exists(src):
             return
 
-        start    = datetime.now()
+        timer    = timed(self.skill, "file_to_task")
         ext      = os.path.splitext(filename)[1].lower()
         mime     = mimetypes.guess_type(filename)[0] or "unknown"
         size_kb  = os.path.getsize(src) // 1024
@@ -136,7 +137,7 @@ Original file moved to: Memory/attachments/{os.path.basename(attach_dest)}
         with open(task_path, "w", encoding="utf-8") as f:
             f.write(content)
 
-        duration_ms = int((datetime.now() - start).total_seconds() * 1000)
+        duration_ms = timer.stop()
         print(f"[{datetime.now():%H:%M:%S}] FILE->TASK  {task_name}  ({size_kb}KB)")
         self.log.log(self.skill, "file_to_task", "success",
                      duration_ms=duration_ms,
@@ -1,13 +1,19 @@
 """
 whatsapp_watcher.py — WhatsApp Watcher (Platinum Local)
 --------------------------------------------------------
-Polls Green API every 5s for incoming WhatsApp messages.
+Drains Green API notifications for incoming WhatsApp messages.
 Converts messages to task files in Platinum/Needs_Action/local/
 Uses same Green API instance as Silver/Gold (shared config).
 
 Config: read from Silver/Watchers/whatsapp_config.json
   (or set WA_INSTANCE_ID + WA_API_TOKEN in .env)
 
+Drain mode: each cycle pulls notifications back-to-back on one pooled
+keep-alive requests.Session (receive -> delete -> receive ...) until the
+queue is empty or DRAIN_MAX is reached. The wait between cycles adapts:
+FAST_POLL_SECONDS while messages keep arriving, doubling up to
+IDLE_POLL_SECONDS while the queue stays empty.
+
 Extends BaseWatcher from Shared/.
 
 Run:
@@ -27,6 +33,7 @@ VAULT_ROOT   = os.path.dirname(PLATINUM_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.base_watcher import BaseWatcher
+from Shared.metrics import timed
 
 try:
     import requests
@@ -42,8 +49,12 @@ INBOX_DIR = os.path.join(PLATINUM_DIR, "Needs_Action", "local")
 # Config: try Silver config first, then .env, then fail
 SILVER_CONFIG = os.path.join(VAULT_ROOT, "Silver", "Watchers", "whatsapp_config.json")
 
-POLL_SECONDS = 5
-SKILL        = "WA_Watcher_Platinum"
+POLL_SECONDS      = 5
+FAST_POLL_SECONDS = 1      # wait while the queue is busy
+IDLE_POLL_SECONDS = 30     # max wait once the queue has been empty for a while
+DRAIN_MAX         = 100    # notifications per cycle (bounded so stop() stays responsive)
+HTTP_TIMEOUT      = 10
+SKILL             = "WA_Watcher_Platinum"
 
 
 # ── Config ────────────────────────────────────────────────────────────────────
@@ -92,6 +103,10 @@ class WhatsAppWatcher(BaseWatcher):
         self.allowed_numbers = cfg.get("allowed_numbers", [])
         self.base_url        = f"https://api.green-api.com/waInstance{self.instance_id}"
 
+        # One keep-alive connection for every receive/delete round trip
+        self.session = requests.Session()
+        self.session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=2))
+
     def on_start(self) -> None:
         os.makedirs(INBOX_DIR, exist_ok=True)
         print(f"[{self.skill}] Instance: {self.instance_id}")
@@ -100,50 +115,64 @@ class WhatsAppWatcher(BaseWatcher):
             print(f"[{self.skill}] Allowed numbers: {self.allowed_numbers}")
 
     def poll(self) -> list[dict]:
-        """Poll one notification from Green API."""
-        url = f"{self.base_url}/receiveNotification/{self.api_token}"
-        try:
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            return [data] if data else []
-        except requests.exceptions.RequestException as e:
-            print(f"[{self.skill}] Poll error: {e}")
-            return []
+        """Drain queued notifications until empty (or DRAIN_MAX), acking each one."""
+        url   = f"{self.base_url}/receiveNotification/{self.api_token}"
+        items = []
+
+        while len(items) < DRAIN_MAX and self._running:
+            try:
+                resp = self.session.get(url, timeout=HTTP_TIMEOUT)
+                resp.raise_for_status()
+                data = resp.json()
+            except requests.exceptions.RequestException as e:
+                print(f"[{self.skill}] Poll error: {e}")
+                break
+            if not data:
+                break
+
+            # Green API serves the same head until it is deleted; if the ack
+            # fails, leave it for the next cycle instead of handling it twice
+            receipt_id = data.get("receiptId")
+            if receipt_id is not None and not self._delete(receipt_id):
+                break
+            items.append(data)
+
+        self._adapt_interval(len(items))
+        return items
+
+    def _adapt_interval(self, received: int) -> None:
+        if received:
+            self.poll_seconds = FAST_POLL_SECONDS
+        else:
+            self.poll_seconds = min(max(self.poll_seconds, FAST_POLL_SECONDS) * 2, IDLE_POLL_SECONDS)
 
     def process(self, item: dict) -> None:
-        """Handle one WhatsApp notification."""
-        receipt_id = item.get("receiptId")
-        start      = datetime.now()
+        """Handle one WhatsApp notification (already acked in poll())."""
+        timer = timed(self.skill, "msg_to_task")
 
-        try:
-            text = self._extract_text(item)
-            if text is None:
-                self.log.log(self.skill, "skip_non_text", "skipped")
-                return
-
-            phone, name = self._get_sender(item)
+        text = self._extract_text(item)
+        if text is None:
+            self.log.log(self.skill, "skip_non_text", "skipped")
+            return
 
-            if not self._is_allowed(phone):
-                print(f"[{datetime.now():%H:%M:%S}] IGNORED  +{phone} (not allowed)")
-                self.log.log(self.skill, "msg_ignored", "filtered", detail=f"+{phone}")
-                return
+        phone, name = self._get_sender(item)
 
-            filename, content = self._message_to_task(text, phone, name)
-            dest = os.path.join(INBOX_DIR, filename)
+        if not self._is_allowed(phone):
+            print(f"[{datetime.now():%H:%M:%S}] IGNORED  +{phone} (not allowed)")
+            self.log.log(self.skill, "msg_ignored", "filtered", detail=f"+{phone}")
+            return
 
-            with open(dest, "w", encoding="utf-8") as f:
-                f.write(content)
+        filename, content = self._message_to_task(text, phone, name, item.get("receiptId"))
+        dest = os.path.join(INBOX_DIR, filename)
 
-            duration_ms = int((datetime.now() - start).total_seconds() * 1000)
-            print(f"[{datetime.now():%H:%M:%S}] WA->TASK  {filename}  (from {name})")
-            self.log.log(self.skill, "msg_to_task", "success",
-                         duration_ms=duration_ms,
-                         detail=f"from={name}(+{phone})")
+        with open(dest, "w", encoding="utf-8") as f:
+            f.write(content)
 
-        finally:
-            if receipt_id is not None:
-                self._delete(receipt_id)
+        duration_ms = timer.stop()
+        print(f"[{datetime.now():%H:%M:%S}] WA->TASK  {filename}  (from {name})")
+        self.log.log(self.skill, "msg_to_task", "success",
+                     duration_ms=duration_ms,
+                     detail=f"from={name}(+{phone})")
 
     # ── Helpers ───────────────────────────────────────────────────────────────
 
@@ -176,17 +205,22 @@ class WhatsAppWatcher(BaseWatcher):
                 return True
         return False
 
-    def _delete(self, receipt_id: int) -> None:
+    def _delete(self, receipt_id: int) -> bool:
         url = f"{self.base_url}/deleteNotification/{self.api_token}/{receipt_id}"
         try:
-            requests.delete(url, timeout=10)
-        except requests.exceptions.RequestException:
-            pass
+            self.session.delete(url, timeout=HTTP_TIMEOUT).raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            print(f"[{self.skill}] Delete error: {e}")
+            return False
 
-    def _message_to_task(self, text: str, phone: str, name: str) -> tuple[str, str]:
+    def _message_to_task(self, text: str, phone: str, name: str,
+                         receipt_id: int | None = None) -> tuple[str, str]:
         ts       = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         slug     = re.sub(r"[^a-zA-Z0-9_-]", "_", name)[:30].strip("_")
-        filename = f"WA_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{slug}.md"
+        # receiptId keeps names unique when a drained burst lands in the same second
+        suffix   = f"_{receipt_id}" if receipt_id is not None else ""
+        filename = f"WA_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{slug}{suffix}.md"
 
         content = f"""# Task: WhatsApp from {name}
 
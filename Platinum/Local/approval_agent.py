@@ -25,15 +25,16 @@ PLATINUM_DIR = os.path.dirname(LOCAL_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.signal_bus import SignalBus
 
 PENDING_CLOUD_DIR = os.path.join(PLATINUM_DIR, "Pending_Approval", "cloud")
 PENDING_LOCAL_DIR = os.path.join(PLATINUM_DIR, "Pending_Approval", "local")
 DONE_DIR          = os.path.join(PLATINUM_DIR, "Done")
 FAILED_DIR        = os.path.join(PLATINUM_DIR, "Failed")
-SIGNALS_DIR       = os.path.join(PLATINUM_DIR, "Signals")
 MCP_CONFIG        = os.path.join(LOCAL_DIR, "MCP", "mcp_config.json")
 
-SKILL = "ApprovalAgent_Platinum"
+SKILL   = "ApprovalAgent_Platinum"
+SIGNALS = SignalBus(SKILL)
 
 
 # ── List pending ──────────────────────────────────────────────────────────────
@@ -111,17 +112,7 @@ def _trigger_mcp_send(filepath: str, filename: str, log: AuditLogger) -> None:
 
 
 def _write_signal(task_id: str, event: str, detail: str = "") -> None:
-    os.makedirs(SIGNALS_DIR, exist_ok=True)
-    ts       = datetime.now().strftime("%Y%m%d_%H%M%S")
-    sig_file = os.path.join(SIGNALS_DIR, f"SIGNAL_{ts}_{event}.md")
-    content  = (
-        f"signal: {event}\n"
-        f"task_id: {task_id}\n"
-        f"detail: {detail}\n"
-        f"timestamp: {datetime.now().isoformat()}\n"
-    )
-    with open(sig_file, "w", encoding="utf-8") as f:
-        f.write(content)
+    SIGNALS.emit(event, task_id=task_id, detail=detail)
 
 
 # ── Interactive mode ──────────────────────────────────────────────────────────
@@ -16,10 +16,9 @@ Usage:
 import os
 import sys
 import time
-import re
 from pathlib import Path
 from datetime import datetime
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
 
 # Add parent to path for shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent / "Shared"))
@@ -34,6 +33,9 @@ except ImportError:
         def log(self, *args, **kwargs): pass
     def retry_with_backoff(fn): return fn
 
+from keyword_matcher import KeywordMatcher
+from task_file import TaskFile, forget, load, parse
+
 
 # Configuration
 VAULT_ROOT = Path(__file__).parent.parent.parent  # personalAI root
@@ -60,10 +62,20 @@ LOW_RISK_KEYWORDS = [
     "show", "display", "check", "verify", "test"
 ]
 
+RISK_MATCHER = KeywordMatcher({
+    "high":   HIGH_RISK_KEYWORDS,
+    "medium": MEDIUM_RISK_KEYWORDS,
+    "low":    LOW_RISK_KEYWORDS,
+})
+
 # Configurable: Auto-approve medium risk tasks from trusted sources
 AUTO_APPROVE_MEDIUM = False  # Set to True for more automation
 TRUSTED_SOURCES = ["internal", "system", "scheduled"]
 
+# path -> (mtime_ns, size) right after we appended our review note; a file
+# still in that state is waiting on a human and isn't re-assessed
+_REVIEWED: Dict[str, Tuple[int, int]] = {}
+
 
 # ── Risk Assessment ──────────────────────────────────────────────────────────
 
@@ -74,7 +86,6 @@ def assess_risk(content: str, metadata: Dict[str, str]) -> Tuple[str, float, Lis
     Returns:
         (risk_level: str, confidence: float, reasons: List[str])
     """
-    content_lower = content.lower()
     reasons = []
 
     # Check for explicit risk level in metadata
@@ -84,21 +95,24 @@ def assess_risk(content: str, metadata: Dict[str, str]) -> Tuple[str, float, Lis
             reasons.append(f"Explicit risk level: {explicit_risk}")
             return explicit_risk, 1.0, reasons
 
+    # One pass over the content for all three keyword lists
+    hits = RISK_MATCHER.scan(content)
+
     # Check for high-risk keywords
-    high_risk_matches = [kw for kw in HIGH_RISK_KEYWORDS if kw in content_lower]
+    high_risk_matches = hits.get("high")
     if high_risk_matches:
         reasons.append(f"High-risk keywords: {', '.join(high_risk_matches)}")
         return "high", 0.9, reasons
 
     # Check for medium-risk keywords
-    medium_risk_matches = [kw for kw in MEDIUM_RISK_KEYWORDS if kw in content_lower]
+    medium_risk_matches = hits.get("medium")
     if medium_risk_matches:
         reasons.append(f"Medium-risk keywords: {', '.join(medium_risk_matches)}")
         confidence = 0.7 if len(medium_risk_matches) > 2 else 0.6
         return "medium", confidence, reasons
 
     # Check for low-risk keywords
-    low_risk_matches = [kw for kw in LOW_RISK_KEYWORDS if kw in content_lower]
+    low_risk_matches = hits.get("low")
     if low_risk_matches:
         reasons.append(f"Low-risk keywords: {', '.join(low_risk_matches)}")
         return "low", 0.8, reasons
@@ -144,44 +158,33 @@ def should_auto_approve(risk_level: str, confidence: float, source: str) -> Tupl
 
 # ── File Processing ──────────────────────────────────────────────────────────
 
-def parse_metadata(content: str) -> Dict[str, str]:
-    """Extract metadata from task file."""
-    metadata = {}
-
-    # Parse HTML comment metadata
-    meta_match = re.search(r'<!-- AGENT METADATA\s+(.*?)\s+-->', content, re.DOTALL)
-    if meta_match:
-        meta_text = meta_match.group(1)
-        for line in meta_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
+def parse_metadata(content: "str | TaskFile") -> Dict[str, str]:
+    """Extract metadata from task file (AGENT METADATA comment + YAML frontmatter)."""
+    return parse(content).metadata
 
-    # Parse YAML frontmatter
-    yaml_match = re.search(r'^---\s+(.*?)\s+---', content, re.DOTALL | re.MULTILINE)
-    if yaml_match:
-        yaml_text = yaml_match.group(1)
-        for line in yaml_text.split('\n'):
-            if ':' in line:
-                key, value = line.split(':', 1)
-                metadata[key.strip()] = value.strip()
 
-    return metadata
-
-
-def process_approval_request(task_file: Path, audit_logger: AuditLogger) -> bool:
+def process_approval_request(task_file: Path, audit_logger: AuditLogger) -> Optional[bool]:
     """
     Process a single approval request.
 
     Returns:
-        True if processed successfully, False otherwise
+        True if auto-approved, False if it needs a human (or failed),
+        None if skipped — already reviewed, or moved away since the glob
     """
+    try:
+        st = task_file.stat()
+    except FileNotFoundError:
+        return None     # approved by a human or moved by sync meanwhile
+    if _REVIEWED.get(str(task_file)) == (st.st_mtime_ns, st.st_size):
+        return None
+
     print(f"\n[{datetime.now():%H:%M:%S}] Processing: {task_file.name}")
 
     try:
-        # Read task file
-        content = task_file.read_text(encoding='utf-8')
-        metadata = parse_metadata(content)
+        # Read task file (parsed once per version of the file)
+        task = load(task_file)
+        content = task.text
+        metadata = parse_metadata(task)
 
         # Assess risk
         risk_level, confidence, reasons = assess_risk(content, metadata)
@@ -232,6 +235,7 @@ def process_approval_request(task_file: Path, audit_logger: AuditLogger) -> bool
             dest_file = NEEDS_ACTION / task_file.name
             dest_file.write_text(updated_content, encoding='utf-8')
             task_file.unlink()
+            forget(task_file)
 
             audit_logger.log(
                 "autonomous_approver",
@@ -260,6 +264,8 @@ def process_approval_request(task_file: Path, audit_logger: AuditLogger) -> bool
 """
             updated_content = content + review_note
             task_file.write_text(updated_content, encoding='utf-8')
+            st = task_file.stat()
+            _REVIEWED[str(task_file)] = (st.st_mtime_ns, st.st_size)
 
             audit_logger.log(
                 "autonomous_approver",
@@ -279,6 +285,7 @@ def process_approval_request(task_file: Path, audit_logger: AuditLogger) -> bool
             failed_content += f"\n\n---\n## Processing Error\n{error_msg}\n"
             failed_file.write_text(failed_content, encoding='utf-8')
             task_file.unlink()
+            forget(task_file)
 
         audit_logger.log("autonomous_approver", f"error: {task_file.name}", {"error": str(e)})
         return False
@@ -314,6 +321,8 @@ def process_once(audit_logger: AuditLogger):
 
     for task_file in sorted(task_files):
         result = process_approval_request(task_file, audit_logger)
+        if result is None:
+            continue
         if result:
             approved_count += 1
         else:
@@ -0,0 +1,82 @@
+"""
+sync_receiver.py — Direct Sync Receiver (Platinum Local)
+---------------------------------------------------------
+Local end of SYNC_TRANSPORT=socket: Cloud's sync_agent pushes new
+signals and approval drafts here within seconds, instead of via git.
+
+Only Signals/ and Pending_Approval/cloud/ are writable; every file is
+hash-checked and written atomically. Those paths are added to this
+clone's .git/info/exclude, so git stays for everything else.
+
+Cloud reaches the receiver through an SSH reverse tunnel opened from
+this PC (Local is usually behind NAT):
+
+  ssh -N -R 8790:127.0.0.1:8790 ubuntu@<VM_IP>
+
+Run:
+  python Local/sync_receiver.py      # or via watchdog.py when SYNC_TRANSPORT=socket
+
+If git still tracks files under those paths, the receiver refuses to
+start: run `python Local/sync_receiver.py --untrack-hot-paths` once (the
+Cloud side does the same), then `git pull`.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+LOCAL_DIR    = os.path.dirname(os.path.abspath(__file__))
+PLATINUM_DIR = os.path.dirname(LOCAL_DIR)
+VAULT_ROOT   = os.path.dirname(PLATINUM_DIR)
+
+sys.path.insert(0, PLATINUM_DIR)
+
+from Shared.audit_logger import AuditLogger
+from Shared.sync_transport import (
+    HOT_PATHS, SyncReceiver, ensure_git_excluded, tracked_hot_paths, untrack_hot_paths,
+)
+
+SKILL        = "SyncReceiver_Platinum"
+LISTEN_ADDR  = os.environ.get("SYNC_RECEIVER_ADDR", "127.0.0.1:8790")   # host:port or unix:/path
+SYNC_TOKEN   = os.environ.get("SYNC_TOKEN", "")
+
+
+def run() -> None:
+    log = AuditLogger()
+
+    def on_change(op: str, rel: str) -> None:
+        ts = datetime.now().strftime("%H:%M:%S")
+        print(f"[{ts}] {op.upper():<6} {rel}")
+        log.log(SKILL, f"receive_{op}", "success", task_id=os.path.basename(rel))
+
+    ensure_git_excluded(VAULT_ROOT, HOT_PATHS)
+    tracked = tracked_hot_paths(VAULT_ROOT, HOT_PATHS)
+    if tracked:
+        # Overwriting tracked files would dirty the worktree and break `git pull`
+        log.log_error(SKILL, "receiver_start", f"{len(tracked)} hot-path files tracked by git")
+        print(f"[{SKILL}] ERROR: {len(tracked)} file(s) under {', '.join(HOT_PATHS)} are tracked by git.")
+        print(f"  Stop sync on both sides, then run once:")
+        print(f"    python Local/sync_receiver.py --untrack-hot-paths && git pull")
+        return
+    receiver = SyncReceiver(VAULT_ROOT, LISTEN_ADDR, token=SYNC_TOKEN, on_change=on_change)
+    print(f"[{SKILL}] Listening on {LISTEN_ADDR} — {', '.join(HOT_PATHS)}")
+    if not SYNC_TOKEN:
+        print(f"[{SKILL}] WARNING: SYNC_TOKEN not set — any local process can write")
+    log.log(SKILL, "receiver_start", "success", detail=LISTEN_ADDR)
+    try:
+        receiver.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        receiver.close()
+        log.log(SKILL, "receiver_stop", "success")
+        print(f"[{SKILL}] Stopped.")
+
+
+if __name__ == "__main__":
+    if "--untrack-hot-paths" in sys.argv:
+        ensure_git_excluded(VAULT_ROOT, HOT_PATHS)
+        untracked = untrack_hot_paths(VAULT_ROOT, HOT_PATHS)
+        print(f"[{SKILL}] Untracked {len(untracked)} hot-path file(s) — now git pull")
+    else:
+        run()
@@ -5,8 +5,11 @@ Runs on Windows PC. Monitors Local processes:
   - Local/Watchers/whatsapp_watcher.py
   - Local/Watchers/filesystem_watcher.py
 
-Auto-restarts any crashed process.
-Also periodically merges Signals/ into Dashboard.md
+Auto-restarts any crashed process (non-blocking backoff + restart
+budget via Shared/supervisor.py; a flapping service goes FATAL and
+shows up on the Dashboard through Signals/).
+Also periodically merges new signal-bus entries (and any legacy
+Signals/SIGNAL_*.md files) into Dashboard.md
 
 Run:
   python Local/watchdog.py
@@ -25,6 +28,8 @@ PLATINUM_DIR = os.path.dirname(LOCAL_DIR)
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.signal_bus import SignalReader
+from Shared.supervisor import Supervisor
 
 SIGNALS_DIR    = os.path.join(PLATINUM_DIR, "Signals")
 DASHBOARD_FILE = os.path.join(PLATINUM_DIR, "Dashboard.md")
@@ -32,13 +37,15 @@ LOGS_DIR       = os.path.join(PLATINUM_DIR, "Logs")
 
 SKILL          = "Watchdog_Platinum"
 POLL_INTERVAL  = 10    # seconds between liveness checks
-RESTART_DELAY  = 5     # seconds before restarting crashed process
+RESTART_DELAY  = 5     # first backoff delay; doubles per quick crash
 SIGNAL_MERGE_INTERVAL = 60   # merge signals every 60s
 
 SERVICES = [
     ("whatsapp_watcher",   os.path.join(LOCAL_DIR, "Watchers", "whatsapp_watcher.py"),   []),
     ("filesystem_watcher", os.path.join(LOCAL_DIR, "Watchers", "filesystem_watcher.py"), []),
 ]
+if os.environ.get("SYNC_TRANSPORT") == "socket":
+    SERVICES.append(("sync_receiver", os.path.join(LOCAL_DIR, "sync_receiver.py"), []))
 
 
 # ── Managed process ───────────────────────────────────────────────────────────
@@ -98,20 +105,20 @@ def parse_signal(filepath: str) -> dict:
     return data
 
 
-def merge_signals_to_dashboard(log: AuditLogger) -> int:
+def merge_signals_to_dashboard(log: AuditLogger, reader: SignalReader) -> int:
     """
-    Read all Signals/ files, update Dashboard.md, delete processed signals.
+    Read new signal-bus entries and legacy Signals/ files, update
+    Dashboard.md, then advance the cursor / delete the legacy files.
     Returns number of signals processed.
     """
-    if not os.path.exists(SIGNALS_DIR):
-        return 0
-
+    records = reader.read()
     signals = [
         f for f in os.listdir(SIGNALS_DIR)
         if f.startswith("SIGNAL_") and f.endswith(".md")
-    ]
+    ] if os.path.exists(SIGNALS_DIR) else []
 
-    if not signals:
+    if not records and not signals:
+        reader.prune()
         return 0
 
     # Read existing dashboard
@@ -121,10 +128,9 @@ def merge_signals_to_dashboard(log: AuditLogger) -> int:
     else:
         dashboard = "# Platinum Dashboard\n\n"
 
+    records += [parse_signal(os.path.join(SIGNALS_DIR, f)) for f in sorted(signals)]
     entries = []
-    for sig_file in sorted(signals):
-        sig_path = os.path.join(SIGNALS_DIR, sig_file)
-        data     = parse_signal(sig_path)
+    for data in records:
         event    = data.get("signal", "unknown")
         task_id  = data.get("task_id", "-")
         detail   = data.get("detail", "")
@@ -146,15 +152,17 @@ def merge_signals_to_dashboard(log: AuditLogger) -> int:
         with open(DASHBOARD_FILE, "w", encoding="utf-8") as f:
             f.write(dashboard)
 
-    # Delete processed signals
+    # Mark processed: advance the bus cursor, delete legacy files
+    reader.commit()
+    reader.prune()
     for sig_file in signals:
         try:
             os.remove(os.path.join(SIGNALS_DIR, sig_file))
         except FileNotFoundError:
             pass
 
-    log.log(SKILL, "signal_merge", "success", detail=f"{len(signals)} signals merged")
-    return len(signals)
+    log.log(SKILL, "signal_merge", "success", detail=f"{len(records)} signals merged")
+    return len(records)
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -167,36 +175,29 @@ def run() -> None:
     print(f"[Watchdog] Starting {len(services)} Local services...")
     log.log(SKILL, "watchdog_start", "success")
 
+    supervisor = Supervisor(SKILL, log, base_delay=RESTART_DELAY)
     for svc in services:
+        supervisor.add(svc)
         svc.start()
 
+    reader            = SignalReader("dashboard")
     last_signal_merge = 0.0
 
     try:
         while True:
-            time.sleep(POLL_INTERVAL)
-
-            # Check and restart crashed processes
-            for svc in services:
-                if not os.path.exists(svc.script):
-                    continue
-                if not svc.is_alive():
-                    svc.restarts += 1
-                    ts = datetime.now().strftime("%H:%M:%S")
-                    print(f"[{ts}] CRASHED  {svc.name}  (restart #{svc.restarts} in {RESTART_DELAY}s)")
-                    log.log(SKILL, f"crash_{svc.name}", "restarting",
-                            detail=f"restart #{svc.restarts}")
-                    time.sleep(RESTART_DELAY)
-                    svc.start()
+            # Crashed services get their own restart timers — never sleeps here
+            supervisor.tick()
 
             # Merge signals periodically
             now = time.time()
             if now - last_signal_merge >= SIGNAL_MERGE_INTERVAL:
-                count = merge_signals_to_dashboard(log)
+                count = merge_signals_to_dashboard(log, reader)
                 if count > 0:
                     print(f"[{datetime.now():%H:%M:%S}] MERGED  {count} signals -> Dashboard.md")
                 last_signal_merge = now
 
+            time.sleep(supervisor.sleep_for(POLL_INTERVAL))
+
     except KeyboardInterrupt:
         print("\n[Watchdog] Shutting down...")
         for svc in services:
@@ -0,0 +1,265 @@
+"""
+async_watcher.py — Asyncio Base Watcher (Platinum Tier)
+-------------------------------------------------------
+Async counterpart of BaseWatcher for network-bound watchers: one event
+loop hosts many watchers, each keeping up to `concurrency` process()
+calls in flight.
+
+Usage:
+  from Shared.async_watcher import AsyncBaseWatcher, SyncWatcherAdapter, run_watchers
+
+  class MyWatcher(AsyncBaseWatcher):
+      async def poll(self) -> list[dict]:   # fetch raw items
+          ...
+      async def process(self, item: dict) -> None:   # handle one item
+          ...
+
+  # Existing sync watchers run unchanged — their calls go to worker threads
+  run_watchers(MyWatcher("MySkill", concurrency=16),
+               SyncWatcherAdapter(GmailWatcher()))
+
+Behaviour:
+  - concurrency  : max process() tasks in flight; polling waits for a free
+                   slot (backpressure) and skips items still in flight
+  - item_timeout : per-item deadline, enforced with asyncio.wait_for
+  - stop()       : finish the cycle, give in-flight items DRAIN_TIMEOUT
+                   seconds, cancel the rest
+  - cancelling the run() task cancels every in-flight item as well
+"""
+
+import asyncio
+import os
+import signal
+import sys
+from abc import ABC, abstractmethod
+
+PLATINUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PLATINUM_DIR)
+
+from Shared.audit_logger import AuditLogger
+from Shared.metrics import timed
+
+DRAIN_TIMEOUT = 30   # seconds stop() waits for in-flight items
+
+
+# ── Async Base Watcher ────────────────────────────────────────────────────────
+
+class AsyncBaseWatcher(ABC):
+    """
+    Template for asyncio watchers.
+
+    Subclasses must implement:
+      - async poll()    -> list[dict]
+      - async process() -> None
+
+    Optional overrides (all async):
+      - on_start(), on_error(exc), on_complete(item), on_cycle_end()
+      - item_key(item) (sync) — dedupe key for in-flight items
+    """
+
+    def __init__(
+        self,
+        skill: str,
+        poll_seconds: float = 5,
+        concurrency: int = 8,
+        item_timeout: float | None = None,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.skill        = skill
+        self.poll_seconds = poll_seconds
+        self.concurrency  = concurrency
+        self.item_timeout = item_timeout
+        self.log          = AuditLogger()
+        self._running     = False
+        self._wakeup: asyncio.Event | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: dict[asyncio.Task, object] = {}   # task -> item key
+
+    # ── Abstract interface ─────────────────────────────────────────────────────
+
+    @abstractmethod
+    async def poll(self) -> list[dict]:
+        """Fetch zero or more raw items from source. Must not raise."""
+        ...
+
+    @abstractmethod
+    async def process(self, item: dict) -> None:
+        """Handle one raw item. Raise on unrecoverable error."""
+        ...
+
+    # ── Optional hooks ─────────────────────────────────────────────────────────
+
+    async def on_start(self) -> None:
+        pass
+
+    async def on_error(self, exc: Exception) -> None:
+        self.log.log_error(self.skill, "process_item", str(exc))
+
+    async def on_complete(self, item: dict) -> None:
+        pass
+
+    async def on_cycle_end(self) -> None:
+        pass
+
+    def item_key(self, item: dict):
+        return None
+
+    # ── Items ──────────────────────────────────────────────────────────────────
+
+    async def _run_item(self, item: dict) -> None:
+        try:
+            with timed(self.skill, "process"):
+                if self.item_timeout:
+                    await asyncio.wait_for(self.process(item), self.item_timeout)
+                else:
+                    await self.process(item)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            if isinstance(exc, asyncio.TimeoutError):
+                exc = TimeoutError(f"item timed out after {self.item_timeout}s")
+            await self.on_error(exc)
+        else:
+            await self.on_complete(item)
+        finally:
+            self._slots.release()
+
+    async def _dispatch(self, items: list[dict]) -> None:
+        pending = {k for k in self._tasks.values() if k is not None}
+        for item in items:
+            key = self.item_key(item)
+            if key is not None and key in pending:
+                continue
+            await self._slots.acquire()          # backpressure
+            if not self._running:
+                self._slots.release()
+                return
+            task = asyncio.create_task(self._run_item(item), name=f"{self.skill}:{key}")
+            self._tasks[task] = key
+            task.add_done_callback(self._tasks.pop)
+            pending.add(key)
+
+    # ── Main loop ──────────────────────────────────────────────────────────────
+
+    async def run(self) -> None:
+        """Poll until stop() — or until this task is cancelled."""
+        self._loop    = asyncio.get_running_loop()
+        self._wakeup  = asyncio.Event()
+        self._slots   = asyncio.Semaphore(self.concurrency)
+        self._running = True
+        self.log.log(self.skill, "watcher_start", "success", detail="async")
+        print(f"[{self.skill}] Started (async) — poll every {self.poll_seconds}s, "
+              f"concurrency {self.concurrency}")
+
+        try:
+            await self.on_start()
+            while self._running:
+                try:
+                    await self._dispatch(await self.poll())
+                    await self.on_cycle_end()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    self.log.log_error(self.skill, "poll_loop", str(exc))
+                    print(f"[{self.skill}] Poll error: {exc}")
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            self._running = False
+            await self._cancel_in_flight()
+            raise
+        finally:
+            if self._tasks:
+                await self._drain()
+            self.log.log(self.skill, "watcher_stop", "success")
+            print(f"[{self.skill}] Stopped.")
+
+    async def _drain(self) -> None:
+        print(f"[{self.skill}] Draining {len(self._tasks)} in-flight item(s)...")
+        _, still_running = await asyncio.wait(list(self._tasks), timeout=DRAIN_TIMEOUT)
+        if still_running:
+            await self._cancel_in_flight()
+        await self.on_cycle_end()
+
+    async def _cancel_in_flight(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self) -> None:
+        """Ask the loop to finish (safe to call from any thread)."""
+        self._running = False
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+
+# ── Sync adapter ──────────────────────────────────────────────────────────────
+
+class SyncWatcherAdapter(AsyncBaseWatcher):
+    """
+    Host an existing BaseWatcher on the event loop. Its poll/process and
+    hooks run on worker threads (asyncio.to_thread), so blocking client
+    libraries (googleapiclient, requests) stay as they are while up to
+    `concurrency` items are processed at once.
+    """
+
+    def __init__(self, watcher, concurrency: int | None = None, item_timeout: float | None = None):
+        super().__init__(
+            watcher.skill,
+            poll_seconds=watcher.poll_seconds,
+            concurrency=concurrency or max(1, watcher.workers),
+            item_timeout=item_timeout,
+        )
+        self.watcher = watcher
+        self.log     = watcher.log
+
+    async def poll(self) -> list[dict]:
+        items = await asyncio.to_thread(self.watcher.poll)
+        # Watchers such as WhatsApp tune poll_seconds inside poll()
+        self.poll_seconds = self.watcher.poll_seconds
+        return items
+
+    async def process(self, item: dict) -> None:
+        await asyncio.to_thread(self.watcher.process, item)
+
+    async def on_start(self) -> None:
+        await asyncio.to_thread(self.watcher.on_start)
+
+    async def on_error(self, exc: Exception) -> None:
+        self.watcher.on_error(exc)
+
+    async def on_complete(self, item: dict) -> None:
+        self.watcher.on_complete(item)
+
+    async def on_cycle_end(self) -> None:
+        await asyncio.to_thread(self.watcher.on_cycle_end)
+
+    def item_key(self, item: dict):
+        return self.watcher.item_key(item)
+
+
+# ── Runner ────────────────────────────────────────────────────────────────────
+
+async def serve(*watchers: AsyncBaseWatcher) -> None:
+    """Run watchers on the current loop until all stop; SIGINT/SIGTERM stop them."""
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, lambda: [w.stop() for w in watchers])
+        except (NotImplementedError, RuntimeError):
+            pass   # Windows / not main thread — Ctrl+C cancels instead
+    await asyncio.gather(*(w.run() for w in watchers))
+
+
+def run_watchers(*watchers: AsyncBaseWatcher) -> None:
+    """Blocking entry point: one event loop for every watcher given."""
+    try:
+        asyncio.run(serve(*watchers))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,285 @@
+"""
+audit_index.py — Audit Log Index (Platinum Tier)
+-------------------------------------------------
+Keeps reads of the *_audit.log files proportional to what was appended
+since the last read, instead of rescanning whole days.
+
+  - LogSummary : running counters for one log file, kept in a sidecar
+                 (<log>.summary.json) together with the byte offset
+                 they cover — each call parses only the new tail
+  - AuditIndex : SQLite index over every *_audit.log in a directory,
+                 refreshed incrementally; query()/count() by skill,
+                 action, result, task_id and time range
+
+Used by Platinum/Shared/audit_logger.py and, as plain `audit_index`, by
+Gold/audit_logger.py. Understands both line formats found in the logs dirs:
+  [ts] | skill | action | result | 12ms | task_id | detail     (AuditLogger)
+  [ts] [skill] [action] [result] [12ms]                        (integration audit())
+
+Usage:
+  from Shared.audit_index import AuditIndex
+
+  idx = AuditIndex(LOGS_DIR)
+  idx.query(skill="GmailWatcher", result="ERROR", since="2026-02-17 00:00:00")
+  idx.count(action="send_email")
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Callable, Iterator
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+CHUNK_BYTES    = 8 * 1024 * 1024   # read size when catching up on a large log
+INDEX_DB_NAME  = ".audit_index.db"
+SUMMARY_SUFFIX = ".summary.json"
+LOG_SUFFIX     = "_audit.log"
+
+QUERY_FIELDS = ("skill", "action", "result", "task_id")
+
+_BRACKET_LINE = re.compile(r"^\[([^\]]+)\] \[([^\]]*)\] \[([^\]]*)\] \[(.*)\] \[(-?\d+)ms\]$")
+
+
+# ── Parsing ───────────────────────────────────────────────────────────────────
+
+def parse_line(line: str) -> dict | None:
+    """Split one audit line into fields. Returns None for lines in neither format."""
+    line = line.rstrip("\r\n")
+    if not line.startswith("["):
+        return None
+
+    if " | " in line:
+        parts = [p.strip() for p in line.split(" | ", 6)]
+        if len(parts) < 6 or not parts[4].endswith("ms"):
+            return None
+        try:
+            duration = int(parts[4][:-2])
+        except ValueError:
+            return None
+        return {
+            "ts":          parts[0].strip("[]"),
+            "skill":       parts[1],
+            "action":      parts[2],
+            "result":      parts[3],
+            "duration_ms": duration,
+            "task_id":     parts[5],
+            "detail":      parts[6] if len(parts) > 6 else "",
+        }
+
+    m = _BRACKET_LINE.match(line)
+    if not m:
+        return None
+    ts, skill, action, result, duration = m.groups()
+    return {"ts": ts, "skill": skill, "action": action, "result": result,
+            "duration_ms": int(duration), "task_id": "-", "detail": ""}
+
+
+def iter_appended(path: str, offset: int) -> Iterator[tuple[str, int]]:
+    """
+    Yield (line, end_offset) for every complete line after byte `offset`.
+    A trailing partial line (writer mid-flush) is left for the next call.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        tail = b""
+        while chunk := f.read(CHUNK_BYTES):
+            lines = (tail + chunk).split(b"\n")
+            tail  = lines.pop()
+            for raw in lines:
+                offset += len(raw) + 1
+                yield raw.decode("utf-8", "replace"), offset
+
+
+def _file_id(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_ino, st.st_size
+
+
+# ── Incremental summary ───────────────────────────────────────────────────────
+
+class LogSummary:
+    """
+    Running counters for one log file, persisted next to it.
+
+    count_line(summary, line) updates the counters for one raw line; the
+    sidecar is discarded when the log is replaced or truncated.
+    """
+
+    def __init__(self, log_file: str, count_line: Callable[[dict, str], None], empty: dict):
+        self.log_file   = log_file
+        self.sidecar    = log_file + SUMMARY_SUFFIX
+        self.count_line = count_line
+        self.empty      = empty
+
+    def _load(self, inode: int, size: int) -> tuple[int, dict]:
+        try:
+            with open(self.sidecar, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return 0, dict(self.empty)
+        if state.get("inode") != inode or state.get("offset", 0) > size \
+                or set(state.get("counts", {})) != set(self.empty):
+            return 0, dict(self.empty)
+        return state["offset"], state["counts"]
+
+    def _save(self, inode: int, offset: int, counts: dict) -> None:
+        tmp = self.sidecar + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"inode": inode, "offset": offset, "counts": counts}, f)
+        os.replace(tmp, self.sidecar)
+
+    def read(self) -> dict:
+        if not os.path.exists(self.log_file):
+            return dict(self.empty)
+
+        inode, size    = _file_id(self.log_file)
+        offset, counts = self._load(inode, size)
+        if offset == size:
+            return counts
+
+        new_offset = offset
+        for line, new_offset in iter_appended(self.log_file, offset):
+            self.count_line(counts, line)
+
+        if new_offset != offset:
+            try:
+                self._save(inode, new_offset, counts)
+            except OSError:
+                pass
+        return counts
+
+
+# ── Query index ───────────────────────────────────────────────────────────────
+
+class AuditIndex:
+    """SQLite index over the *_audit.log files in one directory."""
+
+    def __init__(self, logs_dir: str, db_path: str | None = None):
+        self.logs_dir = logs_dir
+        self.db_path  = db_path or os.path.join(logs_dir, INDEX_DB_NAME)
+        self._lock    = threading.Lock()
+
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "  name TEXT PRIMARY KEY, inode INTEGER, offset INTEGER);"
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "  file TEXT, ts TEXT, skill TEXT, action TEXT, result TEXT,"
+            "  duration_ms INTEGER, task_id TEXT, detail TEXT);"
+            "CREATE INDEX IF NOT EXISTS entries_ts     ON entries(ts);"
+            "CREATE INDEX IF NOT EXISTS entries_skill  ON entries(skill, action, ts);"
+            "CREATE INDEX IF NOT EXISTS entries_result ON entries(result, ts);"
+            "CREATE INDEX IF NOT EXISTS entries_task   ON entries(task_id);"
+            "CREATE INDEX IF NOT EXISTS entries_file   ON entries(file);"
+        )
+        self.db.commit()
+
+    # ── Indexing ──────────────────────────────────────────────────────────────
+
+    def refresh(self) -> int:
+        """Index lines appended since the last refresh. Returns rows added."""
+        if not os.path.isdir(self.logs_dir):
+            return 0
+        added = 0
+        with self._lock:
+            for name in sorted(os.listdir(self.logs_dir)):
+                if name.endswith(LOG_SUFFIX):
+                    added += self._refresh_file(name)
+            self.db.commit()
+        return added
+
+    def _refresh_file(self, name: str) -> int:
+        path        = os.path.join(self.logs_dir, name)
+        inode, size = _file_id(path)
+        row = self.db.execute("SELECT inode, offset FROM files WHERE name = ?", (name,)).fetchone()
+        offset = 0
+        if row is not None:
+            if row[0] == inode and row[1] <= size:
+                offset = row[1]
+            else:
+                # Log was replaced or truncated — reindex it from scratch
+                self.db.execute("DELETE FROM entries WHERE file = ?", (name,))
+        if row is not None and offset == size:
+            return 0
+
+        rows, new_offset = [], offset
+        for line, new_offset in iter_appended(path, offset):
+            rec = parse_line(line)
+            if rec is not None:
+                rows.append((name, rec["ts"], rec["skill"], rec["action"], rec["result"],
+                             rec["duration_ms"], rec["task_id"], rec["detail"]))
+        self.db.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        self.db.execute("INSERT OR REPLACE INTO files (name, inode, offset) VALUES (?, ?, ?)",
+                        (name, inode, new_offset))
+        return len(rows)
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _where(filters: dict, since: str | None, until: str | None) -> tuple[str, list]:
+        clauses, params = [], []
+        for field in QUERY_FIELDS:
+            value = filters.get(field)
+            if value is not None:
+                clauses.append(f"{field} = ?")
+                params.append(value)
+        if since:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until:
+            clauses.append("ts < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        skill: str = None,
+        action: str = None,
+        result: str = None,
+        task_id: str = None,
+        since: str = None,
+        until: str = None,
+        limit: int = 1000,
+        refresh: bool = True,
+    ) -> list[dict]:
+        """
+        Matching entries, oldest first. since/until are "YYYY-MM-DD HH:MM:SS"
+        strings (or any prefix, e.g. "2026-02-17").
+        """
+        if refresh:
+            self.refresh()
+        where, params = self._where(
+            {"skill": skill, "action": action, "result": result, "task_id": task_id}, since, until)
+        cols = ("ts", "skill", "action", "result", "duration_ms", "task_id", "detail")
+        with self._lock:
+            rows = self.db.execute(
+                f"SELECT {', '.join(cols)} FROM entries{where} ORDER BY ts, rowid LIMIT ?",
+                [*params, limit],
+            ).fetchall()
+        return [dict(zip(cols, r)) for r in rows]
+
+    def count(
+        self,
+        skill: str = None,
+        action: str = None,
+        result: str = None,
+        task_id: str = None,
+        since: str = None,
+        until: str = None,
+        refresh: bool = True,
+    ) -> int:
+        if refresh:
+            self.refresh()
+        where, params = self._where(
+            {"skill": skill, "action": action, "result": result, "task_id": task_id}, since, until)
+        with self._lock:
+            return self.db.execute(f"SELECT COUNT(*) FROM entries{where}", params).fetchone()[0]
+
+    def close(self) -> None:
+        self.db.close()
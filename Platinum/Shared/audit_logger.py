@@ -4,18 +4,38 @@ audit_logger.py — Enhanced Audit Logger (Platinum Tier)
 Upgraded from Gold AuditLogger:
   - Writes to Platinum/Logs/YYYY-MM-DD_audit.log
   - Pipe-delimited format (compatible with Gold logs)
-  - today_summary() for Dashboard/health checks
+  - today_summary() for Dashboard/health checks (incremental, see audit_index)
+  - query() by skill / action / result / task_id / time range
+  - log_end() durations also feed the Shared/metrics.py histograms
   - Works from both Cloud and Local (path-agnostic)
+  - Buffered: lines go to a queue; one background writer thread per
+    logs dir keeps the day's file open and writes in batches
 
 Usage:
   from Shared.audit_logger import AuditLogger
   log = AuditLogger()
   log.log("MySkill", "do_thing", "success", duration_ms=42, task_id="TASK-001")
+
+Buffering:
+  A batch is written when AUDIT_FLUSH_LINES lines are queued or the
+  oldest queued line is AUDIT_FLUSH_SECONDS old, whichever comes first.
+  The file rolls over at midnight, and everything still queued is
+  written at interpreter exit. AUDIT_BUFFERED=0 restores the old
+  open-append-close per line.
 """
 
 import os
 from datetime import datetime
 
+try:
+    from Shared.audit_index import LogSummary
+    from Shared.log_writer import BUFFERED, get_index, get_writer, log_path
+    from Shared import metrics
+except ImportError:   # imported as top-level `audit_logger` with Shared/ on sys.path
+    from audit_index import LogSummary
+    from log_writer import BUFFERED, get_index, get_writer, log_path
+    import metrics
+
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 
@@ -33,8 +53,9 @@ class AuditLogger:
       [YYYY-MM-DD HH:MM:SS] | skill | action | result | duration_ms | task_id | detail
     """
 
-    def __init__(self, logs_dir: str = LOGS_DIR):
-        self.logs_dir = logs_dir
+    def __init__(self, logs_dir: str = LOGS_DIR, buffered: bool = BUFFERED):
+        self.logs_dir = os.path.abspath(logs_dir)
+        self.buffered = buffered
         os.makedirs(self.logs_dir, exist_ok=True)
 
     # ── Core log ──────────────────────────────────────────────────────────────
@@ -48,15 +69,23 @@ class AuditLogger:
         task_id: str = "-",
         detail: str = "",
     ) -> None:
-        ts   = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        now  = datetime.now()
+        ts   = now.strftime("%Y-%m-%d %H:%M:%S")
         line = (
             f"[{ts}] | {skill:<22} | {action:<28} | {result:<10} | "
             f"{duration_ms:>6}ms | {task_id} | {detail}\n"
         )
-        log_file = os.path.join(self.logs_dir, f"{datetime.now().strftime('%Y-%m-%d')}_audit.log")
-        with open(log_file, "a", encoding="utf-8") as f:
+        if self.buffered:
+            get_writer(self.logs_dir).write(now.strftime("%Y-%m-%d"), line)
+            return
+        with open(log_path(self.logs_dir, now.strftime("%Y-%m-%d")), "a", encoding="utf-8") as f:
             f.write(line)
 
+    def flush(self) -> None:
+        """Block until lines logged so far are on disk."""
+        if self.buffered:
+            get_writer(self.logs_dir).flush()
+
     # ── Convenience wrappers ──────────────────────────────────────────────────
 
     def log_start(self, skill: str, action: str, task_id: str = "-") -> datetime:
@@ -74,6 +103,7 @@ class AuditLogger:
         detail: str = "",
     ) -> None:
         duration_ms = int((datetime.now() - start_time).total_seconds() * 1000)
+        metrics.record(skill, action, duration_ms, "error" if result == "ERROR" else "ok")
         self.log(skill, action, result, duration_ms=duration_ms, task_id=task_id, detail=detail)
 
     def log_error(self, skill: str, action: str, error: str, task_id: str = "-") -> None:
@@ -81,25 +111,35 @@ class AuditLogger:
 
     # ── Summary ───────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _count_line(summary: dict, line: str) -> None:
+        summary["total"] += 1
+        if "ERROR" in line:
+            summary["errors"] += 1
+        if "retry" in line.lower():
+            summary["retries"] += 1
+        if "NEEDS_HUMAN" in line:
+            summary["needs_human"] += 1
+
     def today_summary(self) -> dict:
         """
-        Read today's log file and return summary counts.
+        Summary counts for today's log file.
         Returns: {total, errors, retries, needs_human}
+
+        Counters and the byte offset they cover live in a sidecar file,
+        so each call only parses lines appended since the previous one.
+        """
+        self.flush()
+        log_file = log_path(self.logs_dir, datetime.now().strftime("%Y-%m-%d"))
+        empty    = {"total": 0, "errors": 0, "retries": 0, "needs_human": 0}
+        return LogSummary(log_file, self._count_line, empty).read()
+
+    # ── Query ─────────────────────────────────────────────────────────────────
+
+    def query(self, **filters) -> list[dict]:
+        """
+        Search all logs in logs_dir through the SQLite index.
+        Filters: skill, action, result, task_id, since, until, limit.
         """
-        log_file = os.path.join(self.logs_dir, f"{datetime.now().strftime('%Y-%m-%d')}_audit.log")
-        summary  = {"total": 0, "errors": 0, "retries": 0, "needs_human": 0}
-
-        if not os.path.exists(log_file):
-            return summary
-
-        with open(log_file, "r", encoding="utf-8") as f:
-            for line in f:
-                summary["total"] += 1
-                if "ERROR" in line:
-                    summary["errors"] += 1
-                if "retry" in line.lower():
-                    summary["retries"] += 1
-                if "NEEDS_HUMAN" in line:
-                    summary["needs_human"] += 1
-
-        return summary
+        self.flush()
+        return get_index(self.logs_dir).query(**filters)
@@ -0,0 +1,258 @@
+"""
+audit_stats.py — Multi-day Audit Analytics (Platinum Tier)
+----------------------------------------------------------
+Streams over any date range of audit logs and reports, per skill:
+  - events, error rate
+  - p50 / p95 / p99 duration_ms
+  - throughput per hour
+  - slowest task_ids
+
+Files are read line by line through a generator pipeline (never loaded
+whole). Durations are kept as a value -> count table, so percentiles are
+exact and memory stays flat across months of logs. STARTED marker lines
+are skipped — their 0ms would drag every percentile down.
+
+Parses the Platinum and Gold AuditLogger formats and the bracketed
+format written by the Gold integration audit() helpers.
+
+Usage:
+  python Platinum/Shared/audit_stats.py                         # last 7 days
+  python Platinum/Shared/audit_stats.py --from 2026-02-01 --to 2026-02-28
+  python Platinum/Shared/audit_stats.py --skill GmailWatcher --json
+  python Platinum/Shared/audit_stats.py --workers 4             # one process per file
+
+  from Shared.audit_stats import collect
+  stats = collect(start=date(2026, 2, 1))
+  stats.report()
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator
+
+PLATINUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PLATINUM_DIR)
+
+from Shared.audit_index import LOG_SUFFIX, iter_appended, parse_line
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+ROOT_DIR     = os.path.dirname(PLATINUM_DIR)
+DEFAULT_DIRS = [
+    os.path.join(PLATINUM_DIR, "Logs"),
+    os.path.join(ROOT_DIR, "Gold", "Audit_Logs"),
+]
+DEFAULT_DAYS = 7
+TOP_SLOWEST  = 10
+PERCENTILES  = (50, 95, 99)
+
+SKIP_RESULTS = {"STARTED"}
+ERROR_WORDS  = ("error", "fail", "exception", "timeout")
+
+
+def is_error(result: str) -> bool:
+    r = result.lower()
+    return any(w in r for w in ERROR_WORDS)
+
+
+# ── Pipeline stages ───────────────────────────────────────────────────────────
+
+def iter_log_files(dirs: Iterable[str], start: date, end: date) -> Iterator[str]:
+    """Yield *_audit.log paths whose file date falls in [start, end]."""
+    for d in dirs:
+        if not os.path.isdir(d):
+            continue
+        for name in sorted(os.listdir(d)):
+            if not name.endswith(LOG_SUFFIX):
+                continue
+            try:
+                day = datetime.strptime(name[: -len(LOG_SUFFIX)], "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if start <= day <= end:
+                yield os.path.join(d, name)
+
+
+def iter_records(path: str) -> Iterator[dict]:
+    """Parsed entries from one log file, streamed."""
+    for line, _ in iter_appended(path, 0):
+        rec = parse_line(line)
+        if rec is not None and rec["result"] not in SKIP_RESULTS:
+            yield rec
+
+
+def filter_skill(records: Iterable[dict], skill: str | None) -> Iterator[dict]:
+    for rec in records:
+        if skill is None or rec["skill"] == skill:
+            yield rec
+
+
+# ── Aggregation ───────────────────────────────────────────────────────────────
+
+def percentile(hist: Counter, pct: float) -> int:
+    """Nearest-rank percentile from a {value: count} table."""
+    total = sum(hist.values())
+    if not total:
+        return 0
+    rank = max(1, -(-total * pct // 100))   # ceil
+    seen = 0
+    for value in sorted(hist):
+        seen += hist[value]
+        if seen >= rank:
+            return value
+    return max(hist)
+
+
+class AuditStats:
+    """Mergeable running aggregates (so per-file results can be combined)."""
+
+    def __init__(self, top: int = TOP_SLOWEST):
+        self.top       = top
+        self.events    = Counter()                      # skill -> n
+        self.errors    = Counter()                      # skill -> n
+        self.durations = defaultdict(Counter)           # skill -> {ms: n}
+        self.per_hour  = Counter()                      # "YYYY-MM-DD HH" -> n
+        self.slowest: list[tuple] = []                  # min-heap (ms, ts, skill, action, task_id)
+
+    def add(self, rec: dict) -> None:
+        skill = rec["skill"]
+        self.events[skill] += 1
+        if is_error(rec["result"]):
+            self.errors[skill] += 1
+        self.durations[skill][rec["duration_ms"]] += 1
+        self.per_hour[rec["ts"][:13]] += 1
+
+        if rec["task_id"] not in ("", "-"):
+            entry = (rec["duration_ms"], rec["ts"], skill, rec["action"], rec["task_id"])
+            if len(self.slowest) < self.top:
+                heapq.heappush(self.slowest, entry)
+            elif entry > self.slowest[0]:
+                heapq.heapreplace(self.slowest, entry)
+
+    def consume(self, records: Iterable[dict]) -> "AuditStats":
+        for rec in records:
+            self.add(rec)
+        return self
+
+    def merge(self, other: "AuditStats") -> "AuditStats":
+        self.events.update(other.events)
+        self.errors.update(other.errors)
+        for skill, hist in other.durations.items():
+            self.durations[skill].update(hist)
+        self.per_hour.update(other.per_hour)
+        self.slowest = heapq.nlargest(self.top, self.slowest + other.slowest)
+        heapq.heapify(self.slowest)
+        return self
+
+    # ── Output ────────────────────────────────────────────────────────────────
+
+    def to_dict(self) -> dict:
+        skills = {}
+        for skill in sorted(self.events, key=lambda s: -self.events[s]):
+            n = self.events[skill]
+            skills[skill] = {
+                "events":     n,
+                "errors":     self.errors[skill],
+                "error_rate": round(self.errors[skill] / n, 4),
+                **{f"p{p}_ms": percentile(self.durations[skill], p) for p in PERCENTILES},
+            }
+        hours = len(self.per_hour)
+        return {
+            "skills":        skills,
+            "total_events":  sum(self.events.values()),
+            "active_hours":  hours,
+            "avg_per_hour":  round(sum(self.per_hour.values()) / hours, 2) if hours else 0,
+            "per_hour":      dict(sorted(self.per_hour.items())),
+            "slowest":       [
+                {"duration_ms": ms, "ts": ts, "skill": s, "action": a, "task_id": t}
+                for ms, ts, s, a, t in sorted(self.slowest, reverse=True)
+            ],
+        }
+
+    def report(self) -> str:
+        data  = self.to_dict()
+        lines = [
+            f"{'skill':<24} {'events':>8} {'errors':>7} {'err%':>6} "
+            f"{'p50':>7} {'p95':>7} {'p99':>7}",
+            "-" * 72,
+        ]
+        for skill, s in data["skills"].items():
+            lines.append(
+                f"{skill[:24]:<24} {s['events']:>8} {s['errors']:>7} {s['error_rate'] * 100:>5.1f}% "
+                f"{s['p50_ms']:>5}ms {s['p95_ms']:>5}ms {s['p99_ms']:>5}ms"
+            )
+        lines += [
+            "",
+            f"Total events: {data['total_events']} over {data['active_hours']} active hour(s) "
+            f"— avg {data['avg_per_hour']}/hour",
+        ]
+        if data["per_hour"]:
+            peak = max(data["per_hour"].items(), key=lambda kv: kv[1])
+            lines.append(f"Peak hour:    {peak[0]}:00 ({peak[1]} events)")
+        if data["slowest"]:
+            lines += ["", "Slowest tasks:"]
+            for e in data["slowest"]:
+                lines.append(f"  {e['duration_ms']:>7}ms  {e['task_id']}  "
+                             f"({e['skill']}/{e['action']} @ {e['ts']})")
+        return "\n".join(lines)
+
+
+# ── Entry points ──────────────────────────────────────────────────────────────
+
+def _file_stats(args: tuple) -> AuditStats:
+    path, skill, top = args
+    return AuditStats(top).consume(filter_skill(iter_records(path), skill))
+
+
+def collect(
+    start: date | None = None,
+    end: date | None = None,
+    dirs: Iterable[str] = DEFAULT_DIRS,
+    skill: str | None = None,
+    workers: int = 0,
+    top: int = TOP_SLOWEST,
+) -> AuditStats:
+    """Aggregate every log in [start, end] (default: last DEFAULT_DAYS days)."""
+    end   = end or date.today()
+    start = start or end - timedelta(days=DEFAULT_DAYS - 1)
+    files = list(iter_log_files(dirs, start, end))
+
+    stats = AuditStats(top)
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_file_stats, [(f, skill, top) for f in files]):
+                stats.merge(part)
+    else:
+        for path in files:
+            stats.consume(filter_skill(iter_records(path), skill))
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Audit log analytics over a date range")
+    parser.add_argument("--from", dest="start", type=date.fromisoformat,
+                        help=f"first day YYYY-MM-DD (default: {DEFAULT_DAYS} days ago)")
+    parser.add_argument("--to", dest="end", type=date.fromisoformat,
+                        help="last day YYYY-MM-DD (default: today)")
+    parser.add_argument("--dir", dest="dirs", action="append",
+                        help="log directory (repeatable; default: Platinum/Logs + Gold/Audit_Logs)")
+    parser.add_argument("--skill", help="only this skill")
+    parser.add_argument("--top", type=int, default=TOP_SLOWEST, help="slowest task_ids to list")
+    parser.add_argument("--workers", type=int, default=0, help="process pool size (0 = inline)")
+    parser.add_argument("--json", action="store_true", help="print JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    stats = collect(args.start, args.end, args.dirs or DEFAULT_DIRS,
+                    skill=args.skill, workers=args.workers, top=args.top)
+    print(json.dumps(stats.to_dict(), indent=2) if args.json else stats.report())
+
+
+if __name__ == "__main__":
+    main()
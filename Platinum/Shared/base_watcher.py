@@ -11,10 +11,25 @@ Usage:
           ...
       def process(self, item: dict) -> None:   # handle one item
           ...
+
+Event-driven mode (directory watchers):
+  Pass watch_dirs=[...] and the loop wakes as soon as one of those
+  directories changes instead of sleeping poll_seconds. Backend is
+  chosen by WATCHER_EVENT_MODE (auto | inotify | watchdog | poll).
+
+Worker-pool mode (slow items):
+  Pass workers=N and process() runs on a bounded thread/process pool.
+  Polling pauses while max_pending items are in flight (backpressure),
+  item_timeout bounds each item, ordered=True reports completions in
+  submission order, and stop() drains in-flight items before exiting.
+
+Every process() call is timed into the (skill, "process") latency
+histogram — see Shared/metrics.py.
 """
 
 import os
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -25,6 +40,15 @@ PLATINUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PLATINUM_DIR)
 
 from Shared.audit_logger import AuditLogger
+from Shared.dir_events import DirChangeWaiter, DEFAULT_DEBOUNCE
+from Shared.metrics import timed
+from Shared.worker_pool import WorkerPool
+
+EVENT_MODE        = os.environ.get("WATCHER_EVENT_MODE", "auto")
+EVENT_SAFETY_POLL = 60   # seconds — rescan even without events (missed-event guard)
+REAP_INTERVAL     = 1    # seconds — max wait while pool items are in flight
+DRAIN_TIMEOUT     = 30   # seconds — how long stop() waits for in-flight items
+STOP_SLICE        = 1    # seconds — longest a wait goes without checking stop()
 
 
 # ── Base Watcher ──────────────────────────────────────────────────────────────
@@ -38,15 +62,50 @@ class BaseWatcher(ABC):
       - process() -> None          — handle a single item
 
     Optional overrides:
-      - on_start()  — called once before loop
-      - on_error()  — called on unhandled exception in loop body
+      - on_start()     — called once before loop
+      - on_error()     — called on unhandled exception in loop body
+      - on_complete()  — called after process() succeeds
+      - on_cycle_end() — called once per loop cycle (batch follow-up work)
+      - item_key()     — dedupe key, so a re-polled in-flight item is skipped
     """
 
-    def __init__(self, skill: str, poll_seconds: int = 5):
+    def __init__(
+        self,
+        skill: str,
+        poll_seconds: int = 5,
+        watch_dirs: list[str] | None = None,
+        event_mode: str = EVENT_MODE,
+        debounce: float = DEFAULT_DEBOUNCE,
+        workers: int = 0,
+        pool_kind: str = "thread",
+        max_pending: int | None = None,
+        item_timeout: float | None = None,
+        ordered: bool = False,
+    ):
         self.skill        = skill
         self.poll_seconds = poll_seconds
+        self.watch_dirs   = watch_dirs or []
+        self.event_mode   = event_mode
+        self.debounce     = debounce
         self.log          = AuditLogger()
         self._running     = False
+        self._stop_event  = threading.Event()   # wakes _wait_next on stop()
+        self._waiter: DirChangeWaiter | None = None
+
+        # workers=0 keeps the original one-item-at-a-time loop
+        self.workers = workers
+        self._pool: WorkerPool | None = None
+        if workers > 0:
+            self._pool = WorkerPool(workers, kind=pool_kind, max_pending=max_pending,
+                                    item_timeout=item_timeout, ordered=ordered)
+
+    def __getstate__(self) -> dict:
+        # Process-pool mode pickles the watcher; executors/fds stay behind
+        state = self.__dict__.copy()
+        state["_pool"]       = None
+        state["_waiter"]     = None
+        state["_stop_event"] = None
+        return state
 
     # ── Abstract interface ─────────────────────────────────────────────────────
 
@@ -70,24 +129,111 @@ class BaseWatcher(ABC):
         """Called when process() raises. Default: log + continue."""
         self.log.log_error(self.skill, "process_item", str(exc))
 
+    def on_complete(self, item: dict) -> None:
+        """Called after process(item) returns. Default: nothing."""
+        pass
+
+    def on_cycle_end(self) -> None:
+        """Called after each poll cycle's items are handled. Default: nothing."""
+        pass
+
+    def item_key(self, item: dict):
+        """Identity of an item for in-flight dedupe (pool mode). None = no dedupe."""
+        return None
+
+    # ── Waiting ────────────────────────────────────────────────────────────────
+
+    def _open_waiter(self) -> None:
+        """Set up directory notifications (after on_start created the dirs)."""
+        if not self.watch_dirs or self.event_mode == "poll":
+            return
+        self._waiter = DirChangeWaiter(self.watch_dirs, mode=self.event_mode,
+                                       debounce=self.debounce)
+        if self._waiter.name == "poll":
+            self._waiter.close()
+            self._waiter = None
+            return
+        print(f"[{self.skill}] Event-driven mode: {self._waiter.name} "
+              f"(debounce {self.debounce}s, safety poll {EVENT_SAFETY_POLL}s)")
+        self.log.log(self.skill, "event_mode", self._waiter.name)
+
+    def _wait_next(self) -> None:
+        """Sleep until the next poll is due (or a watched dir changes, or stop())."""
+        if self._pool is not None and len(self._pool):
+            if not self._pool.has_capacity():
+                # Backpressure: don't poll again until a slot frees up
+                self._wait_sliced(self.poll_seconds, self._pool.wait_any)
+                return
+            timeout = min(self.poll_seconds, REAP_INTERVAL)
+        elif self._waiter is not None:
+            timeout = max(self.poll_seconds, EVENT_SAFETY_POLL)
+        else:
+            timeout = self.poll_seconds
+
+        if self._waiter is None:
+            self._stop_event.wait(timeout)
+        else:
+            self._wait_sliced(timeout, self._waiter.wait)
+
+    def _wait_sliced(self, timeout: float, wait) -> None:
+        """Run a blocking wait in STOP_SLICE pieces so stop() is seen within a second."""
+        deadline = time.monotonic() + timeout
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if wait(min(remaining, STOP_SLICE)):
+                return
+
+    # ── Dispatch ───────────────────────────────────────────────────────────────
+
+    def _timed_process(self, item: dict) -> None:
+        with timed(self.skill, "process"):
+            self.process(item)
+
+    def _dispatch(self, items: list[dict]) -> None:
+        """Run items inline, or hand them to the worker pool."""
+        if self._pool is None:
+            for item in items:
+                try:
+                    self._timed_process(item)
+                except Exception as exc:
+                    self.on_error(exc)
+                    continue
+                self.on_complete(item)
+            return
+
+        for item in items:
+            key = self.item_key(item)
+            if self._pool.is_pending(key):
+                continue
+            self._pool.submit(self._timed_process, item, key)
+
+    def _collect(self, results: list[tuple]) -> None:
+        for item, exc in results:
+            if exc is None:
+                self.on_complete(item)
+            else:
+                self.on_error(exc)
+
     # ── Main loop ──────────────────────────────────────────────────────────────
 
     def run(self) -> None:
         """Start the polling loop. Blocks until KeyboardInterrupt."""
-        self._running = True
+        self._running = not self._stop_event.is_set()   # stop() may beat run()
         self.log.log(self.skill, "watcher_start", "success")
         print(f"[{self.skill}] Started — poll every {self.poll_seconds}s")
 
         self.on_start()
+        self._open_waiter()
 
         while self._running:
             try:
-                items = self.poll()
-                for item in items:
-                    try:
-                        self.process(item)
-                    except Exception as exc:
-                        self.on_error(exc)
+                if self._pool is not None:
+                    self._collect(self._pool.reap())
+                if self._pool is None or self._pool.has_capacity():
+                    self._dispatch(self.poll())
+                self.on_cycle_end()
 
             except KeyboardInterrupt:
                 print(f"\n[{self.skill}] Stopping...")
@@ -97,11 +243,25 @@ class BaseWatcher(ABC):
                 self.log.log_error(self.skill, "poll_loop", str(exc))
                 print(f"[{self.skill}] Poll error: {exc}")
 
-            time.sleep(self.poll_seconds)
+            try:
+                self._wait_next()
+            except KeyboardInterrupt:
+                print(f"\n[{self.skill}] Stopping...")
+                self._running = False
+
+        if self._pool is not None:
+            print(f"[{self.skill}] Draining {len(self._pool)} in-flight item(s)...")
+            self._collect(self._pool.drain(DRAIN_TIMEOUT))
+            self.on_cycle_end()
+
+        if self._waiter is not None:
+            self._waiter.close()
+            self._waiter = None
 
         self.log.log(self.skill, "watcher_stop", "success")
         print(f"[{self.skill}] Stopped.")
 
     def stop(self) -> None:
-        """Signal the loop to stop after current iteration."""
+        """Signal the loop to stop after current iteration (in-flight items drain)."""
         self._running = False
+        self._stop_event.set()
@@ -0,0 +1,218 @@
+"""
+dir_events.py — Directory Change Notifier (Platinum Tier)
+----------------------------------------------------------
+Blocks until a watched directory changes, instead of sleeping a fixed
+interval. Used by BaseWatcher in event-driven mode.
+
+Backends (picked in this order when mode="auto"):
+  - inotify  : Linux kernel events via libc (no extra deps)
+  - watchdog : pip install watchdog (Windows / macOS)
+  - poll     : plain sleep — same behaviour as before
+
+Usage:
+  from Shared.dir_events import DirChangeWaiter
+
+  waiter = DirChangeWaiter(["/path/to/Needs_Action/cloud"], debounce=0.25)
+  while True:
+      changed = waiter.wait(timeout=60)   # True = something changed
+      ...
+  waiter.close()
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+import threading
+import ctypes
+import ctypes.util
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+DEFAULT_DEBOUNCE  = 0.25   # seconds of quiet before wait() returns
+MAX_DEBOUNCE_WAIT = 2.0    # never hold an event back longer than this
+
+MODES = ("auto", "inotify", "watchdog", "poll")
+
+# inotify constants (linux/inotify.h)
+IN_MODIFY      = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM  = 0x00000040
+IN_MOVED_TO    = 0x00000080
+IN_CREATE      = 0x00000100
+IN_DELETE      = 0x00000200
+IN_NONBLOCK    = 0o4000
+IN_CLOEXEC     = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_MODIFY
+
+_EVENT_HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
+
+
+# ── Backends ──────────────────────────────────────────────────────────────────
+
+class _PollBackend:
+    """Fallback: no notifications, wait() just sleeps the full timeout."""
+
+    name = "poll"
+
+    def __init__(self, dirs: list[str]):
+        self.dirs = dirs
+
+    def wait(self, timeout: float) -> bool:
+        time.sleep(timeout)
+        return False
+
+    def drain(self, timeout: float) -> bool:
+        return False
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyBackend:
+    """Linux inotify through libc — zero CPU while the directory is idle."""
+
+    name = "inotify"
+
+    def __init__(self, dirs: list[str]):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is Linux-only")
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        for d in dirs:
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(d), WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(err, f"inotify_add_watch failed: {d}")
+
+    def _read_events(self) -> int:
+        count = 0
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return count
+            if not buf:
+                return count
+            offset = 0
+            while offset < len(buf):
+                _, _, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+                offset += _EVENT_HEADER.size + length
+                count  += 1
+
+    def wait(self, timeout: float) -> bool:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        return self._read_events() > 0
+
+    def drain(self, timeout: float) -> bool:
+        return self.wait(timeout)
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class _WatchdogBackend:
+    """Cross-platform notifications via the optional `watchdog` package."""
+
+    name = "watchdog"
+
+    def __init__(self, dirs: list[str]):
+        from watchdog.observers import Observer
+        from watchdog.events import FileSystemEventHandler
+
+        self._event = threading.Event()
+        flag        = self._event
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                flag.set()
+
+        self._observer = Observer()
+        for d in dirs:
+            self._observer.schedule(_Handler(), d, recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+
+    def wait(self, timeout: float) -> bool:
+        fired = self._event.wait(timeout)
+        self._event.clear()
+        return fired
+
+    def drain(self, timeout: float) -> bool:
+        return self.wait(timeout)
+
+    def close(self) -> None:
+        self._observer.stop()
+        self._observer.join(timeout=2)
+
+
+_BACKENDS = {
+    "inotify":  _InotifyBackend,
+    "watchdog": _WatchdogBackend,
+    "poll":     _PollBackend,
+}
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+class DirChangeWaiter:
+    """
+    Wait for changes in one or more directories.
+
+    wait(timeout) returns True as soon as a change is seen and the
+    directories have been quiet for `debounce` seconds (bounded by
+    MAX_DEBOUNCE_WAIT), or False when timeout expires with no change.
+    """
+
+    def __init__(self, dirs: list[str], mode: str = "auto", debounce: float = DEFAULT_DEBOUNCE):
+        if mode not in MODES:
+            raise ValueError(f"Unknown event mode '{mode}' — use one of {MODES}")
+
+        self.dirs     = [d for d in dirs if os.path.isdir(d)]
+        self.debounce = debounce
+        self.backend  = self._open_backend(mode)
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    def _open_backend(self, mode: str):
+        order = ["inotify", "watchdog", "poll"] if mode == "auto" else [mode, "poll"]
+        if not self.dirs:
+            order = ["poll"]
+
+        for name in order:
+            try:
+                return _BACKENDS[name](self.dirs)
+            except (ImportError, OSError, AttributeError):
+                continue
+        return _PollBackend(self.dirs)
+
+    def wait(self, timeout: float) -> bool:
+        if not self.backend.wait(timeout):
+            return False
+
+        # Debounce: swallow the burst (e.g. 50 files dropped at once)
+        deadline = time.monotonic() + MAX_DEBOUNCE_WAIT
+        while time.monotonic() < deadline:
+            if not self.backend.drain(self.debounce):
+                break
+        return True
+
+    def close(self) -> None:
+        self.backend.close()
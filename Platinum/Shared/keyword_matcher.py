@@ -0,0 +1,123 @@
+"""
+keyword_matcher.py — One-pass Keyword Classifier (Platinum Tier)
+----------------------------------------------------------------
+Replaces the `lower = content.lower(); any(kw in lower for kw in LIST)`
+chains used for risk / intent / triage classification.
+
+All keywords of all categories are folded into one prefix-trie regex
+(e.g. `d(?:e(?:lete|ploy)|rop)`), compiled once, so the text is scanned
+once no matter how many keywords or categories there are. Every
+category hit comes back from that single pass.
+
+  - word=False : substring semantics, same results as `kw in lower`
+  - word=True  : keywords only count as whole words ("send" no longer
+                 matches "sender")
+
+Matching is case-insensitive; keywords may contain spaces ("amount due").
+
+Usage:
+  from Shared.keyword_matcher import KeywordMatcher
+
+  RISK = KeywordMatcher({"high": ["delete", "payment"], "medium": ["send", "email"]})
+  RISK.scan(text)            # {"high": ["payment"], "medium": ["email"]}
+  RISK.first(text, "low")    # "high" — first category (declaration order) with a hit
+
+Stdlib only: Gold, Silver and Bronze append Platinum/Shared to sys.path
+and import this one copy as plain `keyword_matcher`, so every tier
+classifies the same way.
+"""
+
+import re
+from typing import Iterable
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Alternation regex with shared prefixes factored out, longest match first."""
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        alts = [re.escape(ch) + build(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else f"(?:{'|'.join(alts)})"
+        # A word ending here makes the rest optional; greedy `?` still
+        # prefers the longer keyword
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class KeywordMatcher:
+    """Named keyword categories matched in one regex pass."""
+
+    def __init__(self, categories: dict[str, Iterable[str]], word: bool = False):
+        self.word = word
+        self._keywords: dict[str, list[str]] = {}
+        for cat, kws in categories.items():
+            seen = self._keywords.setdefault(cat, [])
+            for kw in kws:
+                kw = kw.lower()
+                if kw and kw not in seen:
+                    seen.append(kw)
+
+        vocab = {kw for kws in self._keywords.values() for kw in kws}
+        # The regex reports the longest keyword starting at a position;
+        # shorter keywords that are its prefixes matched there too
+        self._implied: dict[str, frozenset[str]] = {
+            kw: frozenset(
+                p for p in vocab
+                if kw.startswith(p)
+                and (not word or len(p) == len(kw) or not _is_word_char(kw[len(p)]))
+            )
+            for kw in vocab
+        }
+        self._total = len(vocab)
+        self._pattern: re.Pattern | None = None
+        if vocab:
+            body = _trie_pattern(vocab)
+            self._pattern = re.compile(rf"\b{body}\b" if word else body)
+
+    def found(self, text: str) -> set[str]:
+        """Every keyword present in text (lower-cased)."""
+        found: set[str] = set()
+        if self._pattern is None or not text:
+            return found
+        lower  = text.lower()
+        search = self._pattern.search
+        pos    = 0
+        while True:
+            m = search(lower, pos)
+            if m is None:
+                break
+            found |= self._implied[m.group()]
+            if len(found) == self._total:
+                break                      # nothing left to find
+            pos = m.start() + 1            # overlapping keywords start later
+        return found
+
+    def scan(self, text: str) -> dict[str, list[str]]:
+        """Categories with at least one hit -> their keywords, in declaration order."""
+        found = self.found(text)
+        hits  = {}
+        for cat, kws in self._keywords.items():
+            matched = [kw for kw in kws if kw in found]
+            if matched:
+                hits[cat] = matched
+        return hits
+
+    def first(self, text: str, default: str | None = None) -> str | None:
+        """First category (in declaration order) with a hit, else default."""
+        found = self.found(text)
+        for cat, kws in self._keywords.items():
+            if any(kw in found for kw in kws):
+                return cat
+        return default
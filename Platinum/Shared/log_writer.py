@@ -0,0 +1,178 @@
+"""
+log_writer.py — Buffered Audit Log Writer (Platinum Tier)
+---------------------------------------------------------
+The write path shared by Platinum/Shared/audit_logger.py and
+Gold/audit_logger.py (Gold appends Platinum/Shared to sys.path), so the
+buffering fixes live in one place.
+
+Lines go to a queue; one background writer thread per logs dir keeps the
+day's file open and writes a batch when AUDIT_FLUSH_LINES lines are
+queued or the oldest queued line is AUDIT_FLUSH_SECONDS old. The file
+rolls over at midnight, and everything still queued is written at
+interpreter exit. AUDIT_BUFFERED=0 tells callers to skip the writer.
+
+Usage:
+  from Shared.log_writer import BUFFERED, get_writer, log_path
+
+  get_writer(LOGS_DIR).write("2026-02-17", line)
+"""
+
+import atexit
+import os
+import queue
+import sys
+import threading
+import time
+
+try:
+    from Shared.audit_index import AuditIndex
+except ImportError:   # imported as top-level `log_writer` with Shared/ on sys.path
+    from audit_index import AuditIndex
+
+
+# ── Buffering ─────────────────────────────────────────────────────────────────
+
+BUFFERED      = os.environ.get("AUDIT_BUFFERED", "1") != "0"
+FLUSH_SECONDS = float(os.environ.get("AUDIT_FLUSH_SECONDS", "1.0"))
+FLUSH_LINES   = int(os.environ.get("AUDIT_FLUSH_LINES", "256"))
+FLUSH_WAIT    = 5.0   # seconds flush()/close() wait for the writer thread
+
+_FLUSH_DUE = object()   # writer wake-up: oldest pending line reached FLUSH_SECONDS
+
+
+def log_path(logs_dir: str, date_str: str) -> str:
+    return os.path.join(logs_dir, f"{date_str}_audit.log")
+
+
+class LogWriter:
+    """Background thread that owns the open log file for one logs dir."""
+
+    def __init__(self, logs_dir: str):
+        self.logs_dir = logs_dir
+        self._queue   = queue.SimpleQueue()
+        self._file    = None
+        self._date    = None
+        self._thread  = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    # ── Producer side ─────────────────────────────────────────────────────────
+
+    def write(self, date_str: str, line: str) -> None:
+        self._queue.put((date_str, line))
+
+    def flush(self, timeout: float = FLUSH_WAIT) -> None:
+        """Block until everything queued so far is on disk."""
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout: float = FLUSH_WAIT) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    # ── Writer thread ─────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        pending: list[tuple[str, str]] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FLUSH_DUE
+
+            if isinstance(item, tuple):
+                if not pending:
+                    deadline = time.monotonic() + FLUSH_SECONDS
+                pending.append(item)
+                if len(pending) < FLUSH_LINES:
+                    continue
+
+            self._write(pending)
+            pending = []
+
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                self._close_file()
+                return
+
+    def _write(self, pending: list[tuple[str, str]]) -> None:
+        if not pending:
+            return
+        try:
+            chunk: list[str] = []
+            for date_str, line in pending:
+                if date_str != self._date:
+                    self._emit(chunk)
+                    chunk = []
+                    self._rotate(date_str)
+                chunk.append(line)
+            self._emit(chunk)
+        except OSError as exc:
+            print(f"[AuditLogger] write failed, {len(pending)} line(s) lost: {exc}", file=sys.stderr)
+            self._close_file()
+
+    def _emit(self, chunk: list[str]) -> None:
+        if chunk:
+            self._file.write("".join(chunk))
+            self._file.flush()
+
+    def _rotate(self, date_str: str) -> None:
+        """Daily rotation: the first line of a new day opens that day's file."""
+        self._close_file()
+        os.makedirs(self.logs_dir, exist_ok=True)
+        self._file = open(log_path(self.logs_dir, date_str), "a", encoding="utf-8")
+        self._date = date_str
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+        self._date = None
+
+
+_writers: dict[str, LogWriter] = {}
+_writers_lock = threading.Lock()
+_writers_pid  = os.getpid()
+
+
+def get_writer(logs_dir: str) -> LogWriter:
+    """One writer per logs dir per process (a forked child starts fresh)."""
+    global _writers_pid
+    with _writers_lock:
+        if _writers_pid != os.getpid():
+            _writers.clear()
+            _writers_pid = os.getpid()
+        writer = _writers.get(logs_dir)
+        if writer is None:
+            writer = _writers[logs_dir] = LogWriter(logs_dir)
+        return writer
+
+
+def flush_all() -> None:
+    """Write out every queued line (called automatically at exit)."""
+    with _writers_lock:
+        writers = list(_writers.values()) if _writers_pid == os.getpid() else []
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(flush_all)
+
+
+_indexes: dict[str, AuditIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(logs_dir: str) -> AuditIndex:
+    with _indexes_lock:
+        index = _indexes.get(logs_dir)
+        if index is None:
+            index = _indexes[logs_dir] = AuditIndex(logs_dir)
+        return index
@@ -0,0 +1,287 @@
+"""
+metrics.py — Latency Histograms (Platinum Tier)
+-----------------------------------------------
+In-process latency histograms per (skill, action), flushed periodically
+to a Prometheus text file the orchestrator can serve.
+
+  - timed()      : context manager / decorator / manual stop() timer
+  - record()     : add one duration by hand
+  - Histogram    : HDR-style log-linear buckets (~3% relative error,
+                   fixed memory, mergeable)
+  - flush()      : write Logs/metrics/<process>.prom now
+
+Usage:
+  from Shared.metrics import timed
+
+  with timed("GmailWatcher", "process"):
+      ...
+
+  @timed("EmailDrafter", "run")
+  def run(path): ...
+
+  t = timed("FileWatcher", "claim_task")   # clock starts here
+  ...
+  duration_ms = t.stop()                     # records + returns ms
+
+Each process writes its own file (named after its main script) every
+METRICS_FLUSH_SECONDS and at exit. Worker processes from a process pool
+record in memory only — their files would overwrite the parent's.
+"""
+
+import atexit
+import functools
+import math
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+PLATINUM_DIR  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+METRICS_DIR   = os.environ.get("METRICS_DIR", os.path.join(PLATINUM_DIR, "Logs", "metrics"))
+FLUSH_SECONDS = float(os.environ.get("METRICS_FLUSH_SECONDS", "15"))
+
+METRIC_NAME   = "skill_duration_seconds"
+QUANTILES     = (0.5, 0.95, 0.99)
+# Prometheus `le` buckets (seconds) — cumulative counts derived from the HDR buckets
+BUCKETS       = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+SUB_BUCKET_BITS = 5    # 32 linear sub-buckets per power of two → ≤ 3.1% error
+
+
+# ── Histogram ─────────────────────────────────────────────────────────────────
+
+class Histogram:
+    """
+    Log-linear histogram over microsecond values (HdrHistogram layout):
+    values below 2^SUB_BUCKET_BITS are exact, above that each power of two
+    is split into 2^SUB_BUCKET_BITS equal buckets.
+    """
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max   = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < (1 << SUB_BUCKET_BITS):
+            return value
+        exp = value.bit_length() - 1 - SUB_BUCKET_BITS
+        return ((exp + 1) << SUB_BUCKET_BITS) + (value >> exp) - (1 << SUB_BUCKET_BITS)
+
+    @staticmethod
+    def _upper(index: int) -> int:
+        """Largest value that lands in bucket `index`."""
+        if index < (1 << SUB_BUCKET_BITS):
+            return index
+        exp, sub = divmod(index, 1 << SUB_BUCKET_BITS)
+        exp -= 1
+        return (((1 << SUB_BUCKET_BITS) + sub + 1) << exp) - 1
+
+    def record(self, micros: int) -> None:
+        micros = max(0, int(micros))
+        idx = self._index(micros)
+        self.counts[idx] = self.counts.get(idx, 0) + 1
+        self.count += 1
+        self.total += micros
+        if micros > self.max:
+            self.max = micros
+
+    def merge(self, other: "Histogram") -> None:
+        for idx, n in other.counts.items():
+            self.counts[idx] = self.counts.get(idx, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.max    = max(self.max, other.max)
+
+    def quantile(self, q: float) -> int:
+        """Value (µs) at quantile q, 0 < q <= 1."""
+        if not self.count:
+            return 0
+        rank = max(1, math.ceil(self.count * q))
+        seen = 0
+        for idx in sorted(self.counts):
+            seen += self.counts[idx]
+            if seen >= rank:
+                return min(self._upper(idx), self.max)
+        return self.max
+
+    def cumulative(self, bounds_micros: list[int]) -> list[int]:
+        """Counts of values <= each bound (bucket-accurate)."""
+        items = sorted(self.counts.items())
+        out, seen, i = [], 0, 0
+        for bound in bounds_micros:
+            while i < len(items) and self._upper(items[i][0]) <= bound:
+                seen += items[i][1]
+                i += 1
+            out.append(seen)
+        return out
+
+
+# ── Registry ──────────────────────────────────────────────────────────────────
+
+class MetricsRegistry:
+    """Histograms keyed by (skill, action, outcome)."""
+
+    def __init__(self):
+        self._hists: dict[tuple[str, str, str], Histogram] = {}
+        self._lock   = threading.Lock()
+        self._flusher: threading.Thread | None = None
+        self.started = time.time()
+
+    def record(self, skill: str, action: str, seconds: float, outcome: str = "ok") -> None:
+        key = (skill, action, outcome)
+        with self._lock:
+            hist = self._hists.get(key)
+            if hist is None:
+                hist = self._hists[key] = Histogram()
+            hist.record(seconds * 1_000_000)
+        self._ensure_flusher()
+
+    def snapshot(self) -> dict[tuple[str, str, str], Histogram]:
+        with self._lock:
+            copy = {}
+            for key, hist in self._hists.items():
+                h = copy[key] = Histogram()
+                h.merge(hist)
+            return copy
+
+    # ── Prometheus text ───────────────────────────────────────────────────────
+
+    def render(self) -> str:
+        snap   = self.snapshot()
+        bounds = [int(b * 1_000_000) for b in BUCKETS]
+        lines  = [
+            f"# HELP {METRIC_NAME} Time spent per skill action.",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        for (skill, action, outcome), hist in sorted(snap.items()):
+            labels = _labels(skill=skill, action=action, outcome=outcome)
+            for b, n in zip(BUCKETS, hist.cumulative(bounds)):
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{b}"}} {n}')
+            lines.append(f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} {hist.count}')
+            lines.append(f"{METRIC_NAME}_sum{{{labels}}} {hist.total / 1_000_000:.6f}")
+            lines.append(f"{METRIC_NAME}_count{{{labels}}} {hist.count}")
+
+        lines += [
+            f"# HELP {METRIC_NAME}_quantile Latency quantiles from the HDR histogram.",
+            f"# TYPE {METRIC_NAME}_quantile gauge",
+        ]
+        for (skill, action, outcome), hist in sorted(snap.items()):
+            for q in QUANTILES:
+                labels = _labels(skill=skill, action=action, outcome=outcome, quantile=q)
+                lines.append(f"{METRIC_NAME}_quantile{{{labels}}} {hist.quantile(q) / 1_000_000:.6f}")
+        return "\n".join(lines) + "\n"
+
+    # ── File flushing ─────────────────────────────────────────────────────────
+
+    def flush(self, path: str | None = None) -> str | None:
+        """Write the Prometheus text file atomically. Returns its path."""
+        if multiprocessing.parent_process() is not None:
+            return None
+        path = path or metrics_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+        return path
+
+    def _ensure_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            time.sleep(FLUSH_SECONDS)
+            try:
+                self.flush()
+            except OSError as exc:
+                print(f"[metrics] flush failed: {exc}", file=sys.stderr)
+
+
+def _labels(**labels) -> str:
+    def esc(v) -> str:
+        return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return ",".join(f'{k}="{esc(v)}"' for k, v in labels.items())
+
+
+def metrics_path(name: str | None = None) -> str:
+    """Logs/metrics/<name>.prom — name defaults to the main script's stem."""
+    if name is None:
+        name = os.path.splitext(os.path.basename(sys.argv[0] or "python"))[0] or "python"
+    return os.path.join(METRICS_DIR, f"{name}.prom")
+
+
+REGISTRY = MetricsRegistry()
+
+
+def record(skill: str, action: str, duration_ms: float, outcome: str = "ok") -> None:
+    """Record a duration measured elsewhere (milliseconds)."""
+    REGISTRY.record(skill, action, duration_ms / 1000, outcome)
+
+
+def flush() -> str | None:
+    return REGISTRY.flush()
+
+
+def _flush_at_exit() -> None:
+    if REGISTRY._hists:
+        try:
+            REGISTRY.flush()
+        except OSError:
+            pass
+
+
+atexit.register(_flush_at_exit)
+
+
+# ── Timer ─────────────────────────────────────────────────────────────────────
+
+class timed:
+    """
+    Time a block, a function, or a manual span and record it under
+    (skill, action). outcome="error" is recorded when the block raises.
+    """
+
+    def __init__(self, skill: str, action: str):
+        self.skill   = skill
+        self.action  = action
+        self._start  = time.perf_counter()
+        self.ms      = 0
+
+    def __enter__(self) -> "timed":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.stop("ok" if exc_type is None else "error")
+        return False
+
+    def stop(self, outcome: str = "ok") -> int:
+        """Record the elapsed time since start; returns it in whole ms."""
+        elapsed = time.perf_counter() - self._start
+        REGISTRY.record(self.skill, self.action, elapsed, outcome)
+        self.ms = int(elapsed * 1000)
+        return self.ms
+
+    def __call__(self, func):
+        skill, action = self.skill, self.action
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(skill, action):
+                return func(*args, **kwargs)
+        return wrapper
@@ -0,0 +1,244 @@
+"""
+signal_bus.py — Append-only Signal Journals (Platinum Tier)
+-----------------------------------------------------------
+Replaces one `Signals/SIGNAL_<ts>_<event>.md` file per event. Each
+producer appends JSON lines to its own daily journal,
+
+  Signals/<producer>_<YYYY-MM-DD>.jsonl
+  {"seq": 42, "signal": "approval_needed", "task_id": "...", "source": "...", "timestamp": "..."}
+
+and each consumer keeps a cursor (byte offset + last seq per journal),
+so a burst of events is a few appends to one file instead of a file
+per event, and two events in the same second can no longer collide.
+
+  - SignalBus.emit()   : append one signal; returns its sequence number
+  - SignalBus.batch()  : collect emits and append them in one write
+  - SignalReader.read(): new signals from every journal, oldest first;
+                         commit() advances the cursor after processing
+  - SignalReader.prune(): delete fully read journals older than KEEP_DAYS
+
+Appends take an exclusive file lock (flock / msvcrt), so drafters running
+as several processes still get unique, increasing sequence numbers.
+Readers only take complete lines, so a journal caught mid-sync is fine.
+
+Usage:
+  from Shared.signal_bus import SignalBus, SignalReader
+
+  bus = SignalBus("EmailDrafter_Platinum")
+  bus.emit("approval_needed", task_id=task, approval_file=path)
+
+  reader = SignalReader("dashboard")
+  for sig in reader.read():
+      ...
+  reader.commit()
+"""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+if os.name == "nt":
+    import msvcrt
+
+    def _lock(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock(f) -> None:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(f) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+PLATINUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIGNALS_DIR  = os.path.join(PLATINUM_DIR, "Signals")
+CURSOR_DIR   = os.path.join(PLATINUM_DIR, "Logs", "signal_cursors")
+
+JOURNAL_EXT  = ".jsonl"
+TAIL_BYTES   = 8192    # enough to find the last record's seq
+KEEP_DAYS    = 2       # read journals kept this long (Cloud / Local clocks may differ)
+
+
+def journal_name(producer: str, day: str | None = None) -> str:
+    return f"{producer}_{day or datetime.now().strftime('%Y-%m-%d')}{JOURNAL_EXT}"
+
+
+def _last_seq(f) -> tuple[int, bool]:
+    """(seq of the last complete record, file ends with a newline) — f opened a+b."""
+    f.seek(0, os.SEEK_END)
+    size = f.tell()
+    if size == 0:
+        return 0, True
+    f.seek(max(0, size - TAIL_BYTES))
+    tail = f.read()
+    for line in reversed(tail.splitlines()):
+        try:
+            return int(json.loads(line)["seq"]), tail.endswith(b"\n")
+        except (ValueError, KeyError, TypeError):
+            continue
+    return 0, tail.endswith(b"\n")
+
+
+# ── Producer ──────────────────────────────────────────────────────────────────
+
+class SignalBus:
+    """Appends signals to this producer's journal."""
+
+    def __init__(self, producer: str, signals_dir: str = SIGNALS_DIR):
+        self.producer    = producer
+        self.signals_dir = signals_dir
+        self._local      = threading.local()   # per-thread batch buffer
+
+    def _append(self, records: list[dict]) -> int:
+        os.makedirs(self.signals_dir, exist_ok=True)
+        path = os.path.join(self.signals_dir, journal_name(self.producer))
+        with open(path, "a+b") as f:
+            _lock(f)
+            try:
+                seq, clean = _last_seq(f)
+                lines = [] if clean else [b""]    # finish a torn last line first
+                for rec in records:
+                    seq += 1
+                    rec["seq"] = seq
+                    lines.append(json.dumps(rec, ensure_ascii=False).encode("utf-8"))
+                f.write(b"\n".join(lines) + b"\n")
+                f.flush()
+            finally:
+                _unlock(f)
+        return seq
+
+    def emit(self, signal: str, **fields) -> int | None:
+        """Append one signal; its seq, or None while batching (assigned on flush)."""
+        record = {"seq": 0, "signal": signal, **fields,
+                  "source": self.producer, "timestamp": datetime.now().isoformat()}
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append(record)
+            return None
+        return self._append([record])
+
+    @contextmanager
+    def batch(self):
+        """Emits inside the block are written together in one locked append."""
+        if getattr(self._local, "pending", None) is not None:
+            yield self                        # nested: the outer batch writes
+            return
+        self._local.pending = []
+        try:
+            yield self
+        finally:
+            pending, self._local.pending = self._local.pending, None
+            if pending:
+                self._append(pending)
+
+
+# ── Consumer ──────────────────────────────────────────────────────────────────
+
+class SignalReader:
+    """Reads new signals from every journal, tracking a cursor per journal."""
+
+    def __init__(self, consumer: str, signals_dir: str = SIGNALS_DIR, cursor_dir: str = CURSOR_DIR):
+        self.signals_dir = signals_dir
+        self.cursor_file = os.path.join(cursor_dir, f"{consumer}.json")
+        self.cursors     = self._load()
+        self._pending: dict[str, dict] = {}
+
+    def _load(self) -> dict[str, dict]:
+        try:
+            with open(self.cursor_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def journals(self) -> list[str]:
+        try:
+            return sorted(n for n in os.listdir(self.signals_dir) if n.endswith(JOURNAL_EXT))
+        except FileNotFoundError:
+            return []
+
+    def read(self) -> list[dict]:
+        """Signals appended since the last commit(), oldest first."""
+        out = []
+        self._pending = {}
+        for name in self.journals():
+            path = os.path.join(self.signals_dir, name)
+            cur  = self.cursors.get(name, {"seq": 0, "offset": 0})
+            try:
+                size = os.path.getsize(path)
+                if size < cur["offset"]:
+                    cur = {"seq": 0, "offset": 0}     # journal was replaced
+                if size == cur["offset"]:
+                    continue
+                with open(path, "rb") as f:
+                    f.seek(cur["offset"])
+                    data = f.read(size - cur["offset"])
+            except OSError:
+                continue
+
+            end = data.rfind(b"\n") + 1                # complete lines only
+            seq = cur["seq"]
+            for line in data[:end].splitlines():
+                try:
+                    rec = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(rec, dict) or int(rec.get("seq", 0)) <= seq:
+                    continue
+                seq = int(rec["seq"])
+                out.append(rec)
+            self._pending[name] = {"seq": seq, "offset": cur["offset"] + end}
+
+        out.sort(key=lambda r: r.get("timestamp", ""))
+        return out
+
+    def commit(self) -> None:
+        """Mark everything returned by the last read() as processed."""
+        if not self._pending:
+            return
+        self.cursors.update(self._pending)
+        self._pending = {}
+        self._save()
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(self.cursor_file), exist_ok=True)
+        tmp = self.cursor_file + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.cursors, f)
+        os.replace(tmp, self.cursor_file)
+
+    def prune(self, keep_days: int = KEEP_DAYS) -> list[str]:
+        """Delete journals read to the end whose day is older than keep_days."""
+        cutoff  = (datetime.now() - timedelta(days=keep_days)).strftime("%Y-%m-%d")
+        removed = []
+        for name in self.journals():
+            day = name[:-len(JOURNAL_EXT)].rsplit("_", 1)[-1]
+            cur = self.cursors.get(name)
+            if day >= cutoff or cur is None:
+                continue
+            path = os.path.join(self.signals_dir, name)
+            try:
+                if os.path.getsize(path) != cur["offset"]:
+                    continue
+                os.remove(path)
+            except OSError:
+                continue
+            removed.append(name)
+            del self.cursors[name]
+        present = set(self.journals())
+        stale   = [name for name in self.cursors if name not in present]
+        for name in stale:
+            del self.cursors[name]
+        if removed or stale:
+            self._save()
+        return removed
@@ -0,0 +1,255 @@
+"""
+status_server.py — Local HTTP Status Endpoint (Platinum Tier)
+-------------------------------------------------------------
+Minimal asyncio HTTP/1.1 server for supervisors (orchestrator, watchdog)
+to expose health, metrics and control routes without extra packages.
+
+  - StatusServer     : runs its own event loop on a daemon thread, so the
+                       supervisor's main loop stays as it is
+  - read_proc_stats  : RSS / CPU seconds / threads for a pid from /proc
+  - count_files      : queue depth of a task folder (and its subfolders)
+  - merge_prom_files : combine Logs/metrics/*.prom into one exposition
+
+Usage:
+  from Shared.status_server import StatusServer
+
+  server = StatusServer("127.0.0.1", 8765, token="")
+  server.route("GET", r"/healthz", lambda match, body: (200, "application/json", "{}"))
+  server.start()
+  ...
+  server.stop()
+
+Handlers run on a worker thread (they may block briefly) and return
+(status, content_type, body). When a token is set, every non-GET request
+must send `Authorization: Bearer <token>`.
+"""
+
+import asyncio
+import hmac
+import os
+import re
+import threading
+from typing import Callable
+from urllib.parse import urlsplit
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+READ_TIMEOUT = 5          # seconds to receive a full request
+MAX_BODY     = 64 * 1024  # bytes
+
+REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 401: "Unauthorized",
+    404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+    413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+Handler = Callable[[re.Match, bytes], tuple[int, str, str | bytes]]
+
+
+# ── /proc helpers ─────────────────────────────────────────────────────────────
+
+_CLK_TCK   = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def read_proc_stats(pid: int) -> dict | None:
+    """RSS bytes, CPU seconds (user+system) and thread count, or None off Linux / dead pid."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read().decode("latin-1")
+        with open(f"/proc/{pid}/statm", "rb") as f:
+            statm = f.read().split()
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces — split after the closing paren
+    fields = stat[stat.rindex(")") + 2:].split()
+    utime, stime = int(fields[11]), int(fields[12])
+    return {
+        "rss_bytes":   int(statm[1]) * _PAGE_SIZE,
+        "cpu_seconds": (utime + stime) / _CLK_TCK,
+        "threads":     int(fields[17]),
+    }
+
+
+def count_files(path: str, suffix: str = ".md") -> int:
+    """Files ending in suffix directly in path or one level below (cloud/, local/)."""
+    total = 0
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    total += 1
+                elif entry.is_dir():
+                    with os.scandir(entry.path) as sub:
+                        total += sum(1 for e in sub if e.is_file() and e.name.endswith(suffix))
+    except FileNotFoundError:
+        pass
+    return total
+
+
+_SAMPLE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(.*)\})?\s+(.+)$")
+
+
+def merge_prom_files(paths: list[str]) -> str:
+    """
+    Merge per-process Prometheus text files into one exposition, tagging
+    each sample with process="<file stem>" and grouping samples by family
+    (one HELP/TYPE header per family, as the format requires).
+    """
+    families: dict[str, dict] = {}
+    for path in paths:
+        proc   = os.path.splitext(os.path.basename(path))[0]
+        family = None
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                family = line.split()[2]
+                fam    = families.setdefault(family, {"meta": [], "samples": []})
+                if line not in fam["meta"]:
+                    fam["meta"].append(line)
+                continue
+            m = _SAMPLE.match(line)
+            if not m:
+                continue
+            name, _, labels, value = m.groups()
+            labels = f'process="{proc}"' + (f",{labels}" if labels else "")
+            key    = family if family and name.startswith(family) else name
+            families.setdefault(key, {"meta": [], "samples": []})["samples"].append(
+                f"{name}{{{labels}}} {value}")
+
+    out = []
+    for fam in families.values():
+        out.extend(fam["meta"])
+        out.extend(fam["samples"])
+    return "\n".join(out) + ("\n" if out else "")
+
+
+# ── Server ────────────────────────────────────────────────────────────────────
+
+class StatusServer:
+    """Tiny routed HTTP server on a background asyncio loop."""
+
+    def __init__(self, host: str, port: int, token: str = ""):
+        self.host    = host
+        self.port    = port
+        self.token   = token
+        self._routes: list[tuple[str, re.Pattern, Handler]] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._thread: threading.Thread | None = None
+        self._ready  = threading.Event()
+        self.error: Exception | None = None
+
+    def route(self, method: str, pattern: str, handler: Handler) -> None:
+        self._routes.append((method.upper(), re.compile(f"^{pattern}$"), handler))
+
+    # ── Lifecycle ─────────────────────────────────────────────────────────────
+
+    def start(self, timeout: float = 5.0) -> bool:
+        """Start serving; returns False (and sets .error) if the bind failed."""
+        self._thread = threading.Thread(target=self._serve, name="status-server", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout)
+        return self.error is None and self._server is not None
+
+    def _serve(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port))
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as exc:
+            self.error = exc
+            self._ready.set()
+            self._loop.close()
+            return
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._server.close()
+            self._loop.run_until_complete(self._server.wait_closed())
+            self._loop.close()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._loop.is_running():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    # ── Request handling ──────────────────────────────────────────────────────
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple[str, str, dict, bytes]:
+        request_line = await reader.readline()
+        method, target, _ = request_line.decode("latin-1").split(" ", 2)
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin-1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        length = int(headers.get("content-length") or 0)
+        if length > MAX_BODY:
+            raise OverflowError
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), urlsplit(target).path, headers, body
+
+    def _authorized(self, method: str, headers: dict) -> bool:
+        if not self.token or method == "GET":
+            return True
+        given = headers.get("authorization", "")
+        return hmac.compare_digest(given, f"Bearer {self.token}")
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> tuple[int, str, str | bytes]:
+        allowed = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            if route_method != method:
+                allowed = True
+                continue
+            return await asyncio.get_running_loop().run_in_executor(None, handler, match, body)
+        if allowed:
+            return 405, "text/plain", "method not allowed\n"
+        return 404, "text/plain", "not found\n"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, headers, body = await asyncio.wait_for(
+                    self._read_request(reader), READ_TIMEOUT)
+            except OverflowError:
+                status, ctype, payload = 413, "text/plain", "body too large\n"
+            except (ValueError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+                status, ctype, payload = 400, "text/plain", "bad request\n"
+            else:
+                if not self._authorized(method, headers):
+                    status, ctype, payload = 401, "text/plain", "unauthorized\n"
+                else:
+                    try:
+                        status, ctype, payload = await self._dispatch(method, path, body)
+                    except Exception as exc:
+                        status, ctype, payload = 500, "text/plain", f"{exc}\n"
+
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            head = (
+                f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+                f"Content-Type: {ctype}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode("latin-1") + payload)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,188 @@
+"""
+supervisor.py — Non-blocking Restart Supervisor (Platinum Tier)
+----------------------------------------------------------------
+Restart policy shared by Cloud/orchestrator.py and Local/watchdog.py.
+
+A crashed service is never waited on inline: tick() notes the crash,
+schedules that service's restart on its own timer and returns, so every
+other service keeps being checked while one of them flaps.
+
+  - exponential backoff : base_delay * 2^n, capped at max_delay, ±jitter
+  - stable_after        : a run that lasts this long resets the backoff
+  - restart budget      : more than `budget` crashes inside `window`
+                          seconds puts the service in FATAL — no more
+                          restarts until reset() (e.g. manual restart)
+  - FATAL is appended to the signal bus so it reaches the Local Dashboard
+
+States: RUNNING → BACKOFF → RUNNING ... or → FATAL
+
+Usage:
+  from Shared.supervisor import Supervisor
+
+  sup = Supervisor(SKILL, log, base_delay=RESTART_DELAY)
+  for svc in services:           # objects with name/script/start()/is_alive()/restarts
+      sup.add(svc)
+  while True:
+      sup.tick()
+      time.sleep(sup.sleep_for(POLL_INTERVAL))
+"""
+
+import os
+import random
+import time
+from collections import deque
+from datetime import datetime
+
+from Shared.signal_bus import SignalBus
+from Shared.sync_trigger import notify
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+PLATINUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SIGNALS_DIR  = os.path.join(PLATINUM_DIR, "Signals")
+
+MAX_BACKOFF    = int(os.environ.get("SUPERVISOR_MAX_BACKOFF", "300"))     # seconds
+RESTART_BUDGET = int(os.environ.get("SUPERVISOR_RESTART_BUDGET", "5"))    # crashes ...
+BUDGET_WINDOW  = int(os.environ.get("SUPERVISOR_BUDGET_WINDOW", "600"))   # ... per this many seconds
+STABLE_AFTER   = 60     # seconds of uptime that count as a healthy run
+JITTER         = 0.2    # ±20% on every backoff delay
+
+RUNNING = "RUNNING"
+BACKOFF = "BACKOFF"
+FATAL   = "FATAL"
+
+
+class _ServiceState:
+    __slots__ = ("svc", "state", "attempt", "crashes", "restart_at", "started_at", "exit_code")
+
+    def __init__(self, svc):
+        self.svc        = svc
+        self.state      = RUNNING
+        self.attempt    = 0          # consecutive short-lived runs
+        self.crashes    = deque()    # crash timestamps inside the budget window
+        self.restart_at = 0.0
+        self.started_at = time.monotonic()
+        self.exit_code  = None
+
+
+# ── Supervisor ────────────────────────────────────────────────────────────────
+
+class Supervisor:
+    """Per-service restart timers with backoff, jitter and a crash budget."""
+
+    def __init__(
+        self,
+        skill: str,
+        log,
+        base_delay: float,
+        max_delay: float = MAX_BACKOFF,
+        budget: int = RESTART_BUDGET,
+        window: float = BUDGET_WINDOW,
+        stable_after: float = STABLE_AFTER,
+        jitter: float = JITTER,
+        signals_dir: str = SIGNALS_DIR,
+    ):
+        self.skill        = skill
+        self.log          = log
+        self.base_delay   = base_delay
+        self.max_delay    = max_delay
+        self.budget       = budget
+        self.window       = window
+        self.stable_after = stable_after
+        self.jitter       = jitter
+        self.signals      = SignalBus(skill, signals_dir)
+        self._states: dict[str, _ServiceState] = {}
+
+    def add(self, svc) -> None:
+        self._states[svc.name] = _ServiceState(svc)
+
+    # ── Policy ────────────────────────────────────────────────────────────────
+
+    def _delay(self, attempt: int) -> float:
+        delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+        return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def tick(self, now: float | None = None) -> None:
+        """Check every service once; never sleeps."""
+        now = time.monotonic() if now is None else now
+        for st in self._states.values():
+            svc = st.svc
+            if not os.path.exists(svc.script):
+                continue
+
+            if st.state == RUNNING:
+                if svc.is_alive():
+                    if st.attempt and now - st.started_at >= self.stable_after:
+                        st.attempt = 0
+                    continue
+                self._on_crash(st, now)
+
+            elif st.state == BACKOFF and now >= st.restart_at:
+                svc.start()
+                st.state      = RUNNING
+                st.started_at = now
+                self.log.log(self.skill, f"restart_{svc.name}", "success",
+                             detail=f"restart #{svc.restarts}")
+
+    def _on_crash(self, st: _ServiceState, now: float) -> None:
+        svc  = st.svc
+        proc = getattr(svc, "proc", None)
+        st.exit_code = proc.returncode if proc is not None else getattr(svc, "exit_code", None)
+
+        st.crashes.append(now)
+        while st.crashes and now - st.crashes[0] > self.window:
+            st.crashes.popleft()
+
+        ts = datetime.now().strftime("%H:%M:%S")
+        if len(st.crashes) > self.budget:
+            st.state = FATAL
+            detail   = (f"{len(st.crashes)} crashes in {self.window}s "
+                        f"(exit {st.exit_code}) — restarts stopped")
+            print(f"[{ts}] FATAL    {svc.name}  {detail}")
+            self.log.log(self.skill, f"fatal_{svc.name}", "FATAL", detail=detail)
+            self._write_fatal_signal(svc.name, detail)
+            return
+
+        if now - st.started_at < self.stable_after:
+            st.attempt += 1
+        else:
+            st.attempt = 1
+        delay         = self._delay(st.attempt - 1)
+        st.state      = BACKOFF
+        st.restart_at = now + delay
+        svc.restarts += 1
+        print(f"[{ts}] CRASHED  {svc.name}  (exit {st.exit_code}, "
+              f"restart #{svc.restarts} in {delay:.1f}s)")
+        self.log.log(self.skill, f"crash_{svc.name}", "restarting",
+                     detail=f"restart #{svc.restarts} in {delay:.1f}s exit={st.exit_code}")
+
+    def _write_fatal_signal(self, name: str, detail: str) -> None:
+        self.signals.emit("service_fatal", task_id=name, detail=detail)
+        notify(self.skill)
+
+    # ── Control / introspection ───────────────────────────────────────────────
+
+    def reset(self, name: str) -> None:
+        """Forget crash history (after a manual restart) and mark RUNNING."""
+        st = self._states[name]
+        st.state      = RUNNING
+        st.attempt    = 0
+        st.crashes.clear()
+        st.started_at = time.monotonic()
+
+    def describe(self, name: str) -> dict:
+        st  = self._states[name]
+        now = time.monotonic()
+        return {
+            "state":             st.state,
+            "crashes_in_window": len(st.crashes),
+            "restart_in":        round(max(0.0, st.restart_at - now), 1) if st.state == BACKOFF else None,
+            "last_exit_code":    st.exit_code,
+        }
+
+    def sleep_for(self, poll_interval: float, now: float | None = None) -> float:
+        """Seconds until the next liveness check or scheduled restart, whichever is first."""
+        now  = time.monotonic() if now is None else now
+        due  = [st.restart_at - now for st in self._states.values() if st.state == BACKOFF]
+        return max(0.0, min([poll_interval, *due]))
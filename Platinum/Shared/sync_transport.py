@@ -0,0 +1,435 @@
+"""
+sync_transport.py — Direct Cloud -> Local File Transport (Platinum Tier)
+------------------------------------------------------------------------
+Moves hot-path files (Signals/, Pending_Approval/cloud/) straight to
+Local instead of through a git commit each. Only files whose content
+hash changed since the last delivery are sent.
+
+  - build_manifest    : {relpath: sha256} for the hot paths, hashes cached
+                        by (mtime, size) so unchanged files aren't re-read
+  - RsyncTransport    : `rsync --files-from` over ssh (or to a local path)
+  - SocketTransport   : length-prefixed file pushes to a SyncReceiver over
+                        TCP (e.g. through `ssh -R`) or a Unix socket
+  - SyncReceiver      : the Local end of SocketTransport; writes atomically,
+                        checks every hash, refuses paths outside the hot paths
+  - ensure_git_excluded : keep hot paths out of git on both clones, or a
+                        later `git pull` would trip over the untracked copies
+  - tracked_hot_paths / untrack_hot_paths : exclude can't hide files git
+                        already tracks; those need a one-time `git rm --cached`
+                        (see below) before a direct transport may start
+
+Paths are relative to the vault root with "/" separators on both ends.
+
+Migrating a vault whose hot paths were committed (stop both sync sides first):
+  Cloud: python Cloud/sync_agent.py --untrack-hot-paths && git push
+  Local: python Local/sync_receiver.py --untrack-hot-paths && git pull
+Both sides commit the same index removal, so the pull merges cleanly and
+the files stay on disk.
+
+Usage:
+  from Shared.sync_transport import SocketTransport, SyncReceiver, build_manifest
+
+  SyncReceiver(VAULT_ROOT, "127.0.0.1:8790", token=TOKEN, paths=HOT_PATHS).serve_forever()
+
+  transport = SocketTransport("127.0.0.1:8790", token=TOKEN)
+  manifest  = build_manifest(VAULT_ROOT, HOT_PATHS)
+  transport.push(VAULT_ROOT, changed=[...], deleted=[...])
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import threading
+import uuid
+from abc import ABC, abstractmethod
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+HOT_PATHS      = ["Platinum/Signals", "Platinum/Pending_Approval/cloud"]
+SOCKET_TIMEOUT = 30                  # seconds per socket operation
+RSYNC_TIMEOUT  = 120                 # seconds per rsync run
+MAX_FILE       = 16 * 1024 * 1024    # bytes — task files are a few KB
+
+
+class TransportError(Exception):
+    """Delivery failed; the caller keeps its manifest and retries next cycle."""
+
+
+# ── Manifests ─────────────────────────────────────────────────────────────────
+
+_hash_cache: dict[str, tuple[int, int, str]] = {}
+_hash_lock  = threading.Lock()
+
+
+def file_sha256(path: str) -> str:
+    """sha256 of a file, reusing the last digest while (mtime, size) match."""
+    st = os.stat(path)
+    with _hash_lock:
+        hit = _hash_cache.get(path)
+    if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _hash_lock:
+        _hash_cache[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def build_manifest(root: str, paths: list[str] = HOT_PATHS) -> dict[str, str]:
+    """{relpath: sha256} for every regular file under root/paths (recursive)."""
+    manifest = {}
+    for rel_dir in paths:
+        top = os.path.join(root, rel_dir)
+        for dirpath, dirnames, filenames in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.startswith("."):
+                    continue      # .keep, editor temp files
+                full = os.path.join(dirpath, name)
+                try:
+                    manifest[os.path.relpath(full, root).replace(os.sep, "/")] = file_sha256(full)
+                except OSError:
+                    continue      # moved / deleted while walking
+    return manifest
+
+
+def safe_path(root: str, rel: str, allowed: list[str]) -> str:
+    """Absolute path for rel under root; ValueError if it escapes root or the allowed paths."""
+    if not rel or rel.startswith("/") or "\\" in rel or ".." in rel.split("/"):
+        raise ValueError(f"bad path: {rel!r}")
+    if not any(rel.startswith(p.rstrip("/") + "/") for p in allowed):
+        raise ValueError(f"path outside sync paths: {rel!r}")
+    return os.path.join(root, *rel.split("/"))
+
+
+def _git(root: str, args: list[str]) -> subprocess.CompletedProcess | None:
+    """Run git in root; None when git itself could not run."""
+    try:
+        return subprocess.run(["git", *args], cwd=root, capture_output=True,
+                              text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def ensure_git_excluded(root: str, paths: list[str] = HOT_PATHS) -> bool:
+    """Add paths to this clone's .git/info/exclude (not committed). False if not a git clone."""
+    result = _git(root, ["rev-parse", "--git-path", "info/exclude"])
+    if result is None or result.returncode != 0:
+        return False
+    exclude = os.path.join(root, result.stdout.strip())
+    try:
+        with open(exclude, encoding="utf-8") as f:
+            present = set(f.read().splitlines())
+    except FileNotFoundError:
+        present = set()
+    missing = [f"/{p.strip('/')}/" for p in paths if f"/{p.strip('/')}/" not in present]
+    if missing:
+        os.makedirs(os.path.dirname(exclude), exist_ok=True)
+        with open(exclude, "a", encoding="utf-8") as f:
+            f.write("# direct sync transport (sync_agent)\n" + "".join(f"{m}\n" for m in missing))
+    return True
+
+
+def tracked_hot_paths(root: str, paths: list[str] = HOT_PATHS) -> list[str]:
+    """Files under paths that git still tracks (exclude has no effect on them)."""
+    result = _git(root, ["ls-files", "-z", "--", *paths])
+    if result is None or result.returncode != 0:
+        return []
+    return [p for p in result.stdout.split("\0") if p]
+
+
+def untrack_hot_paths(root: str, paths: list[str] = HOT_PATHS) -> list[str]:
+    """
+    One-time migration: `git rm -r --cached` the hot paths (files stay on
+    disk) and commit that alone. Returns the files untracked.
+    """
+    tracked = tracked_hot_paths(root, paths)
+    if not tracked:
+        return []
+    staged = _git(root, ["diff", "--cached", "--quiet"])
+    if staged is None or staged.returncode != 0:
+        # `git commit -- <paths>` would re-add the files, so the index must hold only this
+        raise TransportError("other changes are staged — commit or unstage them first")
+    for args in (["rm", "-r", "-q", "--cached", "--", *paths],
+                 ["commit", "-q", "-m", "Stop tracking direct-sync hot paths"]):
+        result = _git(root, args)
+        if result is None or result.returncode != 0:
+            err = result.stderr.strip() if result is not None else "git not runnable"
+            raise TransportError(f"git {args[0]} failed: {err}")
+    return tracked
+
+
+# ── Transports ────────────────────────────────────────────────────────────────
+
+class Transport(ABC):
+    """Delivers changed / deleted files (relpaths under root) to the other side."""
+
+    name      = "base"
+    remote_id = None     # receiver identity from the last remote_manifest()
+
+    @abstractmethod
+    def push(self, root: str, changed: list[str], deleted: list[str]) -> None:
+        """Deliver everything or raise TransportError."""
+        ...
+
+    def remote_manifest(self) -> dict[str, str] | None:
+        """What the other side holds now, or None if this transport can't tell."""
+        return None
+
+    def close(self) -> None:
+        pass
+
+
+class RsyncTransport(Transport):
+    """
+    One `rsync --files-from` run per push: rsync's delta algorithm moves
+    only changed blocks, and --delete-missing-args turns listed paths that
+    no longer exist here into deletions on the target.
+
+    target: "user@host:/path/to/vault/" (over ssh) or a local directory.
+    """
+
+    name = "rsync"
+
+    def __init__(self, target: str, ssh: str = "ssh -o BatchMode=yes", rsync: str = "rsync"):
+        if shutil.which(rsync) is None:
+            raise TransportError(f"{rsync} not found on PATH")
+        self.target = target if target.endswith("/") else target + "/"
+        self.ssh    = ssh
+        self.rsync  = rsync
+
+    def command(self, root: str) -> list[str]:
+        cmd = [self.rsync, "--archive", "--compress", "--checksum",
+               "--from0", "--files-from=-", "--delete-missing-args"]
+        if ":" in self.target.split("/", 1)[0]:
+            cmd += ["-e", self.ssh]
+        return cmd + [root.rstrip("/\\") + "/", self.target]
+
+    def push(self, root: str, changed: list[str], deleted: list[str]) -> None:
+        files = changed + deleted
+        if not files:
+            return
+        try:
+            result = subprocess.run(
+                self.command(root), input="\0".join(files),
+                capture_output=True, text=True, timeout=RSYNC_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            raise TransportError(f"rsync failed: {exc}") from exc
+        if result.returncode != 0:
+            raise TransportError(f"rsync exit {result.returncode}: {result.stderr.strip()[:200]}")
+
+
+def parse_address(address: str) -> tuple[int, object]:
+    """("host:port" | "unix:/path" | "/path") -> (socket family, connect/bind address)."""
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[5:]
+    if address.startswith("/"):
+        return socket.AF_UNIX, address
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def _send(sock: socket.socket, header: dict, payload: bytes = b"") -> None:
+    sock.sendall(json.dumps(header).encode("utf-8") + b"\n" + payload)
+
+
+def _recv_line(rfile) -> dict:
+    line = rfile.readline(MAX_FILE)
+    if not line:
+        raise ConnectionError("connection closed")
+    return json.loads(line)
+
+
+class SocketTransport(Transport):
+    """
+    Client of SyncReceiver. One connection per push, one request line per
+    file (`put` with the bytes, or `delete`); the receiver answers each
+    line, so a failure names the file that failed.
+    """
+
+    name = "socket"
+
+    def __init__(self, address: str, token: str = ""):
+        self.address = address
+        self.token   = token
+
+    def _connect(self) -> tuple[socket.socket, object]:
+        family, addr = parse_address(self.address)
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.settimeout(SOCKET_TIMEOUT)
+            sock.connect(addr)
+        except OSError as exc:
+            raise TransportError(f"connect {self.address}: {exc}") from exc
+        return sock, sock.makefile("rb")
+
+    def _call(self, sock, rfile, header: dict, payload: bytes = b"") -> dict:
+        _send(sock, {**header, "token": self.token}, payload)
+        reply = _recv_line(rfile)
+        if not reply.get("ok"):
+            what = f"{header['op']} {header.get('path', '')}".rstrip()
+            raise TransportError(f"{what}: {reply.get('error')}")
+        return reply
+
+    def push(self, root: str, changed: list[str], deleted: list[str]) -> None:
+        if not changed and not deleted:
+            return
+        sock, rfile = self._connect()
+        try:
+            for rel in changed:
+                with open(os.path.join(root, *rel.split("/")), "rb") as f:
+                    data = f.read()
+                self._call(sock, rfile, {
+                    "op": "put", "path": rel, "size": len(data),
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                }, data)
+            for rel in deleted:
+                self._call(sock, rfile, {"op": "delete", "path": rel})
+        except (OSError, ValueError) as exc:
+            raise TransportError(str(exc)) from exc
+        finally:
+            rfile.close()
+            sock.close()
+
+    def remote_manifest(self) -> dict[str, str] | None:
+        sock, rfile = self._connect()
+        try:
+            reply          = self._call(sock, rfile, {"op": "manifest"})
+            self.remote_id = reply.get("receiver")
+            return reply["files"]
+        except (OSError, ValueError) as exc:
+            raise TransportError(str(exc)) from exc
+        finally:
+            rfile.close()
+            sock.close()
+
+
+# ── Receiver (Local side / test stand-in) ─────────────────────────────────────
+
+class _ReceiverHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        recv = self.server.receiver
+        while True:
+            try:
+                header = _recv_line(self.rfile)
+            except (ConnectionError, ValueError, OSError):
+                return
+            size    = int(header.get("size") or 0) if header.get("op") == "put" else 0
+            payload = self.rfile.read(size) if 0 < size <= MAX_FILE else b""
+            try:
+                reply = recv.handle(header, payload)
+            except (ValueError, OSError) as exc:
+                reply = {"ok": False, "error": str(exc)}
+            try:
+                self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            except OSError:
+                return
+            if not reply.get("ok") and reply.get("fatal"):
+                return
+
+
+class SyncReceiver:
+    """Accepts SocketTransport pushes into root, limited to `paths`."""
+
+    def __init__(self, root: str, address: str, token: str = "", paths: list[str] = HOT_PATHS,
+                 on_change=None):
+        self.id        = self._receiver_id(root)
+        self.root      = root
+        self.address   = address
+        self.token     = token
+        self.paths     = paths
+        self.on_change = on_change       # callable(op, relpath) after each write / delete
+        family, addr   = parse_address(address)
+        if family == socket.AF_UNIX:
+            if os.path.exists(addr):
+                os.remove(addr)          # stale socket from a previous run
+            server_cls = socketserver.ThreadingUnixStreamServer
+        else:
+            server_cls = socketserver.ThreadingTCPServer
+            server_cls.allow_reuse_address = True
+        self.server = server_cls(addr, _ReceiverHandler)
+        self.server.daemon_threads = True
+        self.server.receiver       = self
+        self._lock  = threading.Lock()   # one write at a time per path set
+        self._served = False
+
+    @staticmethod
+    def _receiver_id(root: str) -> str:
+        """Stable id of this clone; a new one tells senders to resend, not prune."""
+        path = os.path.join(root, "Platinum", "Logs", "sync_state", "receiver_id")
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            rid = uuid.uuid4().hex
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(rid)
+            return rid
+
+    @property
+    def bound(self):
+        return self.server.server_address
+
+    def handle(self, header: dict, payload: bytes) -> dict:
+        if self.token and not hmac.compare_digest(str(header.get("token", "")), self.token):
+            return {"ok": False, "error": "unauthorized", "fatal": True}
+        op = header.get("op")
+
+        if op == "manifest":
+            return {"ok": True, "receiver": self.id, "files": build_manifest(self.root, self.paths)}
+
+        path = safe_path(self.root, str(header.get("path", "")), self.paths)
+        if op == "put":
+            if len(payload) != int(header.get("size", -1)):
+                return {"ok": False, "error": "size mismatch", "fatal": True}
+            if hashlib.sha256(payload).hexdigest() != header.get("sha256"):
+                return {"ok": False, "error": "sha256 mismatch"}
+            with self._lock:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # Dot-prefixed: skipped by build_manifest and the watchers
+                tmp = os.path.join(os.path.dirname(path),
+                                   f".{os.path.basename(path)}.{threading.get_ident()}.part")
+                with open(tmp, "wb") as f:
+                    f.write(payload)
+                os.replace(tmp, path)
+        elif op == "delete":
+            with self._lock:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        else:
+            return {"ok": False, "error": f"unknown op {op!r}"}
+
+        if self.on_change is not None:
+            self.on_change(op, header["path"])
+        return {"ok": True}
+
+    def serve_forever(self) -> None:
+        self._served = True
+        self.server.serve_forever(poll_interval=0.5)
+
+    def start(self) -> threading.Thread:
+        """Serve on a daemon thread (tests, or embedding in another service)."""
+        thread = threading.Thread(target=self.serve_forever, name="sync-receiver", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        if self._served:
+            self.server.shutdown()      # blocks forever if serve_forever never ran
+        self.server.server_close()
+        family, addr = parse_address(self.address)
+        if family == socket.AF_UNIX and os.path.exists(addr):
+            os.remove(addr)
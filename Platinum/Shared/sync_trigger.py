@@ -0,0 +1,113 @@
+"""
+sync_trigger.py — Sync Request Channel (Platinum Tier)
+------------------------------------------------------
+Lets Cloud agents ask sync_agent for a sync as soon as they write
+something Local needs, instead of waiting out SYNC_INTERVAL.
+
+The channel is a touch-file: notify() rewrites Logs/sync_trigger/sync.trigger,
+SyncTrigger watches that folder through DirChangeWaiter (inotify on Linux,
+watchdog / polling elsewhere) and also compares the file's mtime, so it
+works across processes, in orchestrator thread mode, and with no
+notification backend at all. A request made while the sync agent is down
+is picked up when it starts.
+
+  - notify(source)   : best effort, never raises — safe in any writer
+  - SyncTrigger.wait : True once a request arrived and the DEBOUNCE window
+                       (default 5s) has passed, so a burst of drafts and
+                       signals becomes one sync; False on timeout / stop
+
+Usage:
+  from Shared.sync_trigger import notify, SyncTrigger
+
+  notify("email_drafter")                      # writer side
+
+  trigger = SyncTrigger()                      # sync_agent side
+  while not stop.is_set():
+      sync()
+      trigger.wait(SYNC_INTERVAL, stop)        # periodic sync stays the safety net
+  trigger.close()
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+PLATINUM_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PLATINUM_DIR)
+
+from Shared.dir_events import DirChangeWaiter
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+TRIGGER_DIR  = os.environ.get("SYNC_TRIGGER_DIR", os.path.join(PLATINUM_DIR, "Logs", "sync_trigger"))
+TRIGGER_FILE = "sync.trigger"
+DEBOUNCE     = float(os.environ.get("SYNC_DEBOUNCE", "5"))   # seconds to coalesce requests
+WAIT_SLICE   = 1.0    # seconds between stop / mtime checks
+
+
+def notify(source: str = "", trigger_dir: str = TRIGGER_DIR) -> None:
+    """Request a sync soon. Never raises — a missed request waits for the next interval."""
+    try:
+        os.makedirs(trigger_dir, exist_ok=True)
+        with open(os.path.join(trigger_dir, TRIGGER_FILE), "w", encoding="utf-8") as f:
+            f.write(f"{datetime.now().isoformat()} {source}\n")
+    except OSError:
+        pass
+
+
+# ── Listener ──────────────────────────────────────────────────────────────────
+
+class SyncTrigger:
+    """Blocks until a sync is requested (debounced) or the timeout passes."""
+
+    def __init__(self, trigger_dir: str = TRIGGER_DIR, debounce: float = DEBOUNCE, mode: str = "auto"):
+        os.makedirs(trigger_dir, exist_ok=True)
+        self.path     = os.path.join(trigger_dir, TRIGGER_FILE)
+        self.debounce = debounce
+        self.waiter   = DirChangeWaiter([trigger_dir], mode=mode, debounce=0)
+        self._stamp   = self._mtime()
+
+    @property
+    def backend(self) -> str:
+        return self.waiter.name
+
+    def _mtime(self) -> int | None:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _requested(self) -> bool:
+        stamp = self._mtime()
+        if stamp != self._stamp:
+            self._stamp = stamp
+            return True
+        return False
+
+    def wait(self, timeout: float, stop: threading.Event | None = None) -> bool:
+        """True when a sync was requested (after the debounce window), False on timeout or stop."""
+        stop     = stop or threading.Event()
+        deadline = time.monotonic() + timeout
+        while True:
+            if stop.is_set():
+                return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return self._requested()
+            # The waiter only wakes us early; the mtime says whether it was a request
+            self.waiter.wait(min(remaining, WAIT_SLICE))
+            if self._requested():
+                break
+
+        # Coalesce: everything notified during the window rides this sync
+        if stop.wait(self.debounce):
+            return False
+        self.waiter.wait(0)
+        self._requested()
+        return True
+
+    def close(self) -> None:
+        self.waiter.close()
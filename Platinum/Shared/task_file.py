@@ -0,0 +1,216 @@
+"""
+task_file.py — Task File Parser (Platinum Tier)
+-----------------------------------------------
+One parser for the markdown task / approval files every agent reads.
+On first access a file is tokenized in a single regex pass into:
+
+  - title       : first `# Heading` line
+  - frontmatter : leading `---` block, `key: value` lines
+  - comment     : `<!-- AGENT METADATA ... -->` block, `key: value` lines
+  - fields      : `**Key:** value` lines
+  - values      : bare `key: value` lines (post_type: text, ...)
+  - sections    : `## Title` -> text up to the next `##` line
+
+Tokens are recognised at the start of a line (after optional indent or a
+list bullet). Field, value and section names are looked up
+case-insensitively; when a name appears twice the first one wins.
+
+load(path) caches the parsed file by (path, mtime, size), so a watcher
+that re-scans an unchanged folder neither re-reads nor re-parses it.
+
+Usage:
+  from Shared.task_file import load, parse
+
+  task = load("In_Progress/cloud/EMAIL_x.md")
+  task.field("from")                  # "**From:** ..." value, or ""
+  task.section("brief", "message")    # first of these sections present
+  task.metadata                       # comment + frontmatter (frontmatter wins)
+  task.text                           # raw content
+
+Stdlib only, so it also imports as plain `task_file` with Shared/ on sys.path
+(how Local/ and Gold's LinkedIn handler use it).
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+
+
+# ── Config ────────────────────────────────────────────────────────────────────
+
+CACHE_SIZE = 256    # parsed files kept by load()
+
+# Every token starts a line, so the scan rejects mid-line positions at once
+_TOKENS = re.compile(
+    r"^(?:(?P<head>#+)[ \t]*(?P<htext>[^\n]*?)[ \t]*$"                 # # Title / ## Section
+    r"|[ \t]*(?:<!-- AGENT METADATA\s+(?P<meta>.*?)\s+-->"             # metadata comment
+    r"|(?:[-*][ \t]+)?(?:\*\*(?P<fkey>[^*\n]+?)\*\*(?P<fval>[^\n]*)"   # **Key:** value
+    r"|(?P<vkey>[A-Za-z_][\w-]*)[ \t]*:(?P<vval>[^\n]*))$))",           # key: value
+    re.MULTILINE | re.DOTALL,
+)
+_FRONTMATTER = re.compile(r"\A---[ \t]*\r?\n(.*?)\r?\n---[ \t]*$", re.MULTILINE | re.DOTALL)
+
+
+def _key_values(block: str) -> dict[str, str]:
+    """`key: value` lines of a metadata block, keys as written."""
+    out = {}
+    for line in block.split("\n"):
+        if ":" in line:
+            key, value = line.split(":", 1)
+            out[key.strip()] = value.strip()
+    return out
+
+
+# ── Parsed file ───────────────────────────────────────────────────────────────
+
+class TaskFile:
+    """Lazily parsed view of one task file's text."""
+
+    def __init__(self, text: str, path: str | None = None):
+        self.text   = text
+        self.path   = path
+        self._title: str | None = None
+        self._fields: dict[str, str] | None = None
+        self._values: dict[str, str] = {}
+        self._comment: dict[str, str] = {}
+        self._sections: dict[str, str] = {}
+        self._frontmatter: dict[str, str] | None = None
+
+    def _parse(self) -> None:
+        text       = self.text
+        fields     = {}
+        values     = self._values
+        open_title = None      # section whose body starts at open_start
+        open_start = 0
+
+        for m in _TOKENS.finditer(text):
+            kind = m.lastgroup
+            if kind == "htext":
+                if len(m.group("head")) == 1:
+                    # "# Title" — but not a "#hashtag" line
+                    if self._title is None and m.group(0)[1:2] in (" ", "\t"):
+                        self._title = m.group("htext").strip()
+                    continue
+                if open_title is not None:
+                    self._sections.setdefault(open_title, text[open_start:m.start()].strip())
+                open_title = m.group("htext").lstrip("#").strip().lower()
+                open_start = m.end()
+            elif kind == "meta":
+                if not self._comment:
+                    self._comment = _key_values(m.group("meta"))
+            elif kind == "fval":
+                key = m.group("fkey").strip().rstrip(":").strip().lower()
+                fields.setdefault(key, m.group("fval").lstrip(":").strip())
+            else:
+                values.setdefault(m.group("vkey").lower(), m.group("vval").strip())
+
+        if open_title is not None:
+            self._sections.setdefault(open_title, text[open_start:].strip())
+        self._fields = fields
+
+    def _ensure(self) -> None:
+        if self._fields is None:
+            self._parse()
+
+    # ── Accessors ─────────────────────────────────────────────────────────────
+
+    @property
+    def title(self) -> str:
+        self._ensure()
+        return self._title or ""
+
+    @property
+    def fields(self) -> dict[str, str]:
+        self._ensure()
+        return self._fields
+
+    @property
+    def values(self) -> dict[str, str]:
+        self._ensure()
+        return self._values
+
+    @property
+    def sections(self) -> dict[str, str]:
+        self._ensure()
+        return self._sections
+
+    @property
+    def comment(self) -> dict[str, str]:
+        self._ensure()
+        return self._comment
+
+    @property
+    def frontmatter(self) -> dict[str, str]:
+        if self._frontmatter is None:
+            m = _FRONTMATTER.match(self.text)
+            self._frontmatter = _key_values(m.group(1)) if m else {}
+        return self._frontmatter
+
+    @property
+    def metadata(self) -> dict[str, str]:
+        """AGENT METADATA comment, overridden by frontmatter keys."""
+        return {**self.comment, **self.frontmatter}
+
+    def field(self, *names: str, default: str = "") -> str:
+        """First `**Name:**` value present among names."""
+        for name in names:
+            value = self.fields.get(name.lower())
+            if value is not None:
+                return value
+        return default
+
+    def value(self, *names: str, default: str = "") -> str:
+        """First bare `name: value` line present among names."""
+        for name in names:
+            value = self.values.get(name.lower())
+            if value is not None:
+                return value
+        return default
+
+    def section(self, *titles: str, default: str = "") -> str:
+        """Body of the first `## Title` section present among titles."""
+        for title in titles:
+            body = self.sections.get(title.lower())
+            if body is not None:
+                return body
+        return default
+
+
+def parse(content: "str | TaskFile") -> TaskFile:
+    """TaskFile for raw text (an already parsed TaskFile is returned as is)."""
+    return content if isinstance(content, TaskFile) else TaskFile(content)
+
+
+# ── Cache ─────────────────────────────────────────────────────────────────────
+
+_cache: "OrderedDict[str, tuple[int, int, TaskFile]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load(path: "str | os.PathLike") -> TaskFile:
+    """Read and parse a task file, reusing the last result while (mtime, size) match."""
+    key = os.path.abspath(path)
+    st  = os.stat(key)
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+            _cache.move_to_end(key)
+            return hit[2]
+
+    # Stat before read: if the file changes in between, the next load()
+    # sees a newer mtime and parses again — never the other way round
+    with open(key, "r", encoding="utf-8") as f:
+        task = TaskFile(f.read(), key)
+    with _cache_lock:
+        _cache[key] = (st.st_mtime_ns, st.st_size, task)
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return task
+
+
+def forget(path: "str | os.PathLike") -> None:
+    """Drop a cached entry (after moving or deleting the file)."""
+    with _cache_lock:
+        _cache.pop(os.path.abspath(path), None)
@@ -0,0 +1,193 @@
+"""
+worker_pool.py — Bounded Worker Pool (Platinum Tier)
+----------------------------------------------------
+Runs watcher items concurrently so one slow item (Gmail call, drafter
+subprocess) no longer stalls everything queued behind it.
+
+  - thread or process executor, fixed number of workers
+  - max_pending  : backpressure — caller stops polling while full
+  - item_timeout : per-item deadline (seconds from when a worker starts it)
+  - ordered      : hand results back in submission order
+  - drain()      : graceful shutdown, waits for in-flight items
+
+Usage:
+  from Shared.worker_pool import WorkerPool
+
+  pool = WorkerPool(workers=4, item_timeout=120)
+  pool.submit(handle, item, key=item["id"])
+  for item, exc in pool.reap():
+      ...
+  pool.drain(timeout=30)
+
+Note: Python cannot kill a running thread. A timed-out item is reported
+once, then kept as "abandoned": it holds its key and pending slot until
+its thread actually returns, so it cannot be resubmitted meanwhile.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    wait,
+    FIRST_COMPLETED,
+)
+from typing import Any, Callable, Hashable
+
+
+POOL_KINDS = ("thread", "process")
+
+
+class _Job:
+    __slots__ = ("item", "key", "future", "started")
+
+    def __init__(self, item: Any, key: Hashable | None):
+        self.item    = item
+        self.key     = key
+        self.future: Future | None = None
+        self.started: float | None = None   # monotonic time a worker picked it up
+
+
+class WorkerPool:
+    """Bounded executor with backpressure, deadlines and optional ordering."""
+
+    def __init__(
+        self,
+        workers: int,
+        kind: str = "thread",
+        max_pending: int | None = None,
+        item_timeout: float | None = None,
+        ordered: bool = False,
+    ):
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Unknown pool kind '{kind}' — use one of {POOL_KINDS}")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+
+        self.workers      = workers
+        self.kind         = kind
+        self.max_pending  = max_pending or workers * 2
+        self.item_timeout = item_timeout
+        self.ordered      = ordered
+
+        executor_cls   = ThreadPoolExecutor if kind == "thread" else ProcessPoolExecutor
+        self._executor = executor_cls(max_workers=workers)
+        self._jobs: deque[_Job] = deque()
+        self._abandoned: list[_Job] = []    # timed out, still running
+        self._keys: set = set()
+
+    # ── Submission ────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._jobs) + len(self._abandoned)
+
+    def has_capacity(self) -> bool:
+        return len(self) < self.max_pending
+
+    def is_pending(self, key: Hashable | None) -> bool:
+        return key is not None and key in self._keys
+
+    def submit(self, fn: Callable[[Any], Any], item: Any, key: Hashable | None = None) -> None:
+        job = _Job(item, key)
+        if self.kind == "thread":
+            def call(item: Any) -> Any:
+                job.started = time.monotonic()
+                return fn(item)
+            job.future = self._executor.submit(call, item)
+        else:
+            # Closures don't pickle; reap() stamps the start once a worker is free for it
+            job.future = self._executor.submit(fn, item)
+        self._jobs.append(job)
+        if key is not None:
+            self._keys.add(key)
+
+    def _deadline(self, job: _Job) -> float | None:
+        if self.item_timeout is None or job.started is None:
+            return None
+        return job.started + self.item_timeout
+
+    # ── Completion ────────────────────────────────────────────────────────────
+
+    def _finish(self, job: _Job, exc: BaseException | None) -> tuple[Any, BaseException | None]:
+        self._jobs.remove(job)
+        if job.future.done() or job.future.cancel():
+            self._keys.discard(job.key)
+        else:
+            self._abandoned.append(job)       # keeps key + slot until it returns
+        return job.item, exc
+
+    def _stamp_started(self, now: float) -> None:
+        """Process pools queue calls ahead, so running() can't be trusted: FIFO slot count."""
+        busy = len(self._abandoned)
+        for job in self._jobs:
+            if job.future.done():
+                continue
+            if job.started is None and busy < self.workers:
+                job.started = now
+            busy += 1
+
+    def _release_abandoned(self) -> None:
+        for job in [j for j in self._abandoned if j.future.done()]:
+            self._abandoned.remove(job)
+            self._keys.discard(job.key)
+
+    def _outcome(self, job: _Job, now: float) -> tuple[bool, BaseException | None]:
+        """Return (finished, exc) for one job without blocking."""
+        if job.future.done():
+            if job.future.cancelled():
+                return True, TimeoutError("cancelled before start")
+            return True, job.future.exception()
+        deadline = self._deadline(job)
+        if deadline is not None and now >= deadline:
+            return True, TimeoutError(f"item timed out after {self.item_timeout}s")
+        return False, None
+
+    def reap(self) -> list[tuple[Any, BaseException | None]]:
+        """
+        Collect finished items as (item, exc) — exc is None on success.
+        In ordered mode, stops at the first item still running.
+        """
+        self._release_abandoned()
+        now  = time.monotonic()
+        if self.kind == "process":
+            self._stamp_started(now)
+        done = []
+        for job in list(self._jobs):
+            finished, exc = self._outcome(job, now)
+            if not finished:
+                if self.ordered:
+                    break
+                continue
+            done.append(self._finish(job, exc))
+        return done
+
+    def wait_any(self, timeout: float) -> bool:
+        """Block until at least one job finishes, a deadline passes, or timeout (False)."""
+        jobs = list(self._jobs) + self._abandoned
+        if not jobs:
+            time.sleep(timeout)
+            return False
+        deadlines = [d for d in map(self._deadline, self._jobs) if d is not None]
+        if deadlines:
+            timeout = max(0.0, min(timeout, min(deadlines) - time.monotonic()))
+        done, _ = wait([j.future for j in jobs], timeout=timeout, return_when=FIRST_COMPLETED)
+        return bool(done) or bool(deadlines) and min(deadlines) <= time.monotonic()
+
+    # ── Shutdown ──────────────────────────────────────────────────────────────
+
+    def drain(self, timeout: float = 30.0) -> list[tuple[Any, BaseException | None]]:
+        """Wait up to timeout for in-flight items, then shut the executor down."""
+        end     = time.monotonic() + timeout
+        results = []
+        while self._jobs and time.monotonic() < end:
+            self.wait_any(max(0.0, end - time.monotonic()))
+            results.extend(self.reap())
+
+        for job in list(self._jobs):
+            results.append(self._finish(job, TimeoutError("not finished before shutdown")))
+        self._abandoned.clear()
+        self._keys.clear()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        return results
@@ -26,6 +26,10 @@ class BaseWatcher(ABC):
         """Create .md file in Needs_Action/cloud folder"""
         pass
 
+    def on_cycle_end(self):
+        """Called once every item of a check was handled (skipped on error)"""
+        pass
+
     def run(self):
         self.logger.info(f'Starting {self.__class__.__name__} (interval: {self.check_interval}s)')
         while True:
@@ -34,6 +38,7 @@ class BaseWatcher(ABC):
                 for item in items:
                     path = self.create_action_file(item)
                     self.logger.info(f'Created: {path.name}')
+                self.on_cycle_end()
             except Exception as e:
                 self.logger.error(f'Error: {e}')
             time.sleep(self.check_interval)
@@ -2,11 +2,15 @@
 Gmail Watcher — Cloud Agent
 Monitors Gmail for unread/important emails.
 Writes each email as a .md file into Vault/Needs_Action/cloud/
+
+GMAIL_SYNC_MODE=history (default) only asks users.history.list for
+messages added since the saved historyId; GMAIL_SYNC_MODE=full re-runs
+the unread/important query every check. The new historyId is saved only
+after every email of the check became a task file.
 """
 
 import os
 import base64
-import json
 from pathlib import Path
 from datetime import datetime
 
@@ -14,14 +18,22 @@ from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 
 from base_watcher import BaseWatcher
+from processed_store import ProcessedIdStore
 
 # Only read access needed — we never send from Cloud
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly',
           'https://www.googleapis.com/auth/gmail.modify']
 
-PROCESSED_IDS_FILE = Path(__file__).parent / '.processed_ids.json'
+PROCESSED_IDS_FILE = Path(__file__).parent / '.processed_ids.json'  # legacy, migrated once
+PROCESSED_DB_FILE  = Path(__file__).parent / '.processed_ids.db'
+PROCESSED_TTL_DAYS = 90  # forget ids after this long (Gmail won't resurface them)
+HISTORY_ID_FILE    = Path(__file__).parent / '.history_id'
+
+SYNC_MODE         = os.getenv('GMAIL_SYNC_MODE', 'history')  # history | full
+FULL_RESYNC_EVERY = 30  # checks — safety net for anything history missed
 
 
 class GmailWatcher(BaseWatcher):
@@ -30,7 +42,12 @@ class GmailWatcher(BaseWatcher):
         self.credentials_path = Path(credentials_path)
         self.token_path = self.credentials_path.parent / 'token.json'
         self.service = self._authenticate()
-        self.processed_ids = self._load_processed_ids()
+        self.processed_ids = ProcessedIdStore(PROCESSED_DB_FILE,
+                                              ttl_days=PROCESSED_TTL_DAYS,
+                                              legacy_json=PROCESSED_IDS_FILE)
+        self.history_id = self._load_history_id()
+        self.pending_history_id = None  # saved once this check's emails are handled
+        self.checks_since_resync = 0
 
     # ------------------------------------------------------------------ auth
     def _authenticate(self):
@@ -51,24 +68,75 @@ class GmailWatcher(BaseWatcher):
 
         return build('gmail', 'v1', credentials=creds)
 
-    # ------------------------------------------------- processed IDs (cache)
-    def _load_processed_ids(self) -> set:
-        if PROCESSED_IDS_FILE.exists():
-            return set(json.loads(PROCESSED_IDS_FILE.read_text()))
-        return set()
-
-    def _save_processed_ids(self):
-        PROCESSED_IDS_FILE.write_text(json.dumps(list(self.processed_ids)))
+    # ------------------------------------------- history ID (sync checkpoint)
+    def _load_history_id(self):
+        if HISTORY_ID_FILE.exists():
+            return HISTORY_ID_FILE.read_text().strip() or None
+        return None
+
+    def _save_history_id(self, history_id: str):
+        self.history_id = str(history_id)
+        HISTORY_ID_FILE.write_text(self.history_id)
+
+    def _full_sync(self) -> list:
+        # Checkpoint first so mail arriving during the list is not skipped
+        profile = self.service.users().getProfile(userId='me').execute()
+        messages, page_token = [], None
+        while True:
+            kwargs = {'userId': 'me', 'q': 'is:unread is:important'}
+            if page_token:
+                kwargs['pageToken'] = page_token
+            results = self.service.users().messages().list(**kwargs).execute()
+            messages.extend(results.get('messages', []))
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+        self.pending_history_id = profile['historyId']
+        self.checks_since_resync = 0
+        return messages
+
+    def _incremental_sync(self) -> list:
+        messages, page_token = [], None
+        while True:
+            kwargs = {'userId': 'me', 'startHistoryId': self.history_id,
+                      'historyTypes': ['messageAdded']}
+            if page_token:
+                kwargs['pageToken'] = page_token
+            results = self.service.users().history().list(**kwargs).execute()
+            for record in results.get('history', []):
+                for added in record.get('messagesAdded', []):
+                    labels = added['message'].get('labelIds', [])
+                    if 'UNREAD' in labels and 'IMPORTANT' in labels:
+                        messages.append(added['message'])
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+        self.pending_history_id = results.get('historyId', self.history_id)
+        return messages
+
+    def _list_candidates(self) -> list:
+        self.pending_history_id = None
+        if SYNC_MODE != 'history':
+            return self.service.users().messages().list(
+                userId='me',
+                q='is:unread is:important',
+                maxResults=10
+            ).execute().get('messages', [])
+
+        self.checks_since_resync += 1
+        if not self.history_id or self.checks_since_resync >= FULL_RESYNC_EVERY:
+            return self._full_sync()
+        try:
+            return self._incremental_sync()
+        except HttpError as e:
+            if e.resp.status != 404:
+                raise
+            self.logger.info('History ID expired, running full resync')
+            return self._full_sync()
 
     # ----------------------------------------------- BaseWatcher interface
     def check_for_updates(self) -> list:
-        results = self.service.users().messages().list(
-            userId='me',
-            q='is:unread is:important',
-            maxResults=10
-        ).execute()
-
-        messages = results.get('messages', [])
+        messages = self._list_candidates()
         new = [m for m in messages if m['id'] not in self.processed_ids]
         self.logger.info(f'Found {len(new)} new important emails')
         return new
@@ -122,12 +190,17 @@ agent_owner: cloud
 """
         filepath.write_text(content, encoding='utf-8')
 
-        # Mark as processed so we don't re-create
+        # Mark as processed so we don't re-create (one row insert, not a file rewrite)
         self.processed_ids.add(message['id'])
-        self._save_processed_ids()
 
         return filepath
 
+    def on_cycle_end(self):
+        # Advance checkpoint only after every message was handled
+        if self.pending_history_id and str(self.pending_history_id) != self.history_id:
+            self._save_history_id(self.pending_history_id)
+        self.pending_history_id = None
+
 
 # ------------------------------------------------------------------ entrypoint
 if __name__ == '__main__':
@@ -0,0 +1,116 @@
+"""
+Processed-ID Store — Cloud Agent
+Remembers which Gmail message ids were already turned into action files.
+
+SQLite table (one row insert per message, no full-file rewrites) with
+time-based expiry, fronted by an in-memory Bloom filter so the common
+"never seen this id" check never touches disk.
+"""
+
+import hashlib
+import json
+import math
+import sqlite3
+import time
+from pathlib import Path
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class ProcessedIdStore:
+    """Set-like store of processed message ids: `id in store`, `store.add(id)`."""
+
+    PRUNE_EVERY = 500  # adds between expiry sweeps
+
+    def __init__(self, db_path: Path, ttl_days: int = 90, capacity: int = 50_000,
+                 legacy_json: Path | None = None):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_days * 86400
+        self.capacity = capacity
+        self.adds_since_prune = 0
+
+        self.db = sqlite3.connect(str(self.db_path))
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS processed ('
+            '  id TEXT PRIMARY KEY,'
+            '  seen_at REAL NOT NULL)'
+        )
+        self.db.execute('CREATE INDEX IF NOT EXISTS processed_seen ON processed(seen_at)')
+        self.db.commit()
+
+        if legacy_json is not None:
+            self._migrate_json(Path(legacy_json))
+
+        self.prune()
+
+    # ------------------------------------------------------------ migration
+    def _migrate_json(self, legacy_json: Path):
+        """Import the old .processed_ids.json once, then set it aside."""
+        if not legacy_json.exists():
+            return
+        ids = json.loads(legacy_json.read_text() or '[]')
+        now = time.time()
+        self.db.executemany('INSERT OR IGNORE INTO processed (id, seen_at) VALUES (?, ?)',
+                            [(i, now) for i in ids])
+        self.db.commit()
+        legacy_json.rename(legacy_json.with_suffix('.json.migrated'))
+
+    # ------------------------------------------------------------ set API
+    def __contains__(self, msg_id: str) -> bool:
+        if msg_id not in self.bloom:
+            return False
+        row = self.db.execute('SELECT 1 FROM processed WHERE id = ?', (msg_id,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.db.execute('SELECT COUNT(*) FROM processed').fetchone()[0]
+
+    def add(self, msg_id: str):
+        self.db.execute('INSERT OR REPLACE INTO processed (id, seen_at) VALUES (?, ?)',
+                        (msg_id, time.time()))
+        self.db.commit()
+        self.bloom.add(msg_id)
+
+        self.adds_since_prune += 1
+        if self.adds_since_prune >= self.PRUNE_EVERY:
+            self.prune()
+
+    # ------------------------------------------------------------ expiry
+    def prune(self):
+        """Drop ids older than the TTL and rebuild the Bloom filter from what is left."""
+        cutoff = time.time() - self.ttl_seconds
+        self.db.execute('DELETE FROM processed WHERE seen_at < ?', (cutoff,))
+        self.db.commit()
+
+        count = len(self)
+        self.bloom = BloomFilter(max(self.capacity, count * 2))
+        for (msg_id,) in self.db.execute('SELECT id FROM processed'):
+            self.bloom.add(msg_id)
+        self.adds_since_prune = 0
+
+    def close(self):
+        self.db.close()
@@ -16,9 +16,14 @@ Workflow:
 """
 
 import re
+import sys
 from datetime import datetime
 from pathlib import Path
 
+# keyword_matcher — one copy for every tier, in Platinum/Shared
+sys.path.append(str(Path(__file__).resolve().parents[2] / "Platinum" / "Shared"))
+from keyword_matcher import KeywordMatcher
+
 # ---------------------------------------------------------------------------
 # Vault paths
 # ---------------------------------------------------------------------------
@@ -38,6 +43,7 @@ DASHBOARD         = VAULT_ROOT / "Dashboard.md"
 HIGH_RISK   = ["delete", "deploy", "production", "billing", "payment", "cloud",
                "remove", "drop", "truncate", "shutdown", "terminate"]
 MEDIUM_RISK = ["update", "modify", "push", "send", "email", "upload", "change"]
+RISK_MATCHER = KeywordMatcher({"high": HIGH_RISK, "medium": MEDIUM_RISK})
 
 
 # ---------------------------------------------------------------------------
@@ -63,12 +69,7 @@ def _count_md(folder: Path) -> int:
 
 
 def _classify_risk(content: str) -> str:
-    lower = content.lower()
-    if any(kw in lower for kw in HIGH_RISK):
-        return "high"
-    if any(kw in lower for kw in MEDIUM_RISK):
-        return "medium"
-    return "low"
+    return RISK_MATCHER.first(content, "low")
 
 
 def _get_retry_count(content: str) -> int:
@@ -9,6 +9,7 @@ Skill: Scan Inbox (Bronze) + Task Classification (Silver)
 """
 
 import os
+import sys
 import time
 import shutil
 from datetime import datetime
@@ -19,21 +20,21 @@ INBOX_DIR    = os.path.join(BASE_DIR, "Inbox")
 ACTION_DIR   = os.path.join(BASE_DIR, "Needs_Action")
 POLL_SECONDS = 5          # how often to check Inbox
 
+# keyword_matcher — one copy for every tier, in Platinum/Shared
+sys.path.append(os.path.join(os.path.dirname(BASE_DIR), "Platinum", "Shared"))
+from keyword_matcher import KeywordMatcher
+
 # Keywords used to auto-classify risk level
 HIGH_RISK_KEYWORDS   = ["delete", "deploy", "production", "billing", "payment", "cloud"]
 MEDIUM_RISK_KEYWORDS = ["update", "modify", "push", "send", "email"]
+RISK_MATCHER         = KeywordMatcher({"high": HIGH_RISK_KEYWORDS, "medium": MEDIUM_RISK_KEYWORDS})
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 def classify_risk(content: str) -> str:
     """Return 'high', 'medium', or 'low' based on task content."""
-    lower = content.lower()
-    if any(kw in lower for kw in HIGH_RISK_KEYWORDS):
-        return "high"
-    if any(kw in lower for kw in MEDIUM_RISK_KEYWORDS):
-        return "medium"
-    return "low"
+    return RISK_MATCHER.first(content, "low")
 
 
 def needs_approval(content: str, risk: str) -> bool:
@@ -16,6 +16,14 @@ Setup:
   2. Download credentials.json → place next to this file
   3. On first run, browser will open for OAuth consent
   4. Token is saved to token.json for subsequent runs
+
+Sync modes (GMAIL_SYNC_MODE env var):
+  history (default) — after the first full query, only asks Gmail for
+                      messages added/labelled since the saved historyId
+                      (users.history.list). Expired id -> full resync.
+                      The label comes from GMAIL_QUERY, which must be
+                      'is:unread label:<name>'; other queries use full.
+  full              — re-run GMAIL_QUERY on every poll (old behaviour)
 """
 
 import os
@@ -49,6 +57,10 @@ GMAIL_SCOPES   = ["https://www.googleapis.com/auth/gmail.modify"]
 GMAIL_QUERY    = "is:unread label:ai-tasks"   # change to your label/query
 POLL_SECONDS   = 60                            # check every 60 seconds
 
+HISTORY_FILE      = os.path.join(WATCHER_DIR, ".history_id")   # sync checkpoint
+SYNC_MODE         = os.environ.get("GMAIL_SYNC_MODE", "history")
+FULL_RESYNC_EVERY = 30                         # polls — safety net for missed history
+
 
 # ── Auth ──────────────────────────────────────────────────────────────────────
 
@@ -119,6 +131,89 @@ Auto-generated from Gmail. Original subject: "{subject}"
     return safe_filename(subject), content
 
 
+# ── Incremental sync (history API) ────────────────────────────────────────────
+
+def load_history_id() -> str | None:
+    if os.path.exists(HISTORY_FILE):
+        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+            return f.read().strip() or None
+    return None
+
+
+def save_history_id(history_id: str) -> None:
+    # Temp file + rename: a crash mid-write never leaves a truncated id
+    tmp = HISTORY_FILE + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(str(history_id))
+    os.replace(tmp, HISTORY_FILE)
+
+
+def query_label(query: str) -> str | None:
+    """
+    The label history mode filters on, read from GMAIL_QUERY. Only a plain
+    'is:unread label:<name>' query can be mirrored by history filtering;
+    anything else returns None and the watcher falls back to full sync.
+    """
+    terms  = query.split()
+    labels = [t[len("label:"):] for t in terms if t.startswith("label:")]
+    rest   = [t for t in terms if t != "is:unread" and not t.startswith("label:")]
+    if "is:unread" in terms and len(labels) == 1 and not rest:
+        return labels[0]
+    return None
+
+
+def resolve_label_id(service, name: str) -> str | None:
+    """Gmail history filters by label id, not the label name in GMAIL_QUERY."""
+    labels = service.users().labels().list(userId="me").execute().get("labels", [])
+    for label in labels:
+        if label["name"].lower() == name.lower():
+            return label["id"]
+    return None
+
+
+def full_sync(service) -> tuple[list[str], str]:
+    """Run GMAIL_QUERY (every page); return (message ids, history id to resume from)."""
+    history_id = service.users().getProfile(userId="me").execute()["historyId"]
+    ids, page_token = [], None
+    while True:
+        kwargs = {"userId": "me", "q": GMAIL_QUERY}
+        if page_token:
+            kwargs["pageToken"] = page_token
+        results = service.users().messages().list(**kwargs).execute()
+        ids.extend(m["id"] for m in results.get("messages", []))
+        # Stopping at page 1 would move the checkpoint past the rest
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            return ids, str(history_id)
+
+
+def incremental_sync(service, start_id: str, label_id: str) -> tuple[list[str], str]:
+    """Return ids of unread messages that arrived with / received label_id since start_id."""
+    ids, page_token, latest = [], None, start_id
+    while True:
+        kwargs = {
+            "userId":         "me",
+            "startHistoryId": start_id,
+            "historyTypes":   ["messageAdded", "labelAdded"],
+        }
+        if page_token:
+            kwargs["pageToken"] = page_token
+        results = service.users().history().list(**kwargs).execute()
+
+        for record in results.get("history", []):
+            changed = record.get("messagesAdded", []) + record.get("labelsAdded", [])
+            for entry in changed:
+                msg    = entry["message"]
+                labels = msg.get("labelIds", [])
+                if "UNREAD" in labels and label_id in labels and msg["id"] not in ids:
+                    ids.append(msg["id"])
+
+        latest     = str(results.get("historyId", latest))
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            return ids, latest
+
+
 # ── Main loop ─────────────────────────────────────────────────────────────────
 
 def mark_read(service, msg_id: str) -> None:
@@ -143,15 +238,38 @@ def watch() -> None:
     service = get_gmail_service()
     os.makedirs(INBOX_DIR, exist_ok=True)
 
+    incremental = SYNC_MODE == "history"
+    label_name  = query_label(GMAIL_QUERY)
+    if incremental and label_name is None:
+        print("[gmail_watcher] GMAIL_QUERY is not 'is:unread label:<name>' — using full sync")
+        incremental = False
+    label_id    = resolve_label_id(service, label_name) if incremental else None
+    if incremental and label_id is None:
+        print(f"[gmail_watcher] Label '{label_name}' not found — using full sync")
+        incremental = False
+
+    history_id = load_history_id() if incremental else None
+    polls      = 0
+
     while True:
         try:
-            results  = service.users().messages().list(
-                userId="me", q=GMAIL_QUERY
-            ).execute()
-            messages = results.get("messages", [])
-
-            for msg_ref in messages:
-                msg_id   = msg_ref["id"]
+            new_history = None
+            polls      += 1
+            if not incremental:
+                results = service.users().messages().list(userId="me", q=GMAIL_QUERY).execute()
+                msg_ids = [m["id"] for m in results.get("messages", [])]
+            elif history_id is None or polls % FULL_RESYNC_EVERY == 0:
+                msg_ids, new_history = full_sync(service)
+            else:
+                try:
+                    msg_ids, new_history = incremental_sync(service, history_id, label_id)
+                except Exception as exc:
+                    if getattr(getattr(exc, "resp", None), "status", None) != 404:
+                        raise
+                    print("[gmail_watcher] historyId expired — full resync")
+                    msg_ids, new_history = full_sync(service)
+
+            for msg_id in msg_ids:
                 msg_data = service.users().messages().get(
                     userId="me", id=msg_id, format="full"
                 ).execute()
@@ -165,6 +283,11 @@ def watch() -> None:
                 mark_read(service, msg_id)
                 print(f"[{datetime.now():%H:%M:%S}] EMAIL→TASK  {filename}")
 
+            # Advance checkpoint only after every message was handled
+            if new_history:
+                save_history_id(new_history)
+                history_id = new_history
+
         except Exception as exc:
             print(f"[gmail_watcher] ERROR: {exc}")
 